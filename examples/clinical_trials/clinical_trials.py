@@ -13,6 +13,7 @@ Run:
   python examples/clinical_trials/clinical_trials.py studies --q-term "AREA[LastUpdatePostDate]RANGE[2024-01-01,MAX]" --limit 3
   python examples/clinical_trials/clinical_trials.py study --nct-id NCT03888612
   python examples/clinical_trials/clinical_trials.py metadata
+  python examples/clinical_trials/clinical_trials.py --raw-json enums | jq .
   python examples/clinical_trials/clinical_trials.py enums
   python examples/clinical_trials/clinical_trials.py size
   python examples/clinical_trials/clinical_trials.py search-areas
@@ -23,71 +24,86 @@ Run:
 from __future__ import annotations
 
 import argparse
+import json
+import sys
+from functools import cache
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich import box
-
-from ind.clinical_trials import (
-    ClinicalTrialsClient,
-    ClinicalTrialsError,
-    list_studies,
-    iterate_studies,
-    get_study,
-    get_studies_metadata,
-    get_search_areas,
-    get_enums,
-    get_study_sizes,
-    get_field_values,
-    get_field_sizes,
-)
+
+try:  # optional: fast JSON output for piped/raw runs
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 console = Console()
+# Headers and status lines go to stderr, so piped stdout carries only the data.
+err_console = Console(stderr=True)
+
+# Shared stand-in for a missing `studies` list, so misses don't allocate.
+_EMPTY: tuple = ()
 
 # ------------------------------- helpers ------------------------------------
 
 
-def pretty_json(obj: Any) -> None:
-    console.print_json(data=obj)
+def pretty_json(obj: Any, raw: bool = False) -> None:
+    # Rich re-tokenizes and highlights the whole document; skip that when the
+    # output is piped (or --raw-json is given) and just write indented JSON.
+    if not raw and console.is_terminal:
+        console.print_json(data=obj)
+        return
+    sys.stdout.flush()
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        sys.stdout.buffer.write((json.dumps(obj, indent=2) + "\n").encode())
+    sys.stdout.flush()
+
+
+def write_raw_json(body: bytes) -> None:
+    # Server bytes go straight to stdout; no decode/re-encode round-trip.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(body if body.endswith(b"\n") else body + b"\n")
+    sys.stdout.flush()
 
 
 def pluck_nct_id(study: Dict[str, Any]) -> Optional[str]:
+    # Direct indexing is the fast path (nearly every study has an NCT id);
+    # same path as ind.clinical_trials.types.NCT_ID_PATH. Only a missing key
+    # or a non-dict step falls through to None.
     try:
         return study["protocolSection"]["identificationModule"]["nctId"]
-    except Exception:
+    except (KeyError, TypeError):
         return None
 
 
 def render_studies_table(studies: List[Dict[str, Any]], max_rows: int = 5) -> None:
+    from ind.clinical_trials import summarize_studies
+
+    # Only the previewed studies are converted to typed records.
+    rows = [
+        (r.nct_id or "-", r.brief_title or "-", r.overall_status or "-")
+        for r in summarize_studies(islice(studies, max(0, max_rows)))
+    ]
+
+    # Piped output: tab-separated rows are cheaper than a Rich table and
+    # easier to consume with cut/awk.
+    if not console.is_terminal:
+        sys.stdout.write("".join(f"{nct}\t{title}\t{status}\n" for nct, title, status in rows))
+        sys.stdout.flush()
+        return
+
+    from rich.table import Table
+    from rich import box
+
     table = Table(title="Studies (preview)", box=box.SIMPLE_HEAVY)
     table.add_column("NCTId", no_wrap=True)
     table.add_column("BriefTitle")
     table.add_column("OverallStatus", no_wrap=True)
-
-    count = 0
-    for s in studies:
-        nct = pluck_nct_id(s) or "-"
-        # Titles/status fields are nested; try common locations.
-        title = (
-            s.get("protocolSection", {})
-             .get("identificationModule", {})
-             .get("briefTitle")
-            or s.get("briefTitle")
-            or "-"
-        )
-        status = (
-            s.get("protocolSection", {})
-             .get("statusModule", {})
-             .get("overallStatus")
-            or s.get("overallStatus")
-            or "-"
-        )
-        table.add_row(nct, title, status)
-        count += 1
-        if count >= max_rows:
-            break
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -97,6 +113,7 @@ def render_studies_table(studies: List[Dict[str, Any]], max_rows: int = 5) -> No
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="ClinicalTrials.gov demo (ind package)")
+    p.add_argument("--raw-json", action="store_true", help="Print plain JSON (no highlighting), e.g. for piping to jq")
     sub = p.add_subparsers(dest="cmd", required=True)
 
     # studies
@@ -161,145 +178,178 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+@cache
+def _parser() -> argparse.ArgumentParser:
+    """Build the parser once per process; repeated main() calls reuse it."""
+    return build_parser()
+
+
 # --------------------------------- main -------------------------------------
 
 
-def main() -> None:
-    args = build_parser().parse_args()
-    client = ClinicalTrialsClient(
-        timeout=args.__dict__.get("timeout", 20.0),
-        rate_limit_per_sec=args.__dict__.get("rate", 2.0),
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parser().parse_args(argv)
+    # Imported after parsing so `--help` and usage errors skip loading requests & co.
+    from ind.clinical_trials import (
+        ClinicalTrialsClient,
+        ClinicalTrialsError,
+        list_studies,
+        iterate_studies,
+        get_study,
+        get_study_raw,
+        get_studies_metadata,
+        get_search_areas,
+        get_enums,
+        get_study_sizes,
+        get_study_sizes_raw,
+        get_field_values,
+        get_field_sizes,
     )
 
-    try:
-        if args.cmd == "studies":
-            # decide single page vs pagination
-            if args.paginate:
-                pages = iterate_studies(
-                    client,
-                    query_cond=args.q_cond,
-                    query_term=args.q_term,
-                    query_locn=args.q_locn,
-                    query_titles=args.q_titles,
-                    query_intr=args.q_intr,
-                    query_outc=args.q_outc,
-                    query_spons=args.q_spons,
-                    query_lead=args.q_lead,
-                    query_id=args.q_id,
-                    query_patient=args.q_patient,
-                    filter_overall_status=args.filter_overall_status,
-                    filter_geo=args.filter_geo,
-                    filter_ids=args.filter_ids,
-                    filter_advanced=args.filter_advanced,
-                    fields=args.fields,
-                    sort=args.sort,
-                    first_page_size=args.first_page_size,
-                    next_page_size=args.next_page_size,
-                    max_pages=args.max_pages,
-                    include_total_on_first_page=args.count_total,
+    # Commands that only re-emit the server's JSON can skip parsing it.
+    raw_out = args.raw_json or not console.is_terminal
+
+    with ClinicalTrialsClient(
+        timeout=getattr(args, "timeout", 20.0),
+        rate_limit_per_sec=getattr(args, "rate", 2.0),
+    ) as client:
+        try:
+            if args.cmd == "studies":
+                # decide single page vs pagination
+                if args.paginate:
+                    pages = iterate_studies(
+                        client,
+                        query_cond=args.q_cond,
+                        query_term=args.q_term,
+                        query_locn=args.q_locn,
+                        query_titles=args.q_titles,
+                        query_intr=args.q_intr,
+                        query_outc=args.q_outc,
+                        query_spons=args.q_spons,
+                        query_lead=args.q_lead,
+                        query_id=args.q_id,
+                        query_patient=args.q_patient,
+                        filter_overall_status=args.filter_overall_status,
+                        filter_geo=args.filter_geo,
+                        filter_ids=args.filter_ids,
+                        filter_advanced=args.filter_advanced,
+                        fields=args.fields,
+                        sort=args.sort,
+                        first_page_size=args.first_page_size,
+                        next_page_size=args.next_page_size,
+                        max_pages=args.max_pages,
+                        include_total_on_first_page=args.count_total,
+                    )
+                    total = 0
+                    for p in pages:
+                        page_studies = p.get("studies")
+                        if page_studies:
+                            total += len(page_studies)
+                    first_studies = pages[0].get("studies") if pages else None
+                    header = f"Fetched {len(pages)} page(s), {total} studies total across pages."
+                    err_console.print(Panel.fit(header, style="bold cyan"))
+                    if first_studies:
+                        render_studies_table(first_studies, max_rows=args.limit)
+                    else:
+                        err_console.print("[yellow]No studies returned.[/yellow]")
+                else:
+                    res = list_studies(
+                        client,
+                        query_cond=args.q_cond,
+                        query_term=args.q_term,
+                        query_locn=args.q_locn,
+                        query_titles=args.q_titles,
+                        query_intr=args.q_intr,
+                        query_outc=args.q_outc,
+                        query_spons=args.q_spons,
+                        query_lead=args.q_lead,
+                        query_id=args.q_id,
+                        query_patient=args.q_patient,
+                        filter_overall_status=args.filter_overall_status,
+                        filter_geo=args.filter_geo,
+                        filter_ids=args.filter_ids,
+                        filter_advanced=args.filter_advanced,
+                        fields=args.fields,
+                        sort=args.sort,
+                        count_total=args.count_total,
+                        page_size=args.first_page_size,
+                    )
+                    studies = res.get("studies") or _EMPTY
+                    total_count = res.get("totalCount", None)
+                    header = f"Found {total_count if total_count is not None else len(studies)} studies (showing up to {args.limit})"
+                    err_console.print(Panel.fit(header, style="bold cyan"))
+                    if studies:
+                        render_studies_table(studies, max_rows=args.limit)
+                    else:
+                        err_console.print("[yellow]No studies returned.[/yellow]")
+
+            elif args.cmd == "study":
+                study_kwargs = dict(
+                    format=args.format,
+                    fields=args.fields if args.format == "json" else None,
+                    markup_format=args.markup_format if args.format == "json" else "markdown",
                 )
-                total = sum(len(p.get("studies", [])) for p in pages)
-                header = f"Fetched {len(pages)} page(s), {total} studies total across pages."
-                console.print(Panel.fit(header, style="bold cyan"))
-                if pages and pages[0].get("studies"):
-                    render_studies_table(pages[0]["studies"], max_rows=args.limit)
+                err_console.print(Panel.fit(f"Study: {args.nct_id} ({args.format})", style="bold green"))
+                if raw_out:
+                    write_raw_json(get_study_raw(client, args.nct_id, **study_kwargs))
                 else:
-                    console.print("[yellow]No studies returned.[/yellow]")
-            else:
-                res = list_studies(
+                    pretty_json(get_study(client, args.nct_id, **study_kwargs))
+
+            elif args.cmd == "metadata":
+                res = get_studies_metadata(
                     client,
-                    query_cond=args.q_cond,
-                    query_term=args.q_term,
-                    query_locn=args.q_locn,
-                    query_titles=args.q_titles,
-                    query_intr=args.q_intr,
-                    query_outc=args.q_outc,
-                    query_spons=args.q_spons,
-                    query_lead=args.q_lead,
-                    query_id=args.q_id,
-                    query_patient=args.q_patient,
-                    filter_overall_status=args.filter_overall_status,
-                    filter_geo=args.filter_geo,
-                    filter_ids=args.filter_ids,
-                    filter_advanced=args.filter_advanced,
-                    fields=args.fields,
-                    sort=args.sort,
-                    count_total=args.count_total,
-                    page_size=args.first_page_size,
+                    include_indexed_only=args.indexed_only,
+                    include_historic_only=args.historic_only,
                 )
-                studies = res.get("studies", [])
-                total_count = res.get("totalCount", None)
-                header = f"Found {total_count if total_count is not None else len(studies)} studies (showing up to {args.limit})"
-                console.print(Panel.fit(header, style="bold cyan"))
-                if studies:
-                    render_studies_table(studies, max_rows=args.limit)
+                err_console.print(Panel.fit("Studies Metadata (truncated)", style="bold magenta"))
+                # Show top-level keys only to keep console readable
+                if isinstance(res, dict):
+                    pretty_json({k: res.get(k) for k in list(res.keys())[:6]}, raw=args.raw_json)
                 else:
-                    console.print("[yellow]No studies returned.[/yellow]")
-
-        elif args.cmd == "study":
-            res = get_study(
-                client,
-                args.nct_id,
-                format=args.format,
-                fields=args.fields if args.format == "json" else None,
-                markup_format=args.markup_format if args.format == "json" else "markdown",
-            )
-            console.print(Panel.fit(f"Study: {args.nct_id} ({args.format})", style="bold green"))
-            pretty_json(res)
-
-        elif args.cmd == "metadata":
-            res = get_studies_metadata(
-                client,
-                include_indexed_only=args.indexed_only,
-                include_historic_only=args.historic_only,
-            )
-            console.print(Panel.fit("Studies Metadata (truncated)", style="bold magenta"))
-            # Show top-level keys only to keep console readable
-            if isinstance(res, dict):
-                pretty_json({k: res.get(k) for k in list(res.keys())[:6]})
-            else:
-                pretty_json(res)
+                    pretty_json(res, raw=args.raw_json)
 
-        elif args.cmd == "enums":
-            res = get_enums(client)
-            console.print(Panel.fit("Enums (truncated)", style="bold magenta"))
-            if isinstance(res, dict):
-                pretty_json({k: res.get(k) for k in list(res.keys())[:6]})
-            else:
-                # Many APIs return a list here
-                pretty_json(res[:10] if isinstance(res, list) else res)
-
-        elif args.cmd == "search-areas":
-            res = get_search_areas(client)
-            console.print(Panel.fit("Search Areas", style="bold magenta"))
-            pretty_json(res)
-
-        elif args.cmd == "size":
-            res = get_study_sizes(client)
-            console.print(Panel.fit("Study JSON Sizes", style="bold green"))
-            pretty_json(res)
-
-        elif args.cmd == "field-values":
-            res = get_field_values(client, fields=args.fields, types=args.types)
-            console.print(Panel.fit("Field Values", style="bold green"))
-            if isinstance(res, list) and args.limit:
-                pretty_json(res[: args.limit])
-            else:
-                pretty_json(res)
+            elif args.cmd == "enums":
+                res = get_enums(client)
+                err_console.print(Panel.fit("Enums (truncated)", style="bold magenta"))
+                if isinstance(res, dict):
+                    pretty_json({k: res.get(k) for k in list(res.keys())[:6]}, raw=args.raw_json)
+                else:
+                    # Many APIs return a list here
+                    pretty_json(res[:10] if isinstance(res, list) else res, raw=args.raw_json)
+
+            elif args.cmd == "search-areas":
+                res = get_search_areas(client)
+                err_console.print(Panel.fit("Search Areas", style="bold magenta"))
+                pretty_json(res, raw=args.raw_json)
+
+            elif args.cmd == "size":
+                err_console.print(Panel.fit("Study JSON Sizes", style="bold green"))
+                if raw_out:
+                    write_raw_json(get_study_sizes_raw(client))
+                else:
+                    pretty_json(get_study_sizes(client))
 
-        elif args.cmd == "field-sizes":
-            res = get_field_sizes(client, fields=args.fields)
-            console.print(Panel.fit("Field Sizes", style="bold green"))
-            if isinstance(res, list) and args.limit:
-                pretty_json(res[: args.limit])
-            else:
-                pretty_json(res)
+            elif args.cmd == "field-values":
+                res = get_field_values(client, fields=args.fields, types=args.types)
+                err_console.print(Panel.fit("Field Values", style="bold green"))
+                if isinstance(res, list) and args.limit:
+                    pretty_json(res[: args.limit], raw=args.raw_json)
+                else:
+                    pretty_json(res, raw=args.raw_json)
 
-        else:
-            console.print(f"[red]Unknown command: {args.cmd}[/red]")
+            elif args.cmd == "field-sizes":
+                res = get_field_sizes(client, fields=args.fields)
+                err_console.print(Panel.fit("Field Sizes", style="bold green"))
+                if isinstance(res, list) and args.limit:
+                    pretty_json(res[: args.limit], raw=args.raw_json)
+                else:
+                    pretty_json(res, raw=args.raw_json)
+
+            else:
+                err_console.print(f"[red]Unknown command: {args.cmd}[/red]")
 
-    except ClinicalTrialsError as e:
-        console.print(f"[bold red]ERROR[/bold red] {e}")
+        except ClinicalTrialsError as e:
+            err_console.print(f"[bold red]ERROR[/bold red] {e}")
 
 
 if __name__ == "__main__":
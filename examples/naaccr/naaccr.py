@@ -22,15 +22,6 @@ from typing import Any, Dict, List, Optional
 import argparse
 import sys
 
-from ind.naaccr import (
-    NAACCRClient,
-    list_versions,
-    search_data_items,
-    get_data_item,
-    get_attribute_history,
-    get_operation_history,
-)
-
 try:
     # Pretty output if available (it's in the project deps)
     from rich.console import Console
@@ -42,9 +33,12 @@ except Exception:  # pragma: no cover
     def rprint(*args, **kwargs):  # fallback
         print(*args, **kwargs)
 
+# One console for the whole run; constructing it probes the terminal each time.
+_CONSOLE = Console() if Console else None
+
 
 def _print_versions(versions: List[Dict[str, Any]]) -> None:
-    if Console and Table:
+    if _CONSOLE and Table:
         table = Table(title="NAACCR Versions")
         table.add_column("Version")
         table.add_column("YearImplemented", justify="right")
@@ -55,7 +49,7 @@ def _print_versions(versions: List[Dict[str, Any]]) -> None:
                 str(v.get("YearImplemented", "")),
                 str(v.get("DateOfPublication", "")),
             )
-        Console().print(table)
+        _CONSOLE.print(table)
     else:
         rprint("NAACCR Versions:")
         for v in versions:
@@ -63,12 +57,14 @@ def _print_versions(versions: List[Dict[str, Any]]) -> None:
 
 
 def _print_items(title: str, items: List[Dict[str, Any]], limit: int = 10) -> None:
-    rprint(f"[bold]{title}[/bold] (showing up to {limit}): {len(items)} found")
-    for i, it in enumerate(items[:limit], start=1):
-        rprint(
-            f"{i:>3}. ItemNumber={it.get('ItemNumber')}  "
-            f"ItemName={it.get('ItemName')}  XmlNaaccrId={it.get('XmlNaaccrId')}"
-        )
+    lines = [f"[bold]{title}[/bold] (showing up to {limit}): {len(items)} found"]
+    lines.extend(
+        f"{i:>3}. ItemNumber={it.get('ItemNumber')}  "
+        f"ItemName={it.get('ItemName')}  XmlNaaccrId={it.get('XmlNaaccrId')}"
+        for i, it in enumerate(items[:limit], start=1)
+    )
+    # One render call instead of one per row
+    rprint("\n".join(lines))
 
 
 def _select_id(item: Dict[str, Any]) -> Optional[str]:
@@ -83,79 +79,90 @@ def run(
     minimize: bool,
     pages: int,
     delay: float,
+    concurrency: int = 1,
     item_id: Optional[str],
 ) -> int:
-    client = NAACCRClient()
-
-    # 1) Versions
-    versions = list_versions(client)
-    _print_versions(versions)
-
-    # 2) Search (paged)
-    items = search_data_items(
-        client,
-        naaccr_version,
-        q=query,
-        minimize_results=minimize,
-        pages=pages,
-        delay=delay,
-    )
-    _print_items(
-        title=f"Search results for version={naaccr_version!r}, q={query!r}, minimize={minimize}",
-        items=items,
-        limit=15,
+    # Imported here so `--help` does not pay for requests/urllib3.
+    from ind.naaccr import (
+        NAACCRClient,
+        list_versions,
+        search_data_items,
+        get_data_item,
+        get_attribute_history,
+        get_operation_history,
     )
 
-    if not items and not item_id:
-        rprint("[yellow]No items returned by search and no explicit item id provided. Exiting.[/yellow]")
-        return 0
-
-    # 3) Pick an item (either explicit --item or first search hit) and fetch full record
-    chosen_id = item_id or _select_id(items[0])
-    if not chosen_id:
-        rprint("[red]Could not determine an item identifier (ItemNumber/XmlNaaccrId). Exiting.[/red]")
-        return 1
-
-    rprint(f"\n[bold]Fetching full item[/bold] id={chosen_id!r} (version {naaccr_version}) ...")
-    full = get_data_item(client, naaccr_version, chosen_id)
-    # Print a compact subset
-    summary_keys = [
-        "ItemNumber",
-        "ItemName",
-        "ItemLength",
-        "YearImplemented",
-        "VersionImplemented",
-        "XmlNaaccrId",
-        "Section",
-        "SourceOfStandard",
-    ]
-    rprint({k: full.get(k) for k in summary_keys})
-
-    # 4) Attribute history (Description is usually present across versions)
-    rprint("\n[bold]Attribute history[/bold] (Description):")
-    try:
-        hist = get_attribute_history(client, chosen_id, attribute="Description")
-        for row in hist:
-            rprint(f"  - v{row.get('NaaccrVersion')}: {row.get('Value')}")
-    except Exception as e:
-        rprint(f"[yellow]Attribute history not available: {e}[/yellow]")
-
-    # 5) Operation history for this item in the selected version
-    rprint("\n[bold]Operation history[/bold]:")
-    try:
-        ops = get_operation_history(client, naaccr_version, chosen_id)
-        if not ops:
-            rprint("  (no operations returned)")
-        for op in ops[:25]:
-            rprint(
-                f"  - {op.get('Operation')} | {op.get('ModifiedAttribute')}: "
-                f"{op.get('OldValue')} -> {op.get('NewValue')}"
-            )
-    except Exception as e:
-        rprint(f"[yellow]Operation history not available: {e}[/yellow]")
+    with NAACCRClient() as client:
+        # 1) Versions
+        versions = list_versions(client)
+        _print_versions(versions)
+
+        # 2) Search (paged)
+        items = search_data_items(
+            client,
+            naaccr_version,
+            q=query,
+            minimize_results=minimize,
+            pages=pages,
+            delay=delay,
+            concurrency=concurrency,
+        )
+        _print_items(
+            title=f"Search results for version={naaccr_version!r}, q={query!r}, minimize={minimize}",
+            items=items,
+            limit=15,
+        )
 
-    rprint("\n[green]Done.[/green]")
-    return 0
+        if not items and not item_id:
+            rprint("[yellow]No items returned by search and no explicit item id provided. Exiting.[/yellow]")
+            return 0
+
+        # 3) Pick an item (either explicit --item or first search hit) and fetch full record
+        chosen_id = item_id or _select_id(items[0])
+        if not chosen_id:
+            rprint("[red]Could not determine an item identifier (ItemNumber/XmlNaaccrId). Exiting.[/red]")
+            return 1
+
+        rprint(f"\n[bold]Fetching full item[/bold] id={chosen_id!r} (version {naaccr_version}) ...")
+        full = get_data_item(client, naaccr_version, chosen_id)
+        # Print a compact subset
+        summary_keys = [
+            "ItemNumber",
+            "ItemName",
+            "ItemLength",
+            "YearImplemented",
+            "VersionImplemented",
+            "XmlNaaccrId",
+            "Section",
+            "SourceOfStandard",
+        ]
+        rprint({k: full.get(k) for k in summary_keys})
+
+        # 4) Attribute history (Description is usually present across versions)
+        rprint("\n[bold]Attribute history[/bold] (Description):")
+        try:
+            hist = get_attribute_history(client, chosen_id, attribute="Description")
+            for row in hist:
+                rprint(f"  - v{row.get('NaaccrVersion')}: {row.get('Value')}")
+        except Exception as e:
+            rprint(f"[yellow]Attribute history not available: {e}[/yellow]")
+
+        # 5) Operation history for this item in the selected version
+        rprint("\n[bold]Operation history[/bold]:")
+        try:
+            ops = get_operation_history(client, naaccr_version, chosen_id)
+            if not ops:
+                rprint("  (no operations returned)")
+            for op in ops[:25]:
+                rprint(
+                    f"  - {op.get('Operation')} | {op.get('ModifiedAttribute')}: "
+                    f"{op.get('OldValue')} -> {op.get('NewValue')}"
+                )
+        except Exception as e:
+            rprint(f"[yellow]Operation history not available: {e}[/yellow]")
+
+        rprint("\n[green]Done.[/green]")
+        return 0
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -165,6 +172,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     p.add_argument("--pages", type=int, default=1, help="Max number of pages to fetch for search")
     p.add_argument("--minimize", action="store_true", help="Request minimized search results")
     p.add_argument("--delay", type=float, default=0.25, help="Delay between page requests (seconds)")
+    p.add_argument("--concurrency", type=int, default=1, help="Fetch search pages with N threads (request starts still spaced by --delay)")
     p.add_argument("--item", dest="item_id", help="Explicit ItemNumber or XmlNaaccrId to fetch")
 
     args = p.parse_args(argv)
@@ -174,6 +182,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         minimize=bool(args.minimize),
         pages=int(args.pages),
         delay=float(args.delay),
+        concurrency=int(args.concurrency),
         item_id=args.item_id,
     )
 
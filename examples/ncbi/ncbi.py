@@ -19,17 +19,24 @@ You **must** provide a contact email either through the environment variable
 `NCBI_EMAIL` or via command line using `--email`.
 """
 
+from __future__ import annotations
+
 import os
 import json
 import argparse
-from ind.ncbi.client import NCBIConfig, EntrezClient
-from ind.ncbi import endpoints as ep
-from ind.ncbi import workflows as wf
-from ind.config import get_info
+from typing import TYPE_CHECKING
+
+# Bio.Entrez and ind.config are slow to import; they are loaded only once an
+# example actually runs, so `--help` and argument errors return immediately.
+if TYPE_CHECKING:
+    from ind.ncbi.client import EntrezClient
 
 
 def get_client(args) -> EntrezClient:
     """Build a client instance using either CLI or environment config."""
+    from ind.ncbi.client import NCBIConfig, EntrezClient
+    from ind.config import get_info
+
     email = args.email or os.getenv("NCBI_EMAIL") or get_info("NCBI_EMAIL")
     api_key = args.api_key or os.getenv("NCBI_API_KEY") or get_info("NCBI_API_KEY")
     if not email:
@@ -39,12 +46,16 @@ def get_client(args) -> EntrezClient:
 
 
 def example_esearch(client: EntrezClient) -> None:
+    from ind.ncbi import endpoints as ep
+
     print("=== Example 1: PubMed esearch ===")
     res = ep.esearch(client, db="pubmed", term="cancer immunotherapy", retmax=5)
     print(json.dumps(res, indent=2))
 
 
 def example_esummary(client: EntrezClient) -> None:
+    from ind.ncbi import endpoints as ep
+
     print("=== Example 2: PubMed esummary ===")
     ids = ["17284678", "37492310"]
     res = ep.esummary(client, db="pubmed", ids=ids)
@@ -52,6 +63,8 @@ def example_esummary(client: EntrezClient) -> None:
 
 
 def example_fetch_abstracts(client: EntrezClient) -> None:
+    from ind.ncbi import workflows as wf
+
     print("=== Example 3: Fetch PubMed abstracts ===")
     pairs = wf.search_then_fetch_abstracts(client, term="cancer AND bevacizumab", limit=3)
     for pmid, text in pairs:
@@ -59,12 +72,16 @@ def example_fetch_abstracts(client: EntrezClient) -> None:
 
 
 def example_linked_uids(client: EntrezClient) -> None:
+    from ind.ncbi import workflows as wf
+
     print("=== Example 4: Gene→Nucleotide links ===")
     mapping = wf.linked_uids(client, dbfrom="gene", ids=["672"], db="nucleotide", linkname="gene_nuccore")
     print(json.dumps(mapping, indent=2))
 
 
 def example_gene_fasta(client: EntrezClient) -> None:
+    from ind.ncbi import workflows as wf
+
     print("=== Example 5: Download FASTA sequences for gene IDs ===")
     res = wf.download_fasta_for_gene_ids(client, ["672"])
     for gid, fasta in res.items():
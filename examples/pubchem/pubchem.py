@@ -13,6 +13,9 @@ Documentation:
     https://pubchem.ncbi.nlm.nih.gov/rest/pug
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from ind.pubchem.client import PubChemClient
 from ind.pubchem.endpoints import (
     get_compound_record,
@@ -22,56 +25,52 @@ from ind.pubchem.endpoints import (
     get_assaysummary,
     fast_search,
 )
-from ind.pubchem.http import pug_fetch
-from pprint import pprint
+from ind.pubchem.http import pug_fetch, json_fast
+from pprint import pformat
+
+# PubChem asks for at most 5 requests/second; never have more than that in flight.
+_MAX_WORKERS = 5
 
 
-def example_1_simple_record():
+def example_1_simple_record(client: PubChemClient) -> str:
     """Fetch full compound record for aspirin (CID 2244) as JSON."""
-    client = PubChemClient()
     resp = get_compound_record(client, "2244", output="JSON", record_type="2d")
-    print("CID 2244 summary:")
-    pprint(resp.json())
+    return "CID 2244 summary:\n" + pformat(json_fast(resp))
 
 
-def example_2_property_table():
+def example_2_property_table(client: PubChemClient) -> str:
     """Fetch molecular formula and weight for multiple compounds as CSV."""
-    client = PubChemClient()
     resp = get_compound_properties(
         client,
         identifiers="1,2,3,4,5",
         properties="MolecularFormula,MolecularWeight",
         output="CSV",
     )
-    print(resp.text[:200], "...")
+    return resp.text[:200] + " ..."
 
 
-def example_3_save_sdf():
+def example_3_save_sdf(client: PubChemClient) -> str:
     """Download SDF record for aspirin and save to file."""
-    client = PubChemClient()
     resp = get_compound_record(
         client,
         "2244",
         output="SDF",
         to_file="./results/aspirin.sdf",
     )
-    print("File saved to ./results/aspirin.sdf")
-    print("HTTP status:", resp.status_code)
+    return f"File saved to ./results/aspirin.sdf\nHTTP status: {resp.status_code}"
 
 
-def example_4_synonyms():
+def example_4_synonyms(client: PubChemClient) -> str:
     """Retrieve synonyms for a compound by name."""
-    client = PubChemClient()
     resp = get_synonyms(client, "compound", "name", "aspirin", output="JSON")
-    synonyms = resp.json().get("InformationList", {}).get("Information", [{}])[0].get("Synonym", [])
-    print(f"Found {len(synonyms)} synonyms for aspirin:")
-    for s in synonyms[:10]:
-        print("  -", s)
+    synonyms = json_fast(resp).get("InformationList", {}).get("Information", [{}])[0].get("Synonym", [])
+    lines = [f"Found {len(synonyms)} synonyms for aspirin:"]
+    lines.extend(f"  - {s}" for s in synonyms[:10])
+    return "\n".join(lines)
 
 
-def example_5_interconvert_ids():
+def example_5_interconvert_ids(client: PubChemClient) -> str:
     """Convert compound names to CIDs and return as JSON."""
-    client = PubChemClient()
     resp = get_ids(
         client,
         domain="compound",
@@ -81,19 +80,18 @@ def example_5_interconvert_ids():
         output="JSON",
         options={"list_return": "flat"},
     )
-    print(resp.json())
+    return str(json_fast(resp))
 
 
-def example_6_assay_summary():
+def example_6_assay_summary(client: PubChemClient) -> str:
     """Retrieve assay summary for compound CID 1000 as CSV."""
-    client = PubChemClient()
     resp = get_assaysummary(client, "compound", "cid", "1000", output="CSV")
-    print(resp.text.splitlines()[:5])
+    # Only the first lines are shown; don't decode and split the whole CSV.
+    return str(list(islice(resp.iter_lines(decode_unicode=True), 5)))
 
 
-def example_7_structure_search():
+def example_7_structure_search(client: PubChemClient) -> str:
     """Perform a fast substructure search by SMILES."""
-    client = PubChemClient()
     resp = fast_search(
         client,
         kind="fastsubstructure",
@@ -102,12 +100,11 @@ def example_7_structure_search():
         output="JSON",
         options={"MaxRecords": 5},
     )
-    print(resp.json())
+    return str(json_fast(resp))
 
 
-def example_8_manual_pug_fetch():
+def example_8_manual_pug_fetch(client: PubChemClient) -> str:
     """Use the low-level pug_fetch() for fine control."""
-    client = PubChemClient()
     resp = pug_fetch(
         client,
         input_specification="compound/cid/2244",
@@ -115,34 +112,35 @@ def example_8_manual_pug_fetch():
         output_specification="JSON",
         operation_options={"record_type": "2d"},
     )
-    print(resp.json())
-
-
-def main():
-    print("=== Example 1: Full Record ===")
-    example_1_simple_record()
+    return str(json_fast(resp))
 
-    print("\n=== Example 2: Property Table ===")
-    example_2_property_table()
 
-    print("\n=== Example 3: Save SDF ===")
-    example_3_save_sdf()
+EXAMPLES = [
+    ("Example 1: Full Record", example_1_simple_record),
+    ("Example 2: Property Table", example_2_property_table),
+    ("Example 3: Save SDF", example_3_save_sdf),
+    ("Example 4: Synonyms", example_4_synonyms),
+    ("Example 5: Interconvert IDs", example_5_interconvert_ids),
+    ("Example 6: Assay Summary", example_6_assay_summary),
+    ("Example 7: Fast Search", example_7_structure_search),
+    ("Example 8: Manual PUG Fetch", example_8_manual_pug_fetch),
+]
 
-    print("\n=== Example 4: Synonyms ===")
-    example_4_synonyms()
 
-    print("\n=== Example 5: Interconvert IDs ===")
-    example_5_interconvert_ids()
-
-    print("\n=== Example 6: Assay Summary ===")
-    example_6_assay_summary()
-
-    print("\n=== Example 7: Fast Search ===")
-    example_7_structure_search()
-
-    print("\n=== Example 8: Manual PUG Fetch ===")
-    example_8_manual_pug_fetch()
+def main():
+    # The examples are independent, so run them concurrently and print the
+    # results in order: wall time is roughly the slowest example, not the sum.
+    # One shared client: a single keep-alive pool, and its throttle spaces
+    # requests from all threads.
+    with PubChemClient() as client, ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        futures = [(title, pool.submit(fn, client)) for title, fn in EXAMPLES]
+        for i, (title, fut) in enumerate(futures):
+            print(("\n" if i else "") + f"=== {title} ===")
+            try:
+                print(fut.result())
+            except Exception as e:
+                print(f"[skip] {type(e).__name__}: {e}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -14,6 +14,7 @@ Usage examples:
   python seer.py surgery-table latest --title "Oral Cavity"
   python seer.py naaccr-items 22 --q "primary site" --count 25
   python seer.py hcpcs-search --q bevacizumab --order date_modified
+  python seer.py --full staging-schema ajcc8 latest lung
 
 Notes
 -----
@@ -24,11 +25,18 @@ Notes
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
-from typing import Any, Dict, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Sequence, Tuple
 from pprint import pprint
 
+try:  # optional: faster serialization of large responses
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from ind.seer.client import SeerClient
 from ind.seer import (
     glossary as seer_glossary,
@@ -72,11 +80,22 @@ def _first_version_from_response(resp: Any) -> Optional[str]:
                     return v
     return None
 
-def _resolve_latest(version: str, fetch_versions_fn) -> str:
+# (base URL, endpoint function name) -> versions response; keyed without the
+# client so the cache never keeps client objects (and their sessions) alive
+_VERSIONS_CACHE: Dict[Tuple[str, str], Any] = {}
+
+def _versions(client: SeerClient, fetch_versions_fn) -> Any:
+    """`fetch_versions_fn(client)`, fetched at most once per base URL and endpoint."""
+    key = (client.base_url, fetch_versions_fn.__name__)
+    if key not in _VERSIONS_CACHE:
+        _VERSIONS_CACHE[key] = fetch_versions_fn(client)
+    return _VERSIONS_CACHE[key]
+
+def _resolve_latest(client: SeerClient, version: str, fetch_versions_fn) -> str:
     if str(version).lower() != "latest":
         return version
     try:
-        resp = fetch_versions_fn()
+        resp = _versions(client, fetch_versions_fn)
         v = _first_version_from_response(resp)
         if not v:
             raise RuntimeError("Could not determine latest version from API response")
@@ -87,58 +106,102 @@ def _resolve_latest(version: str, fetch_versions_fn) -> str:
 
 # ------------------------- util printing -------------------------
 
+_SEP_CACHE: Dict[int, str] = {}
+
 def _print_heading(title: str) -> None:
-    print("\n" + title)
-    print("-" * len(title))
+    sep = _SEP_CACHE.get(len(title))
+    if sep is None:
+        sep = _SEP_CACHE[len(title)] = "-" * len(title)
+    sys.stdout.write("\n" + title + "\n" + sep + "\n")
 
 
 def _pp(obj: Any, *, indent: int = 2, maxlen: int = 2000) -> None:
-    """Pretty-print JSON safely with truncation."""
+    """Pretty-print JSON safely with truncation (maxlen <= 0 prints everything)."""
+    if maxlen > 0:
+        # Encode incrementally and stop once past the cap, so a large staging
+        # schema costs O(maxlen) to preview rather than O(size of response).
+        parts: list[str] = []
+        size = 0
+        try:
+            for chunk in json.JSONEncoder(indent=indent, ensure_ascii=False).iterencode(obj):
+                parts.append(chunk)
+                size += len(chunk)
+                if size > maxlen:
+                    break
+        except Exception:
+            pprint(obj)
+            return
+        s = "".join(parts)
+        if size > maxlen:
+            print(s[:maxlen] + "\n... [truncated] ...")
+        else:
+            print(s)
+        return
+
+    if orjson is not None and indent == 2:
+        try:
+            print(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+        except TypeError:
+            pprint(obj)
+        return
     try:
-        s = json.dumps(obj, indent=indent, ensure_ascii=False)
+        print(json.dumps(obj, indent=indent, ensure_ascii=False))
     except Exception:
         pprint(obj)
-        return
-    if len(s) > maxlen:
-        print(s[:maxlen] + "\n... [truncated] ...")
-    else:
-        print(s)
+
+
+def _print_pages(title: str, fetch_page, *, offset: int, count: int, pages: int = 1, maxlen: int = 2000) -> None:
+    """Print up to `pages` pages from `offset`; the next page downloads while this one prints."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(fetch_page, offset)
+        for k in range(max(1, pages)):
+            res = pending.result()
+            # an empty page is the last one: only prefetch past a non-empty page
+            if res and k + 1 < pages:
+                pending = pool.submit(fetch_page, offset + (k + 1) * count)
+            _print_heading(title if pages <= 1 else f"{title} (offset {offset + k * count})")
+            _pp(res, maxlen=maxlen)
+            if not res:
+                break
 
 
 # ------------------------- command handlers -------------------------
 
 def cmd_versions(client: SeerClient, args: argparse.Namespace) -> None:
-    _print_heading("Glossary Versions")
-    _pp(seer_glossary.list_glossary_versions(client))
-
-    _print_heading("Disease Versions")
-    _pp(seer_disease.list_disease_versions(client))
+    # Four independent lookups: fetch them concurrently, print in order.
+    sections = [
+        ("Glossary Versions", lambda: _versions(client, seer_glossary.list_glossary_versions)),
+        ("Disease Versions", lambda: _versions(client, seer_disease.list_disease_versions)),
+        ("Rx Versions", lambda: _versions(client, seer_rx.list_rx_versions)),
+        ("Staging Algorithms", lambda: seer_staging.list_staging_algorithms(client)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+        futures = [(title, pool.submit(fn)) for title, fn in sections]
+        for title, fut in futures:
+            _print_heading(title)
+            _pp(fut.result(), maxlen=args.maxlen)
 
-    _print_heading("Rx Versions")
-    _pp(seer_rx.list_rx_versions(client))
 
-    _print_heading("Staging Algorithms")
-    _pp(seer_staging.list_staging_algorithms(client))
+def cmd_disease_search(client: SeerClient, args: argparse.Namespace) -> None:
+    version = _resolve_latest(client, args.version, seer_disease.list_disease_versions)
 
+    def fetch(offset: int) -> Any:
+        return seer_disease.list_diseases(
+            client,
+            version,
+            q=args.q,
+            type=args.type,
+            site_category=args.site_category,
+            count=args.count,
+            offset=offset,
+            order=args.order,
+        )
 
-def cmd_disease_search(client: SeerClient, args: argparse.Namespace) -> None:
-    version = _resolve_latest(args.version, lambda: seer_disease.list_disease_versions(client))
-    res = seer_disease.list_diseases(
-        client,
-        version,
-        q=args.q,
-        type=args.type,
-        site_category=args.site_category,
-        count=args.count,
-        offset=args.offset,
-        order=args.order,
-    )
-    _print_heading(f"Disease Search v{version}")
-    _pp(res)
+    _print_pages(f"Disease Search v{version}", fetch, offset=args.offset, count=args.count, pages=args.pages, maxlen=args.maxlen)
 
 
 def cmd_disease_same(client: SeerClient, args: argparse.Namespace) -> None:
-    version = _resolve_latest(args.version, lambda: seer_disease.list_disease_versions(client))
+    version = _resolve_latest(client, args.version, seer_disease.list_disease_versions)
     res = seer_disease.is_same_disease(
         client,
         version,
@@ -148,11 +211,11 @@ def cmd_disease_same(client: SeerClient, args: argparse.Namespace) -> None:
         year2=args.year2,
     )
     _print_heading(f"Disease Compare v{version}")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_glossary_list(client: SeerClient, args: argparse.Namespace) -> None:
-    version = _resolve_latest(args.version, lambda: seer_glossary.list_glossary_versions(client))
+    version = _resolve_latest(client, args.version, seer_glossary.list_glossary_versions)
     res = seer_glossary.list_glossary(
         client,
         version,
@@ -162,7 +225,7 @@ def cmd_glossary_list(client: SeerClient, args: argparse.Namespace) -> None:
         order=args.order,
     )
     _print_heading(f"Glossary v{version}")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_ndc_search(client: SeerClient, args: argparse.Namespace) -> None:
@@ -176,30 +239,32 @@ def cmd_ndc_search(client: SeerClient, args: argparse.Namespace) -> None:
         order=args.order,
     )
     _print_heading("NDC Search")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_rx_search(client: SeerClient, args: argparse.Namespace) -> None:
-    version = _resolve_latest(args.version, lambda: seer_rx.list_rx_versions(client))
-    res = seer_rx.list_rx(
-        client,
-        version,
-        q=args.q,
-        type=args.type,
-        category=args.category,
-        do_not_code=args.do_not_code,
-        count=args.count,
-        offset=args.offset,
-        order=args.order,
-    )
-    _print_heading(f"Rx Search v{version}")
-    _pp(res)
+    version = _resolve_latest(client, args.version, seer_rx.list_rx_versions)
+
+    def fetch(offset: int) -> Any:
+        return seer_rx.list_rx(
+            client,
+            version,
+            q=args.q,
+            type=args.type,
+            category=args.category,
+            do_not_code=args.do_not_code,
+            count=args.count,
+            offset=offset,
+            order=args.order,
+        )
+
+    _print_pages(f"Rx Search v{version}", fetch, offset=args.offset, count=args.count, pages=args.pages, maxlen=args.maxlen)
 
 
 def cmd_staging_schema(client: SeerClient, args: argparse.Namespace) -> None:
     _print_heading(f"Staging {args.algorithm} {args.version} – schema {args.schema_id}")
     res = seer_staging.get_staging_schema_by_id(client, args.algorithm, args.version, args.schema_id)
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_surgery_table(client: SeerClient, args: argparse.Namespace) -> None:
@@ -211,13 +276,13 @@ def cmd_surgery_table(client: SeerClient, args: argparse.Namespace) -> None:
         hist=args.hist,
     )
     _print_heading(f"Surgery {args.year} table")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_naaccr_items(client: SeerClient, args: argparse.Namespace) -> None:
     res = seer_naaccr.list_naaccr_items(client, args.version, q=args.q, count=args.count)
     _print_heading(f"NAACCR {args.version} items")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 def cmd_hcpcs_search(client: SeerClient, args: argparse.Namespace) -> None:
@@ -230,7 +295,7 @@ def cmd_hcpcs_search(client: SeerClient, args: argparse.Namespace) -> None:
         order=args.order,
     )
     _print_heading("HCPCS Search")
-    _pp(res)
+    _pp(res, maxlen=args.maxlen)
 
 
 # ------------------------- argparse wiring -------------------------
@@ -240,6 +305,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--base-url", default="https://api.seer.cancer.gov", help="Override SEER base URL")
     p.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout (s)")
     p.add_argument("--api-key", help="NCI SEER API key (or set SEER_API_KEY env var)")
+    p.add_argument("--maxlen", type=int, default=2000, help="Truncate printed responses to this many characters (0 = no limit)")
+    p.add_argument("--full", dest="maxlen", action="store_const", const=0, help="Print responses in full (same as --maxlen 0)")
 
     sp = p.add_subparsers(dest="cmd", required=True)
 
@@ -254,6 +321,7 @@ def build_parser() -> argparse.ArgumentParser:
     d.add_argument("--site-category", nargs="+", help="Limit to site categories (solid tumor only)")
     d.add_argument("--count", type=int, default=25)
     d.add_argument("--offset", type=int, default=0)
+    d.add_argument("--pages", type=int, default=1, help="Pages to show; the next page is prefetched while one prints")
     d.add_argument("--order", help="Sort order (e.g., name, -name)")
 
     # disease compare
@@ -290,6 +358,7 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--do-not-code", choices=["YES", "NO", "SEE_REMARKS"])
     r.add_argument("--count", type=int, default=25)
     r.add_argument("--offset", type=int, default=0)
+    r.add_argument("--pages", type=int, default=1, help="Pages to show; the next page is prefetched while one prints")
     r.add_argument("--order")
 
     # staging schema
@@ -323,39 +392,41 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+_DISPATCH = {
+    "versions": cmd_versions,
+    "disease-search": cmd_disease_search,
+    "disease-same": cmd_disease_same,
+    "glossary-list": cmd_glossary_list,
+    "ndc-search": cmd_ndc_search,
+    "rx-search": cmd_rx_search,
+    "staging-schema": cmd_staging_schema,
+    "surgery-table": cmd_surgery_table,
+    "naaccr-items": cmd_naaccr_items,
+    "hcpcs-search": cmd_hcpcs_search,
+}
+
+
+@functools.cache
+def _parser() -> argparse.ArgumentParser:
+    # build_parser() holds no per-run state, so one instance serves every main() call.
+    return build_parser()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
-    parser = build_parser()
+    parser = _parser()
     args = parser.parse_args(argv)
 
-    client = SeerClient(base_url=args.base_url, timeout=args.timeout, api_key=args.api_key)
-
-    try:
-        if args.cmd == "versions":
-            cmd_versions(client, args)
-        elif args.cmd == "disease-search":
-            cmd_disease_search(client, args)
-        elif args.cmd == "disease-same":
-            cmd_disease_same(client, args)
-        elif args.cmd == "glossary-list":
-            cmd_glossary_list(client, args)
-        elif args.cmd == "ndc-search":
-            cmd_ndc_search(client, args)
-        elif args.cmd == "rx-search":
-            cmd_rx_search(client, args)
-        elif args.cmd == "staging-schema":
-            cmd_staging_schema(client, args)
-        elif args.cmd == "surgery-table":
-            cmd_surgery_table(client, args)
-        elif args.cmd == "naaccr-items":
-            cmd_naaccr_items(client, args)
-        elif args.cmd == "hcpcs-search":
-            cmd_hcpcs_search(client, args)
-        else:
-            parser.error(f"Unknown command: {args.cmd}")
-            return 2
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+    handler = _DISPATCH.get(args.cmd)
+    if handler is None:
+        parser.error(f"Unknown command: {args.cmd}")
+        return 2
+
+    with SeerClient(base_url=args.base_url, timeout=args.timeout, api_key=args.api_key) as client:
+        try:
+            handler(client, args)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
 
     return 0
 
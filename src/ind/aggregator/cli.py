@@ -1,21 +1,69 @@
 from __future__ import annotations
-import argparse, json, webbrowser, re
+import argparse, json, os, re
 from pathlib import Path
 import shutil
 import importlib.resources as pkg_resources
 
+try:  # optional: faster JSON encoding (indents in native code, straight to bytes)
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # Within package
 import ind.resources.icon as icon_pkg
 from ..utils import mkdir
-from ..gen.html import make_html_index
-
-# Within module
-from .orchrestator import build_company_intel
 
 ## Render
 from .render.csv import (_write_drugs_csv, _write_ndc_csv, _write_adverse_events_csv, _write_enforcements_csv, _write_labels_csv, _write_shortages_csv, 
                          _write_devices_csv, _write_device_events_csv, _write_device_enforcements_csv, _write_device_recalls_csv, _write_device_registrationlisting_csv, _write_transparency_crl_csv)
-from .render.html import _render_html
+from .render.html import _iter_html
+
+# One entry per OpenFDA endpoint, in output order:
+# (category, endpoint, intel keys, CSV writer, _iter_html show_* flag)
+_SECTIONS = (
+    ("Drug", "Approved", ("drugs_approved",), _write_drugs_csv, "show_drug_approved"),
+    ("Drug", "NDC Directory", ("ndc_directory",), _write_ndc_csv, "show_drug_ndc"),
+    ("Drug", "Adverse Events", ("drug_adverse_events",), _write_adverse_events_csv, "show_drug_adverse_events"),
+    ("Drug", "Enforcement", ("drug_enforcements",), _write_enforcements_csv, "show_drug_enforcements"),
+    ("Drug", "Labeling", ("drug_labels",), _write_labels_csv, "show_drug_labels"),
+    ("Drug", "Shortages", ("drug_shortages",), _write_shortages_csv, "show_drug_shortages"),
+    ("Device", "Approved", ("devices_510k", "devices_pma"), _write_devices_csv, "show_device_approved"),
+    ("Device", "Adverse Events", ("device_adverse_events",), _write_device_events_csv, "show_device_adverse_events"),
+    ("Device", "Enforcement", ("device_enforcements",), _write_device_enforcements_csv, "show_device_enforcements"),
+    ("Device", "Recalls", ("device_recalls",), _write_device_recalls_csv, "show_device_recalls"),
+    ("Device", "Registration Listing", ("device_registration_listing",), _write_device_registrationlisting_csv, "show_device_registrationlisting"),
+    ("Transparency", "Complete Response Letters", ("transparency_crl",), _write_transparency_crl_csv, "show_transparency_crl"),
+)
+
+# Approved devices come from two endpoints; their combined CSV tags each row with its source
+_DEVICE_TYPES = {"devices_510k": "510k", "devices_pma": "PMA"}
+
+def _csv_rows(intel: dict, keys: tuple[str, ...]) -> list[dict]:
+    if len(keys) == 1:
+        return intel.get(keys[0]) or []
+    combined: list[dict] = []
+    for key in keys:
+        for d in (intel.get(key) or []):
+            dd = dict(d)
+            dd.setdefault("device_type", _DEVICE_TYPES[key])
+            combined.append(dd)
+    return combined
+
+def _json_bytes(obj) -> bytes:
+    # ensure_ascii=False so the output is the same UTF-8 with or without orjson
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError: # e.g., non-str keys or ints beyond 64 bits, which json still handles
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError: # e.g., filesystem without hard links
+        shutil.copy(src, dst)
 
 def _safe_company(name: str) -> str:
     s = (name or "").strip()
@@ -48,291 +96,51 @@ def add_subparser(subparsers: argparse._SubParsersAction, formatter_class: type[
     p.set_defaults(func=_run)
 
 def _run(**kwargs) -> None:
+    # Deferred so `ind intel -h` doesn't import the OpenFDA sources or ind.gen.html (matplotlib/seaborn via ind.gen.plot)
+    from ..gen.html import make_html_index
+    from .orchrestator import build_company_intel
+
     args = argparse.Namespace(**kwargs)
-    intel = build_company_intel(args.company).dict()
+    # Fields read straight off the dataclass: .dict() (asdict) deep-copies every record, and nothing here mutates them
+    intel = vars(build_company_intel(args.company))
 
     company_dirname = _safe_company(intel.get("company") or args.company)
     out_dir: Path = (args.out_dir or Path(".")).resolve()
 
-    # Create company directory and subdirectories
-    ## Company level
+    # Create company directory and subdirectories: <company>/<category>/<endpoint>
     data_dir = out_dir / company_dirname
-
-    ## Category level
-    drug_dir = data_dir / "Drug"
-    device_dir = data_dir / "Device"
-    transparency_dir = data_dir / "Transparency"
-    
-    ## Endpoint level
-    drug_approved_dir = drug_dir / "Approved"
-    drug_ndc_dir = drug_dir / "NDC Directory"
-    drug_adverse_dir = drug_dir / "Adverse Events"
-    drug_enforcement_dir = drug_dir / "Enforcement"
-    drug_labeling_dir = drug_dir / "Labeling"
-    drug_shortages_dir = drug_dir / "Shortages"
-
-    device_approved_dir = device_dir / "Approved"
-    device_adverse_dir = device_dir / "Adverse Events"
-    device_enforcement_dir = device_dir / "Enforcement"
-    device_recalls_dir = device_dir / "Recalls"
-    device_registrationlisting_dir = device_dir / "Registration Listing"
-
-    crl_dir = transparency_dir / "Complete Response Letters"
-    
-    mkdir(drug_approved_dir)
-    mkdir(drug_ndc_dir)
-    mkdir(drug_adverse_dir)
-    mkdir(drug_enforcement_dir)
-    mkdir(drug_labeling_dir)
-    mkdir(drug_shortages_dir)
-
-    mkdir(device_approved_dir)
-    mkdir(device_adverse_dir)
-    mkdir(device_enforcement_dir)
-    mkdir(device_recalls_dir)
-    mkdir(device_registrationlisting_dir)
-
-    mkdir(crl_dir)
+    section_dirs = [data_dir / category / endpoint for category, endpoint, *_ in _SECTIONS]
+    for section_dir in section_dirs:
+        mkdir(section_dir)
 
     # File paths
     ## Company level
     html_filename = args.html_name or f"{company_dirname}.html"
-    
-    ## Category/endpoint levels
-    drug_approved_html_path = drug_dir / "Approved.html"
-    drug_approved_csv_path = drug_approved_dir / f"Approved.csv"
-    drug_approved_json_path = drug_approved_dir / f"Approved.json"
-
-    drug_ndc_html_path = drug_dir / "NDC Directory.html"
-    drug_ndc_csv_path = drug_ndc_dir / "NDC Directory.csv"
-    drug_ndc_json_path = drug_ndc_dir / "NDC Directory.json"
-
-    drug_adverse_html_path = drug_dir / "Adverse Events.html"
-    drug_adverse_csv_path = drug_adverse_dir / "Adverse Events.csv"
-    drug_adverse_json_path = drug_adverse_dir / "Adverse Events.json"
-
-    drug_enforcement_html_path = drug_dir / "Enforcement.html"
-    drug_enforcement_csv_path = drug_enforcement_dir / "Enforcement.csv"
-    drug_enforcement_json_path = drug_enforcement_dir / "Enforcement.json"
-
-    drug_labeling_html_path = drug_dir / "Labeling.html"
-    drug_labeling_csv_path = drug_labeling_dir / "Labeling.csv"
-    drug_labeling_json_path = drug_labeling_dir / "Labeling.json"
-    
-    drug_shortages_html_path = drug_dir / "Shortages.html"
-    drug_shortages_csv_path = drug_shortages_dir / "Shortages.csv"
-    drug_shortages_json_path = drug_shortages_dir / "Shortages.json"
-
-    device_approved_html_path = device_dir / "Approved.html"
-    device_approved_csv_path = device_approved_dir / f"Approved.csv"
-    device_approved_json_path = device_approved_dir / f"Approved.json"
-    
-    device_adverse_html_path = device_dir / "Adverse Events.html"
-    device_adverse_csv_path = device_adverse_dir / "Adverse Events.csv"
-    device_adverse_json_path = device_adverse_dir / "Adverse Events.json"
 
-    device_enforcement_html_path = device_dir / "Enforcement.html"
-    device_enforcement_csv_path = device_enforcement_dir / "Enforcement.csv"
-    device_enforcement_json_path = device_enforcement_dir / "Enforcement.json"
-
-    device_recalls_html_path = device_dir / "Recalls.html"
-    device_recalls_csv_path = device_recalls_dir / "Recalls.csv"
-    device_recalls_json_path = device_recalls_dir / "Recalls.json"
-
-    device_registrationlisting_html_path = device_dir / "Registration Listing.html"
-    device_registrationlisting_csv_path = device_registrationlisting_dir / "Registration Listing.csv"
-    device_registrationlisting_json_path = device_registrationlisting_dir / "Registration Listing.json"
-
-    crl_html_path = transparency_dir / "Complete Response Letters.html"
-    crl_csv_path = crl_dir / "Complete Response Letters.csv"
-    crl_json_path = crl_dir / "Complete Response Letters.json"
-    
-    # Ensure the icon exists in both drug/device subfolders and link to it from the HTML
+    # Ensure the icon exists in every endpoint subfolder and link to it from the HTML
+    # (copied once out of the package, then hard-linked; never linked to the installed file itself)
+    icon_path = section_dirs[0] / "fda.svg"
     with pkg_resources.path(icon_pkg, "fda.svg") as svg_path:
-        shutil.copy(svg_path, drug_approved_dir / "fda.svg")
-        shutil.copy(svg_path, drug_ndc_dir / "fda.svg")
-        shutil.copy(svg_path, drug_adverse_dir / "fda.svg")
-        shutil.copy(svg_path, drug_enforcement_dir / "fda.svg")
-        shutil.copy(svg_path, drug_labeling_dir / "fda.svg")
-        shutil.copy(svg_path, drug_shortages_dir / "fda.svg")
-        shutil.copy(svg_path, device_approved_dir / "fda.svg")
-        shutil.copy(svg_path, device_adverse_dir / "fda.svg")
-        shutil.copy(svg_path, device_enforcement_dir / "fda.svg")
-        shutil.copy(svg_path, device_recalls_dir / "fda.svg")
-        shutil.copy(svg_path, device_registrationlisting_dir / "fda.svg")
-        shutil.copy(svg_path, crl_dir / "fda.svg")
-
-    # Write JSON, CSV, and HTML
-    ## Drug
-    ### Approved
-    drug_approved_json = {
-        "company": intel.get("company", args.company),
-        "drugs_approved": intel.get("drugs_approved") or []
-    }
-    drug_approved_json_path.write_text(json.dumps(drug_approved_json, indent=2), encoding="utf-8")
-    _write_drugs_csv(intel.get("drugs_approved") or [], drug_approved_csv_path)
-    drug_approved_html = _render_html(intel, icon_href=str(drug_approved_dir / "fda.svg"), show_drug_approved=True)
-    drug_approved_html_path.write_text(drug_approved_html, encoding="utf-8")
-
-    ### NDC Directory
-    drug_ndc_json = {
-        "company": intel.get("company", args.company),
-        "ndc_directory": intel.get("ndc_directory") or []
-    }
-    drug_ndc_json_path.write_text(json.dumps(drug_ndc_json, indent=2), encoding="utf-8")
-    _write_ndc_csv(intel.get("ndc_directory") or [], drug_ndc_csv_path)
-    drug_ndc_html = _render_html(intel, icon_href=str(drug_ndc_dir / "fda.svg"), show_drug_ndc=True)
-    drug_ndc_html_path.write_text(drug_ndc_html, encoding="utf-8")
-
-    ### Adverse Events
-    drug_adverse_json = {
-        "company": intel.get("company", args.company),
-        "drug_adverse_events": intel.get("drug_adverse_events") or [],
-    }
-    drug_adverse_json_path.write_text(json.dumps(drug_adverse_json, indent=2), encoding="utf-8")
-    _write_adverse_events_csv(intel.get("drug_adverse_events") or [], drug_adverse_csv_path)
-    drug_adverse_html = _render_html(
-        intel,
-        icon_href=str(drug_adverse_dir / "fda.svg"),
-        show_drug_adverse_events=True,
-    )
-    drug_adverse_html_path.write_text(drug_adverse_html, encoding="utf-8")
-
-    ### Enforcement
-    drug_enforcement_json = {
-        "company": intel.get("company", args.company),
-        "drug_enforcements": intel.get("drug_enforcements") or [],
-    }
-    drug_enforcement_json_path.write_text(json.dumps(drug_enforcement_json, indent=2), encoding="utf-8")
-    _write_enforcements_csv(intel.get("drug_enforcements") or [], drug_enforcement_csv_path)
-    drug_enforcement_html = _render_html(
-        intel,
-        icon_href=str(drug_enforcement_dir / "fda.svg"),
-        show_drug_enforcements=True,
-    )
-    drug_enforcement_html_path.write_text(drug_enforcement_html, encoding="utf-8")
-
-    ### Labels
-    drug_labeling_json = {
-        "company": intel.get("company", args.company),
-        "drug_labels": intel.get("drug_labels") or [],
-    }
-    drug_labeling_json_path.write_text(json.dumps(drug_labeling_json, indent=2), encoding="utf-8")
-    _write_labels_csv(intel.get("drug_labels") or [], drug_labeling_csv_path)
-    drug_labeling_html = _render_html(
-        intel,
-        icon_href=str(drug_labeling_dir / "fda.svg"),
-        show_drug_labels=True,
-    )
-    drug_labeling_html_path.write_text(drug_labeling_html, encoding="utf-8")
-
-    ### Shortages
-    drug_shortages_json = {
-        "company": intel.get("company", args.company),
-        "drug_shortages": intel.get("drug_shortages") or [],
-    }
-    drug_shortages_json_path.write_text(json.dumps(drug_shortages_json, indent=2), encoding="utf-8")
-    _write_shortages_csv(intel.get("drug_shortages") or [], drug_shortages_csv_path)
-    drug_shortages_html = _render_html(
-        intel,
-        icon_href=str(drug_shortages_dir / "fda.svg"),
-        show_drug_shortages=True,
-    )
-    drug_shortages_html_path.write_text(drug_shortages_html, encoding="utf-8")
-
-    ## Device
-    ### Approved
-    device_json = {
-        "company": intel.get("company", args.company),
-        "devices_510k": intel.get("devices_510k") or [],
-        "devices_pma": intel.get("devices_pma") or [],
-    }
-    device_approved_json_path.write_text(json.dumps(device_json, indent=2), encoding="utf-8")
-
-    device_combined: list[dict] = []
-    for d in (intel.get("devices_510k") or []):
-        dd = dict(d)
-        dd.setdefault("device_type", "510k")
-        device_combined.append(dd)
-    for d in (intel.get("devices_pma") or []):
-        dd = dict(d)
-        dd.setdefault("device_type", "PMA")
-        device_combined.append(dd)
-
-    _write_devices_csv(device_combined, device_approved_csv_path)
-    device_approved_html = _render_html(intel, icon_href=str(device_approved_dir / "fda.svg"), show_device_approved=True)
-    device_approved_html_path.write_text(device_approved_html, encoding="utf-8")
-
-    ### Adverse Events
-    device_adverse_json = {
-        "company": intel.get("company", args.company),
-        "device_adverse_events": intel.get("device_adverse_events") or [],
-    }
-    device_adverse_json_path.write_text(json.dumps(device_adverse_json, indent=2), encoding="utf-8")
-    _write_device_events_csv(intel.get("device_adverse_events") or [], device_adverse_csv_path)
-    device_adverse_html = _render_html(
-        intel,
-        icon_href=str(device_adverse_dir / "fda.svg"),
-        show_device_adverse_events=True,
-    )
-    device_adverse_html_path.write_text(device_adverse_html, encoding="utf-8")
-
-    ### Enforcement
-    device_enforcement_json = {
-        "company": intel.get("company", args.company),
-        "device_enforcements": intel.get("device_enforcements") or [],
-    }
-    device_enforcement_json_path.write_text(json.dumps(device_enforcement_json, indent=2), encoding="utf-8")
-    _write_device_enforcements_csv(intel.get("device_enforcements") or [], device_enforcement_csv_path)
-    device_enforcement_html = _render_html(
-        intel,
-        icon_href=str(device_enforcement_dir / "fda.svg"),
-        show_device_enforcements=True,
-    )
-    device_enforcement_html_path.write_text(device_enforcement_html, encoding="utf-8")  
-
-    ### Recalls
-    device_recalls_json = {
-        "company": intel.get("company", args.company),
-        "device_recalls": intel.get("device_recalls") or [],
-    }
-    device_recalls_json_path.write_text(json.dumps(device_recalls_json, indent=2), encoding="utf-8")
-    _write_device_recalls_csv(intel.get("device_recalls") or [], device_recalls_csv_path)
-    device_recalls_html = _render_html(
-        intel,
-        icon_href=str(device_recalls_dir / "fda.svg"),
-        show_device_recalls=True,
-    )
-    device_recalls_html_path.write_text(device_recalls_html, encoding="utf-8")
-
-    ### Registration Listing
-    device_registrationlisting_json = {
-        "company": intel.get("company", args.company),
-        "device_registration_listing": intel.get("device_registration_listing") or [],
-    }
-    device_registrationlisting_json_path.write_text(json.dumps(device_registrationlisting_json, indent=2), encoding="utf-8")
-    _write_device_registrationlisting_csv(intel.get("device_registration_listing") or [], device_registrationlisting_csv_path)
-    device_registrationlisting_html = _render_html(
-        intel,
-        icon_href=str(device_registrationlisting_dir / "fda.svg"),
-        show_device_registrationlisting=True,
-    )
-    device_registrationlisting_html_path.write_text(device_registrationlisting_html, encoding="utf-8")
-
-    ## Transparency CRL
-    crl_json = {
-        "company": intel.get("company", args.company),
-        "transparency_crl": intel.get("transparency_crl") or [],
-    }
-    crl_json_path.write_text(json.dumps(crl_json, indent=2), encoding="utf-8")
-    _write_transparency_crl_csv(intel.get("transparency_crl") or [], crl_csv_path)
-
-    crl_html = _render_html(
-        intel,
-        icon_href=str(crl_dir / "fda.svg"),
-        show_transparency_crl=True,
-    )
-    crl_html_path.write_text(crl_html, encoding="utf-8")
+        shutil.copy(svg_path, icon_path)
+    for section_dir in section_dirs[1:]:
+        _link_or_copy(icon_path, section_dir / "fda.svg")
+
+    # Write JSON, CSV, and HTML (HTML streamed chunk by chunk; newline="" keeps the bytes free of newline translation)
+    written: list[Path] = []
+    for (category, endpoint, keys, write_csv, show_flag), section_dir in zip(_SECTIONS, section_dirs):
+        html_path = data_dir / category / f"{endpoint}.html"
+        csv_path = section_dir / f"{endpoint}.csv"
+        json_path = section_dir / f"{endpoint}.json"
+
+        section_json = {"company": intel.get("company", args.company)}
+        for key in keys:
+            section_json[key] = intel.get(key) or []
+        json_path.write_bytes(_json_bytes(section_json))
+        write_csv(_csv_rows(intel, keys), csv_path)
+        with html_path.open("w", encoding="utf-8", newline="") as fh:
+            fh.writelines(_iter_html(intel, icon_href=str(section_dir / "fda.svg"), **{show_flag: True}))
+
+        written += (csv_path, json_path, html_path)
 
     # Create a per-company HTML index that previews all generated HTML in subdirectories
     company_index_path = make_html_index(
@@ -348,55 +156,11 @@ def _run(**kwargs) -> None:
     )
 
     # Print summary
-    print(f"Wrote {drug_approved_csv_path}")
-    print(f"Wrote {drug_approved_json_path}")
-    print(f"Wrote {drug_approved_html_path}")
-
-    print(f"Wrote {drug_ndc_csv_path}")
-    print(f"Wrote {drug_ndc_json_path}")
-    print(f"Wrote {drug_ndc_html_path}")
-
-    print(f"Wrote {drug_adverse_csv_path}")
-    print(f"Wrote {drug_adverse_json_path}")
-    print(f"Wrote {drug_adverse_html_path}")
-
-    print(f"Wrote {drug_enforcement_csv_path}")
-    print(f"Wrote {drug_enforcement_json_path}")
-    print(f"Wrote {drug_enforcement_html_path}")
-
-    print(f"Wrote {drug_labeling_csv_path}")
-    print(f"Wrote {drug_labeling_json_path}")
-    print(f"Wrote {drug_labeling_html_path}")
-
-    print(f"Wrote {drug_shortages_csv_path}")
-    print(f"Wrote {drug_shortages_json_path}")
-    print(f"Wrote {drug_shortages_html_path}")
-
-    print(f"Wrote {device_approved_csv_path}")
-    print(f"Wrote {device_approved_json_path}")
-    print(f"Wrote {device_approved_html_path}")
-
-    print(f"Wrote {device_adverse_csv_path}")
-    print(f"Wrote {device_adverse_json_path}")
-    print(f"Wrote {device_adverse_html_path}")
-
-    print(f"Wrote {device_enforcement_csv_path}")
-    print(f"Wrote {device_enforcement_json_path}")
-    print(f"Wrote {device_enforcement_html_path}")
-
-    print(f"Wrote {device_recalls_csv_path}")
-    print(f"Wrote {device_recalls_json_path}")
-    print(f"Wrote {device_recalls_html_path}")
-
-    print(f"Wrote {device_registrationlisting_csv_path}")
-    print(f"Wrote {device_registrationlisting_json_path}")
-    print(f"Wrote {device_registrationlisting_html_path}")
-
-    print(f"Wrote {crl_csv_path}")
-    print(f"Wrote {crl_json_path}")
-    print(f"Wrote {crl_html_path}")
-
+    for path in written:
+        print(f"Wrote {path}")
     print(f"Wrote {company_index_path}")
 
     if args.auto_open:
-        webbrowser.open(company_index_path.resolve().as_uri())
\ No newline at end of file
+        import webbrowser
+        uri = company_index_path.resolve().as_uri()
+        webbrowser.open(uri)
\ No newline at end of file
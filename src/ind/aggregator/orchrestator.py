@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List
 
@@ -28,6 +29,7 @@ class CompanyOpenFDAIntel:
     def dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+@functools.lru_cache(maxsize=128)
 def build_company_intel(company: str, *, max_records: int = 1000) -> CompanyOpenFDAIntel:
     """
     OpenFDA-only aggregator:
@@ -36,6 +38,10 @@ def build_company_intel(company: str, *, max_records: int = 1000) -> CompanyOpen
       - Looks up NDC directory for a company via /drug/ndc
       - Looks up Drug Adverse Events (FAERS) for a company via /drug/event
       - Looks up Drug Enforcement Reports (Recalls) for a company via /drug/enforcement
+
+    Results are memoized per (company, max_records) for the life of the process, so repeat
+    lookups skip the OpenFDA requests. The returned object is shared between callers: treat
+    it as read-only, and call build_company_intel.cache_clear() to force a fresh fetch.
     """
     records = _search_sponsor(company, limit=max_records)
     drugs = _flatten_approved_drugs(records)
@@ -4,23 +4,21 @@ from pathlib import Path
 def _write_csv_rows(rows: list[dict], output_csv: Path, preferred: list[str]) -> None:
     output_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    keys: list[str] = []
-    seen = set()
-    for k in preferred:
-        if any(k in (d or {}) for d in rows):
-            keys.append(k)
-            seen.add(k)
+    # Column order: preferred keys present in any row, then the rest in first-seen order (one pass over the rows)
+    present: dict[str, None] = {}
     for d in rows:
-        for k in (d or {}).keys():
-            if k not in seen:
-                keys.append(k)
-                seen.add(k)
-
+        if d:
+            present.update(dict.fromkeys(d))
+    keys = [k for k in preferred if k in present]
+    chosen = set(keys)
+    keys += [k for k in present if k not in chosen]
+
+    # csv.writer over per-row value lists: DictWriter would rebuild each row from a dict
+    blank = ("",) * len(keys)
     with output_csv.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=keys)
-        w.writeheader()
-        for d in rows:
-            w.writerow({k: (d.get(k, "") if isinstance(d, dict) else "") for k in keys})
+        w = csv.writer(f)
+        w.writerow(keys)
+        w.writerows([d.get(k, "") for k in keys] if isinstance(d, dict) else blank for d in rows)
 
 
 def _write_drugs_csv(drugs: list[dict], output_csv: Path) -> None:
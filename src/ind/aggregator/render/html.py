@@ -1,279 +1,189 @@
-def _render_html(
-    data: dict,
-    icon_href: str,
-    *,
-    show_drug_approved: bool = False,
-    show_drug_ndc: bool = False,
-    show_drug_adverse_events: bool = False,
-    show_drug_enforcements: bool = False,
-    show_drug_labels: bool = False,
-    show_drug_shortages: bool = False,
-    show_device_approved: bool = False,
-    show_device_adverse_events: bool = False,
-    show_device_enforcements: bool = False,
-    show_device_recalls: bool = False,
-    show_device_registrationlisting: bool = False,
-    show_transparency_crl: bool = False,
-) -> str:
-    # Minimal standalone HTML (no server). Style kept compact.
-    def esc(s):
-        return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+import re
+from typing import Iterator
 
-    # Build rows with data attributes for client-side filtering
-    drugs_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='brand_name'>{esc(str(d.get('brand_name','')))}</td>"
-        f"<td data-col='active_ingredient'>{esc(str(d.get('active_ingredient','')))}</td>"
-        f"<td data-col='dosage_form'>{esc(str(d.get('dosage_form','')))}</td>"
-        f"<td data-col='route'>{esc(str(d.get('route','')))}</td>"
-        f"<td data-col='marketing_status'>{esc(str(d.get('marketing_status','')))}</td>"
-        f"<td data-col='application'>{esc(str(d.get('application','')))}</td>"
-        f"<td data-col='product_no'>{esc(str(d.get('product_no','')))}</td>"
-        f"</tr>"
-        for d in (data.get("drugs_approved") or [])
-    ) or "<tr><td colspan=7>(none)</td></tr>"
-
-    ndc_rows = "\n".join(
-    f"<tr>"
-    f"<td data-col='product_ndc'>{esc(str(d.get('product_ndc','')))}</td>"
-    f"<td data-col='brand_name'>{esc(str(d.get('brand_name','')))}</td>"
-    f"<td data-col='generic_name'>{esc(str(d.get('generic_name','')))}</td>"
-    f"<td data-col='labeler_name'>{esc(str(d.get('labeler_name','')))}</td>"
-    f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-    f"<td data-col='dosage_form'>{esc(str(d.get('dosage_form','')))}</td>"
-    f"<td data-col='route'>{esc(str(d.get('route','')))}</td>"
-    f"<td data-col='marketing_category'>{esc(str(d.get('marketing_category','')))}</td>"
-    f"<td data-col='product_type'>{esc(str(d.get('product_type','')))}</td>"
-    f"<td data-col='finished'>{esc(str(d.get('finished','')))}</td>"
-    f"<td data-col='listing_expiration_date'>{esc(str(d.get('listing_expiration_date','')))}</td>"
-    f"</tr>"
-    for d in (data.get("ndc_directory") or [])
-) or "<tr><td colspan=11>(none)</td></tr>"
-
-    adverse_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='safetyreportid'>{esc(str(d.get('safetyreportid','')))}</td>"
-        f"<td data-col='receivedate'>{esc(str(d.get('receivedate','')))}</td>"
-        f"<td data-col='receiptdate'>{esc(str(d.get('receiptdate','')))}</td>"
-        f"<td data-col='serious'>{esc(str(d.get('serious','')))}</td>"
-        f"<td data-col='patientsex'>{esc(str(d.get('patientsex','')))}</td>"
-        f"<td data-col='patientagegroup'>{esc(str(d.get('patientagegroup','')))}</td>"
-        f"<td data-col='medicinalproduct'>{esc(str(d.get('medicinalproduct','')))}</td>"
-        f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-        f"<td data-col='reaction_pt'>{esc(str(d.get('reaction_pt','')))}</td>"
-        f"</tr>"
-        for d in (data.get("drug_adverse_events") or [])
-    ) or "<tr><td colspan=9>(none)</td></tr>"
+# HTML escaping. Three chained str.replace calls beat str.translate here: CPython's translate
+# takes a slow per-character path when a character maps to a multi-character string.
+def _esc(s) -> str:
+    return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-    enforcement_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='recall_number'>{esc(str(d.get('recall_number','')))}</td>"
-        f"<td data-col='classification'>{esc(str(d.get('classification','')))}</td>"
-        f"<td data-col='status'>{esc(str(d.get('status','')))}</td>"
-        f"<td data-col='report_date'>{esc(str(d.get('report_date','')))}</td>"
-        f"<td data-col='recall_initiation_date'>{esc(str(d.get('recall_initiation_date','')))}</td>"
-        f"<td data-col='termination_date'>{esc(str(d.get('termination_date','')))}</td>"
-        f"<td data-col='recalling_firm'>{esc(str(d.get('recalling_firm','')))}</td>"
-        f"<td data-col='product_description'>{esc(str(d.get('product_description','')))}</td>"
-        f"<td data-col='reason_for_recall'>{esc(str(d.get('reason_for_recall','')))}</td>"
-        f"<td data-col='distribution_pattern'>{esc(str(d.get('distribution_pattern','')))}</td>"
-        f"<td data-col='code_info'>{esc(str(d.get('code_info','')))}</td>"
-        f"<td data-col='city'>{esc(str(d.get('city','')))}</td>"
-        f"<td data-col='state'>{esc(str(d.get('state','')))}</td>"
-        f"<td data-col='country'>{esc(str(d.get('country','')))}</td>"
-        f"</tr>"
-        for d in (data.get("drug_enforcements") or [])
-    ) or "<tr><td colspan=14>(none)</td></tr>"
+# Page skeleton, split once at import where the company name, icon href, cards & initTable() calls go
+_HTML_TPL = """<!doctype html>
+<html>
+  <head>
+  <meta charset="utf-8">
+  <title>IND __COMPANY__</title>
+  <link rel="icon" type="image/svg+xml" href="__ICON_HREF__">
+<style>
+:root { font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; }
+body { margin:0; background:#0b1220; color:#e6edf3; }
+header { padding:16px 24px; border-bottom:1px solid #1f2a44; position:sticky; top:0; background:#0b1220; }
+.container { padding:24px; display:grid; gap:16px; }
+.card { background:#0f172a; border:1px solid #1f2a44; border-radius:14px; padding:16px; }
+.title { font-size:20px; margin:0 0 8px; }
+table { width:100%; border-collapse: collapse; }
+th, td { text-align:left; border-bottom:1px solid #1f2a44; padding:8px; }
+th { font-weight:600; }
+th[data-sort] { cursor: pointer; user-select: none; }
+th[data-sort]::after { content: ' ↕'; font-weight: 400; color: #a4b1c6; }
+th.sorted-asc::after { content: ' ↑'; }
+th.sorted-desc::after { content: ' ↓'; }
+tr.filters th { padding-top: 6px; padding-bottom: 10px; }
+tr.filters select {
+  width: 100%;
+  background: #0b1220;
+  color: #e6edf3;
+  border: 1px solid #1f2a44;
+  border-radius: 10px;
+  padding: 6px 8px;
+}
+</style></head>
+<body>
+<header><strong>IND __COMPANY__</strong></header>
+<div class="container">
+__CARDS__
+</div>
+<script>
+(function() {
+  function initTable(tableId) {
+    const table = document.getElementById(tableId);
+    if (!table) return;
 
-    label_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='set_id'>{esc(str(d.get('set_id','')))}</td>"
-        f"<td data-col='effective_time'>{esc(str(d.get('effective_time','')))}</td>"
-        f"<td data-col='brand_name'>{esc(str(d.get('brand_name','')))}</td>"
-        f"<td data-col='generic_name'>{esc(str(d.get('generic_name','')))}</td>"
-        f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-        f"<td data-col='product_ndc'>{esc(str(d.get('product_ndc','')))}</td>"
-        f"<td data-col='package_ndc'>{esc(str(d.get('package_ndc','')))}</td>"
-        f"<td data-col='route'>{esc(str(d.get('route','')))}</td>"
-        f"<td data-col='dosage_form'>{esc(str(d.get('dosage_form','')))}</td>"
-        f"<td data-col='application_number'>{esc(str(d.get('application_number','')))}</td>"
-        f"</tr>"
-        for d in (data.get("drug_labels") or [])
-    ) or "<tr><td colspan=10>(none)</td></tr>"
+    const tbody = table.querySelector('tbody');
+    const filterSelects = Array.from(table.querySelectorAll('select[data-filter]'));
+    const headers = Array.from(table.querySelectorAll('th[data-sort]'));
 
-    shortages_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='package_ndc'>{esc(str(d.get('package_ndc','')))}</td>"
-        f"<td data-col='generic_name'>{esc(str(d.get('generic_name','')))}</td>"
-        f"<td data-col='proprietary_name'>{esc(str(d.get('proprietary_name','')))}</td>"
-        f"<td data-col='company_name'>{esc(str(d.get('company_name','')))}</td>"
-        f"<td data-col='status'>{esc(str(d.get('status','')))}</td>"
-        f"<td data-col='availability'>{esc(str(d.get('availability','')))}</td>"
-        f"<td data-col='shortage_reason'>{esc(str(d.get('shortage_reason','')))}</td>"
-        f"<td data-col='dosage_form'>{esc(str(d.get('dosage_form','')))}</td>"
-        f"<td data-col='strength'>{esc(str(d.get('strength','')))}</td>"
-        f"<td data-col='therapeutic_category'>{esc(str(d.get('therapeutic_category','')))}</td>"
-        f"<td data-col='update_date'>{esc(str(d.get('update_date','')))}</td>"
-        f"<td data-col='initial_posting_date'>{esc(str(d.get('initial_posting_date','')))}</td>"
-        f"</tr>"
-        for d in (data.get("drug_shortages") or [])
-    ) or "<tr><td colspan=12>(none)</td></tr>"
+    function getCellText(row, col) {
+      const cell = row.querySelector(`td[data-col="${col}"]`);
+      return cell ? (cell.textContent || '').trim() : '';
+    }
 
-    devices_510k = data.get("devices_510k") or []
-    devices_pma = data.get("devices_pma") or []
+    function uniqueSorted(values) {
+      const set = new Set(values.filter(v => v !== ''));
+      return Array.from(set).sort((a,b) => a.localeCompare(b, undefined, {numeric:true, sensitivity:'base'}));
+    }
 
-    devices_rows_510k = [
-        (
-            f"<tr>"
-            f"<td data-col='device_type'>510k</td>"
-            f"<td data-col='k_number'>{esc(str(d.get('k_number','')))}</td>"
-            f"<td data-col='pma_number'></td>"
-            f"<td data-col='device_name'>{esc(str(d.get('device_name','')))}</td>"
-            f"<td data-col='trade_name'></td>"
-            f"<td data-col='generic_name'></td>"
-            f"<td data-col='applicant'>{esc(str(d.get('applicant','')))}</td>"
-            f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-            f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-            f"<td data-col='advisory_committee'>{esc(str(d.get('advisory_committee','')))}</td>"
-            f"<td data-col='clearance_type'>{esc(str(d.get('clearance_type','')))}</td>"
-            f"<td data-col='decision_code'>{esc(str(d.get('decision_code','')))}</td>"
-            f"<td data-col='decision_date'>{esc(str(d.get('decision_date','')))}</td>"
-            f"</tr>"
-        )
-        for d in devices_510k
-    ]
+    function getActiveFilters(uptoIndexExclusive) {
+      const active = {};
+      filterSelects.forEach((sel, idx) => {
+        if (idx >= uptoIndexExclusive) return;
+        const col = sel.getAttribute('data-filter');
+        const val = (sel.value || '').trim();
+        if (val !== '') active[col] = val;
+      });
+      return active;
+    }
 
-    devices_rows_pma = [
-        (
-            f"<tr>"
-            f"<td data-col='device_type'>PMA</td>"
-            f"<td data-col='k_number'></td>"
-            f"<td data-col='pma_number'>{esc(str(d.get('pma_number','')))}</td>"
-            f"<td data-col='device_name'></td>"
-            f"<td data-col='trade_name'>{esc(str(d.get('trade_name','')))}</td>"
-            f"<td data-col='generic_name'>{esc(str(d.get('generic_name','')))}</td>"
-            f"<td data-col='applicant'>{esc(str(d.get('applicant','')))}</td>"
-            f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-            f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-            f"<td data-col='advisory_committee'>{esc(str(d.get('advisory_committee','')))}</td>"
-            f"<td data-col='clearance_type'></td>"
-            f"<td data-col='decision_code'>{esc(str(d.get('decision_code','')))}</td>"
-            f"<td data-col='decision_date'>{esc(str(d.get('decision_date','')))}</td>"
-            f"</tr>"
-        )
-        for d in devices_pma
-    ]
+    function rowMatchesActive(row, active) {
+      for (const [col, val] of Object.entries(active)) {
+        if (getCellText(row, col) !== val) return false;
+      }
+      return true;
+    }
+
+    function applyFilters() {
+      const active = {};
+      filterSelects.forEach(sel => {
+        const col = sel.getAttribute('data-filter');
+        const val = (sel.value || '').trim();
+        if (val !== '') active[col] = val;
+      });
 
-    devices_rows = "\n".join(devices_rows_510k + devices_rows_pma)
-    if not devices_rows:
-        devices_rows = "<tr><td colspan=13>(none)</td></tr>"
+      const rows = Array.from(tbody.querySelectorAll('tr'));
+      rows.forEach(row => {
+        if (row.children.length === 1 && row.textContent.includes('(none)')) {
+          row.style.display = '';
+          return;
+        }
+        row.style.display = rowMatchesActive(row, active) ? '' : 'none';
+      });
+    }
 
-    device_event_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='mdr_report_key'>{esc(str(d.get('mdr_report_key','')))}</td>"
-        f"<td data-col='report_number'>{esc(str(d.get('report_number','')))}</td>"
-        f"<td data-col='date_received'>{esc(str(d.get('date_received','')))}</td>"
-        f"<td data-col='date_of_event'>{esc(str(d.get('date_of_event','')))}</td>"
-        f"<td data-col='report_date'>{esc(str(d.get('report_date','')))}</td>"
-        f"<td data-col='event_type'>{esc(str(d.get('event_type','')))}</td>"
-        f"<td data-col='manufacturer_name'>{esc(str(d.get('manufacturer_name','')))}</td>"
-        f"<td data-col='brand_name'>{esc(str(d.get('brand_name','')))}</td>"
-        f"<td data-col='generic_name'>{esc(str(d.get('generic_name','')))}</td>"
-        f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-        f"<td data-col='product_problem_flag'>{esc(str(d.get('product_problem_flag','')))}</td>"
-        f"<td data-col='adverse_event_flag'>{esc(str(d.get('adverse_event_flag','')))}</td>"
-        f"<td data-col='product_problem_text'>{esc(str(d.get('product_problem_text','')))}</td>"
-        f"<td data-col='patient_problem_text'>{esc(str(d.get('patient_problem_text','')))}</td>"
-        f"</tr>"
-        for d in (data.get("device_adverse_events") or [])
-    ) or "<tr><td colspan=14>(none)</td></tr>"
+    function updateCascadingFilters() {
+      const allRows = Array.from(tbody.querySelectorAll('tr'));
+      const dataRows = allRows.filter(r => !(r.children.length === 1 && r.textContent.includes('(none)')));
 
-    device_enforcement_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='recall_number'>{esc(str(d.get('recall_number','')))}</td>"
-        f"<td data-col='classification'>{esc(str(d.get('classification','')))}</td>"
-        f"<td data-col='status'>{esc(str(d.get('status','')))}</td>"
-        f"<td data-col='report_date'>{esc(str(d.get('report_date','')))}</td>"
-        f"<td data-col='recall_initiation_date'>{esc(str(d.get('recall_initiation_date','')))}</td>"
-        f"<td data-col='center_classification_date'>{esc(str(d.get('center_classification_date','')))}</td>"
-        f"<td data-col='termination_date'>{esc(str(d.get('termination_date','')))}</td>"
-        f"<td data-col='recalling_firm'>{esc(str(d.get('recalling_firm','')))}</td>"
-        f"<td data-col='product_description'>{esc(str(d.get('product_description','')))}</td>"
-        f"<td data-col='reason_for_recall'>{esc(str(d.get('reason_for_recall','')))}</td>"
-        f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-        f"<td data-col='product_type'>{esc(str(d.get('product_type','')))}</td>"
-        f"<td data-col='distribution_pattern'>{esc(str(d.get('distribution_pattern','')))}</td>"
-        f"<td data-col='code_info'>{esc(str(d.get('code_info','')))}</td>"
-        f"<td data-col='city'>{esc(str(d.get('city','')))}</td>"
-        f"<td data-col='state'>{esc(str(d.get('state','')))}</td>"
-        f"<td data-col='country'>{esc(str(d.get('country','')))}</td>"
-        f"<td data-col='voluntary_mandated'>{esc(str(d.get('voluntary_mandated','')))}</td>"
-        f"<td data-col='event_id'>{esc(str(d.get('event_id','')))}</td>"
-        f"</tr>"
-        for d in (data.get("device_enforcements") or [])
-    ) or "<tr><td colspan=19>(none)</td></tr>"
+      filterSelects.forEach((sel, idx) => {
+        const col = sel.getAttribute('data-filter');
+        const prevActive = getActiveFilters(idx);
+        const eligibleRows = dataRows.filter(r => rowMatchesActive(r, prevActive));
+        const vals = eligibleRows.map(r => getCellText(r, col));
+        const uniques = uniqueSorted(vals);
 
-    device_recall_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='recall_number'>{esc(str(d.get('recall_number','')))}</td>"
-        f"<td data-col='status'>{esc(str(d.get('status','')))}</td>"
-        f"<td data-col='report_date'>{esc(str(d.get('report_date','')))}</td>"
-        f"<td data-col='recall_initiation_date'>{esc(str(d.get('recall_initiation_date','')))}</td>"
-        f"<td data-col='termination_date'>{esc(str(d.get('termination_date','')))}</td>"
-        f"<td data-col='recalling_firm'>{esc(str(d.get('recalling_firm','')))}</td>"
-        f"<td data-col='product_description'>{esc(str(d.get('product_description','')))}</td>"
-        f"<td data-col='reason_for_recall'>{esc(str(d.get('reason_for_recall','')))}</td>"
-        f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-        f"<td data-col='product_type'>{esc(str(d.get('product_type','')))}</td>"
-        f"<td data-col='distribution_pattern'>{esc(str(d.get('distribution_pattern','')))}</td>"
-        f"<td data-col='code_info'>{esc(str(d.get('code_info','')))}</td>"
-        f"<td data-col='city'>{esc(str(d.get('city','')))}</td>"
-        f"<td data-col='state'>{esc(str(d.get('state','')))}</td>"
-        f"<td data-col='country'>{esc(str(d.get('country','')))}</td>"
-        f"<td data-col='voluntary_mandated'>{esc(str(d.get('voluntary_mandated','')))}</td>"
-        f"<td data-col='event_id'>{esc(str(d.get('event_id','')))}</td>"
-        f"</tr>"
-        for d in (data.get("device_recalls") or [])
-    ) or "<tr><td colspan=17>(none)</td></tr>"
+        const current = (sel.value || '').trim();
+        while (sel.options.length > 1) sel.remove(1);
+        uniques.forEach(v => {
+          const opt = document.createElement('option');
+          opt.value = v;
+          opt.textContent = v;
+          sel.appendChild(opt);
+        });
 
-    device_reglist_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='registration_number'>{esc(str(d.get('registration_number','')))}</td>"
-        f"<td data-col='fei_number'>{esc(str(d.get('fei_number','')))}</td>"
-        f"<td data-col='registration_status_code'>{esc(str(d.get('registration_status_code','')))}</td>"
-        f"<td data-col='facility_name'>{esc(str(d.get('facility_name','')))}</td>"
-        f"<td data-col='facility_city'>{esc(str(d.get('facility_city','')))}</td>"
-        f"<td data-col='facility_state_code'>{esc(str(d.get('facility_state_code','')))}</td>"
-        f"<td data-col='facility_iso_country_code'>{esc(str(d.get('facility_iso_country_code','')))}</td>"
-        f"<td data-col='owner_operator_number'>{esc(str(d.get('owner_operator_number','')))}</td>"
-        f"<td data-col='owner_operator_firm_name'>{esc(str(d.get('owner_operator_firm_name','')))}</td>"
-        f"<td data-col='establishment_type'>{esc(str(d.get('establishment_type','')))}</td>"
-        f"<td data-col='proprietary_name'>{esc(str(d.get('proprietary_name','')))}</td>"
-        f"<td data-col='product_code'>{esc(str(d.get('product_code','')))}</td>"
-        f"<td data-col='k_number'>{esc(str(d.get('k_number','')))}</td>"
-        f"<td data-col='pma_number'>{esc(str(d.get('pma_number','')))}</td>"
-        f"<td data-col='device_class'>{esc(str(d.get('device_class','')))}</td>"
-        f"<td data-col='regulation_number'>{esc(str(d.get('regulation_number','')))}</td>"
-        f"</tr>"
-        for d in (data.get("device_registrationlisting") or [])
-    ) or "<tr><td colspan=16>(none)</td></tr>"
+        if (current !== '' && !uniques.includes(current)) {
+          sel.value = '';
+        } else {
+          sel.value = current;
+        }
+      });
 
-    transparency_crl_rows = "\n".join(
-        f"<tr>"
-        f"<td data-col='letter_date'>{esc(str(d.get('letter_date','')))}</td>"
-        f"<td data-col='letter_type'>{esc(str(d.get('letter_type','')))}</td>"
-        f"<td data-col='application_number'>{esc(str(d.get('application_number','')))}</td>"
-        f"<td data-col='approval_name'>{esc(str(d.get('approval_name','')))}</td>"
-        f"<td data-col='approval_center'>{esc(str(d.get('approval_center','')))}</td>"
-        f"<td data-col='company_name'>{esc(str(d.get('company_name','')))}</td>"
-        f"<td data-col='file_name'>{esc(str(d.get('file_name','')))}</td>"
-        f"</tr>"
-        for d in (data.get("transparency_crl") or [])
-    ) or "<tr><td colspan=7>(none)</td></tr>"
+      applyFilters();
+    }
+
+    filterSelects.forEach(sel => {
+      sel.addEventListener('change', () => {
+        updateCascadingFilters();
+      });
+    });
+
+    let sortState = { col: null, dir: 'asc' };
+
+    function clearHeaderIndicators() {
+      headers.forEach(h => h.classList.remove('sorted-asc', 'sorted-desc'));
+    }
+
+    function sortRows(col, dir) {
+      const rows = Array.from(tbody.querySelectorAll('tr'))
+        .filter(r => !(r.children.length === 1 && r.textContent.includes('(none)')));
+
+      rows.sort((ra, rb) => {
+        const a = getCellText(ra, col);
+        const b = getCellText(rb, col);
+        const cmp = a.localeCompare(b, undefined, {numeric:true, sensitivity:'base'});
+        return dir === 'asc' ? cmp : -cmp;
+      });
+
+      rows.forEach(r => tbody.appendChild(r));
+    }
+
+    headers.forEach(h => {
+      h.addEventListener('click', () => {
+        const col = h.getAttribute('data-sort');
+        if (!col) return;
+
+        const nextDir = (sortState.col === col && sortState.dir === 'asc') ? 'desc' : 'asc';
+        sortState = { col, dir: nextDir };
+
+        clearHeaderIndicators();
+        h.classList.add(nextDir === 'asc' ? 'sorted-asc' : 'sorted-desc');
+
+        sortRows(col, nextDir);
+        updateCascadingFilters();
+      });
+    });
+
+    updateCascadingFilters();
+  }
 
-    company_esc = esc(data.get('company', ''))
+__INIT_CALLS__
+})();
+</script>
+</body></html>
+"""
+_HTML_HEAD, _HTML_ICON, _HTML_STYLE, _HTML_CONTAINER, _HTML_SCRIPT, _HTML_TAIL = re.split(
+    r"__(?:COMPANY|ICON_HREF|CARDS|INIT_CALLS)__", _HTML_TPL
+)
 
-    drug_card = """
+# Cards, split around where their table rows go
+_DRUG_CARD_OPEN, _DRUG_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Approved Drugs</h3>
     <table id="drugs-table">
@@ -300,9 +210,9 @@ def _render_html(
       <tbody>__DRUGS_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DRUGS_ROWS__")
 
-    ndc_card = """
+_NDC_CARD_OPEN, _NDC_CARD_CLOSE = """
   <div class=\"card\">
     <h3 class=\"title\">openFDA: NDC Directory</h3>
     <table id=\"ndc-table\">
@@ -337,9 +247,9 @@ def _render_html(
       <tbody>__NDC_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__NDC_ROWS__")
 
-    adverse_card = """
+_ADVERSE_CARD_OPEN, _ADVERSE_CARD_CLOSE = """
   <div class=\"card\">
     <h3 class=\"title\">openFDA: Drug Adverse Events (FAERS)</h3>
     <table id=\"adverse-table\">
@@ -370,9 +280,9 @@ def _render_html(
       <tbody>__ADVERSE_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__ADVERSE_ROWS__")
 
-    enforcement_card = """
+_ENFORCEMENT_CARD_OPEN, _ENFORCEMENT_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Drug Enforcement Reports (Recalls)</h3>
     <table id="enforcement-table">
@@ -413,9 +323,9 @@ def _render_html(
       <tbody>__ENFORCEMENT_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__ENFORCEMENT_ROWS__")
 
-    label_card = """
+_LABEL_CARD_OPEN, _LABEL_CARD_CLOSE = """
     <div class="card">
         <h3 class="title">openFDA: Drug Product Labeling</h3>
         <table id="labels-table">
@@ -448,9 +358,9 @@ def _render_html(
         <tbody>__LABEL_ROWS__</tbody>
         </table>
     </div>
-    """
-    
-    shortages_card = """
+    """.split("__LABEL_ROWS__")
+
+_SHORTAGES_CARD_OPEN, _SHORTAGES_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Drug Shortages</h3>
     <table id="shortages-table">
@@ -487,9 +397,9 @@ def _render_html(
       <tbody>__SHORTAGES_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__SHORTAGES_ROWS__")
 
-    device_card = """
+_DEVICE_CARD_OPEN, _DEVICE_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Approved / Cleared Medical Devices</h3>
     <table id="devices-table">
@@ -528,9 +438,9 @@ def _render_html(
       <tbody>__DEVICES_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DEVICES_ROWS__")
 
-    device_event_card = """
+_DEVICE_EVENT_CARD_OPEN, _DEVICE_EVENT_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Device Adverse Events (MDR)</h3>
     <table id="device-events-table">
@@ -571,9 +481,9 @@ def _render_html(
       <tbody>__DEVICE_EVENT_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DEVICE_EVENT_ROWS__")
 
-    device_enforcement_card = """
+_DEVICE_ENFORCEMENT_CARD_OPEN, _DEVICE_ENFORCEMENT_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Device Enforcement Reports (Recalls)</h3>
     <table id="device-enforcement-table">
@@ -624,9 +534,9 @@ def _render_html(
       <tbody>__DEVICE_ENFORCEMENT_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DEVICE_ENFORCEMENT_ROWS__")
 
-    device_recall_card = """
+_DEVICE_RECALL_CARD_OPEN, _DEVICE_RECALL_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Device Recall Reports</h3>
     <table id="device-recall-table">
@@ -673,9 +583,9 @@ def _render_html(
       <tbody>__DEVICE_RECALL_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DEVICE_RECALL_ROWS__")
 
-    device_reglist_card = """
+_DEVICE_REGLIST_CARD_OPEN, _DEVICE_REGLIST_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Device Registration &amp; Listing</h3>
     <table id="device-reglist-table">
@@ -720,9 +630,9 @@ def _render_html(
       <tbody>__DEVICE_REGLIST_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__DEVICE_REGLIST_ROWS__")
 
-    transparency_crl_card = """
+_TRANSPARENCY_CRL_CARD_OPEN, _TRANSPARENCY_CRL_CARD_CLOSE = """
   <div class="card">
     <h3 class="title">openFDA: Transparency – Complete Response Letters (CRL)</h3>
     <table id="transparency-crl-table">
@@ -749,8 +659,288 @@ def _render_html(
       <tbody>__TRANSPARENCY_CRL_ROWS__</tbody>
     </table>
   </div>
-"""
+""".split("__TRANSPARENCY_CRL_ROWS__")
+
+# Table rows with data attributes for client-side filtering
+def _drugs_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='brand_name'>{_esc(str(d.get('brand_name','')))}</td>"
+        f"<td data-col='active_ingredient'>{_esc(str(d.get('active_ingredient','')))}</td>"
+        f"<td data-col='dosage_form'>{_esc(str(d.get('dosage_form','')))}</td>"
+        f"<td data-col='route'>{_esc(str(d.get('route','')))}</td>"
+        f"<td data-col='marketing_status'>{_esc(str(d.get('marketing_status','')))}</td>"
+        f"<td data-col='application'>{_esc(str(d.get('application','')))}</td>"
+        f"<td data-col='product_no'>{_esc(str(d.get('product_no','')))}</td>"
+        f"</tr>"
+        for d in (data.get("drugs_approved") or [])
+    ]) or "<tr><td colspan=7>(none)</td></tr>"
+
+def _ndc_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='product_ndc'>{_esc(str(d.get('product_ndc','')))}</td>"
+        f"<td data-col='brand_name'>{_esc(str(d.get('brand_name','')))}</td>"
+        f"<td data-col='generic_name'>{_esc(str(d.get('generic_name','')))}</td>"
+        f"<td data-col='labeler_name'>{_esc(str(d.get('labeler_name','')))}</td>"
+        f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+        f"<td data-col='dosage_form'>{_esc(str(d.get('dosage_form','')))}</td>"
+        f"<td data-col='route'>{_esc(str(d.get('route','')))}</td>"
+        f"<td data-col='marketing_category'>{_esc(str(d.get('marketing_category','')))}</td>"
+        f"<td data-col='product_type'>{_esc(str(d.get('product_type','')))}</td>"
+        f"<td data-col='finished'>{_esc(str(d.get('finished','')))}</td>"
+        f"<td data-col='listing_expiration_date'>{_esc(str(d.get('listing_expiration_date','')))}</td>"
+        f"</tr>"
+        for d in (data.get("ndc_directory") or [])
+    ]) or "<tr><td colspan=11>(none)</td></tr>"
+
+def _adverse_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='safetyreportid'>{_esc(str(d.get('safetyreportid','')))}</td>"
+        f"<td data-col='receivedate'>{_esc(str(d.get('receivedate','')))}</td>"
+        f"<td data-col='receiptdate'>{_esc(str(d.get('receiptdate','')))}</td>"
+        f"<td data-col='serious'>{_esc(str(d.get('serious','')))}</td>"
+        f"<td data-col='patientsex'>{_esc(str(d.get('patientsex','')))}</td>"
+        f"<td data-col='patientagegroup'>{_esc(str(d.get('patientagegroup','')))}</td>"
+        f"<td data-col='medicinalproduct'>{_esc(str(d.get('medicinalproduct','')))}</td>"
+        f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+        f"<td data-col='reaction_pt'>{_esc(str(d.get('reaction_pt','')))}</td>"
+        f"</tr>"
+        for d in (data.get("drug_adverse_events") or [])
+    ]) or "<tr><td colspan=9>(none)</td></tr>"
+
+def _enforcement_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='recall_number'>{_esc(str(d.get('recall_number','')))}</td>"
+        f"<td data-col='classification'>{_esc(str(d.get('classification','')))}</td>"
+        f"<td data-col='status'>{_esc(str(d.get('status','')))}</td>"
+        f"<td data-col='report_date'>{_esc(str(d.get('report_date','')))}</td>"
+        f"<td data-col='recall_initiation_date'>{_esc(str(d.get('recall_initiation_date','')))}</td>"
+        f"<td data-col='termination_date'>{_esc(str(d.get('termination_date','')))}</td>"
+        f"<td data-col='recalling_firm'>{_esc(str(d.get('recalling_firm','')))}</td>"
+        f"<td data-col='product_description'>{_esc(str(d.get('product_description','')))}</td>"
+        f"<td data-col='reason_for_recall'>{_esc(str(d.get('reason_for_recall','')))}</td>"
+        f"<td data-col='distribution_pattern'>{_esc(str(d.get('distribution_pattern','')))}</td>"
+        f"<td data-col='code_info'>{_esc(str(d.get('code_info','')))}</td>"
+        f"<td data-col='city'>{_esc(str(d.get('city','')))}</td>"
+        f"<td data-col='state'>{_esc(str(d.get('state','')))}</td>"
+        f"<td data-col='country'>{_esc(str(d.get('country','')))}</td>"
+        f"</tr>"
+        for d in (data.get("drug_enforcements") or [])
+    ]) or "<tr><td colspan=14>(none)</td></tr>"
+
+def _label_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='set_id'>{_esc(str(d.get('set_id','')))}</td>"
+        f"<td data-col='effective_time'>{_esc(str(d.get('effective_time','')))}</td>"
+        f"<td data-col='brand_name'>{_esc(str(d.get('brand_name','')))}</td>"
+        f"<td data-col='generic_name'>{_esc(str(d.get('generic_name','')))}</td>"
+        f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+        f"<td data-col='product_ndc'>{_esc(str(d.get('product_ndc','')))}</td>"
+        f"<td data-col='package_ndc'>{_esc(str(d.get('package_ndc','')))}</td>"
+        f"<td data-col='route'>{_esc(str(d.get('route','')))}</td>"
+        f"<td data-col='dosage_form'>{_esc(str(d.get('dosage_form','')))}</td>"
+        f"<td data-col='application_number'>{_esc(str(d.get('application_number','')))}</td>"
+        f"</tr>"
+        for d in (data.get("drug_labels") or [])
+    ]) or "<tr><td colspan=10>(none)</td></tr>"
+
+def _shortages_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='package_ndc'>{_esc(str(d.get('package_ndc','')))}</td>"
+        f"<td data-col='generic_name'>{_esc(str(d.get('generic_name','')))}</td>"
+        f"<td data-col='proprietary_name'>{_esc(str(d.get('proprietary_name','')))}</td>"
+        f"<td data-col='company_name'>{_esc(str(d.get('company_name','')))}</td>"
+        f"<td data-col='status'>{_esc(str(d.get('status','')))}</td>"
+        f"<td data-col='availability'>{_esc(str(d.get('availability','')))}</td>"
+        f"<td data-col='shortage_reason'>{_esc(str(d.get('shortage_reason','')))}</td>"
+        f"<td data-col='dosage_form'>{_esc(str(d.get('dosage_form','')))}</td>"
+        f"<td data-col='strength'>{_esc(str(d.get('strength','')))}</td>"
+        f"<td data-col='therapeutic_category'>{_esc(str(d.get('therapeutic_category','')))}</td>"
+        f"<td data-col='update_date'>{_esc(str(d.get('update_date','')))}</td>"
+        f"<td data-col='initial_posting_date'>{_esc(str(d.get('initial_posting_date','')))}</td>"
+        f"</tr>"
+        for d in (data.get("drug_shortages") or [])
+    ]) or "<tr><td colspan=12>(none)</td></tr>"
+
+def _devices_rows(data: dict) -> str:
+    devices_510k = data.get("devices_510k") or []
+    devices_pma = data.get("devices_pma") or []
+
+    devices_rows_510k = [
+        (
+            f"<tr>"
+            f"<td data-col='device_type'>510k</td>"
+            f"<td data-col='k_number'>{_esc(str(d.get('k_number','')))}</td>"
+            f"<td data-col='pma_number'></td>"
+            f"<td data-col='device_name'>{_esc(str(d.get('device_name','')))}</td>"
+            f"<td data-col='trade_name'></td>"
+            f"<td data-col='generic_name'></td>"
+            f"<td data-col='applicant'>{_esc(str(d.get('applicant','')))}</td>"
+            f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+            f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+            f"<td data-col='advisory_committee'>{_esc(str(d.get('advisory_committee','')))}</td>"
+            f"<td data-col='clearance_type'>{_esc(str(d.get('clearance_type','')))}</td>"
+            f"<td data-col='decision_code'>{_esc(str(d.get('decision_code','')))}</td>"
+            f"<td data-col='decision_date'>{_esc(str(d.get('decision_date','')))}</td>"
+            f"</tr>"
+        )
+        for d in devices_510k
+    ]
+
+    devices_rows_pma = [
+        (
+            f"<tr>"
+            f"<td data-col='device_type'>PMA</td>"
+            f"<td data-col='k_number'></td>"
+            f"<td data-col='pma_number'>{_esc(str(d.get('pma_number','')))}</td>"
+            f"<td data-col='device_name'></td>"
+            f"<td data-col='trade_name'>{_esc(str(d.get('trade_name','')))}</td>"
+            f"<td data-col='generic_name'>{_esc(str(d.get('generic_name','')))}</td>"
+            f"<td data-col='applicant'>{_esc(str(d.get('applicant','')))}</td>"
+            f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+            f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+            f"<td data-col='advisory_committee'>{_esc(str(d.get('advisory_committee','')))}</td>"
+            f"<td data-col='clearance_type'></td>"
+            f"<td data-col='decision_code'>{_esc(str(d.get('decision_code','')))}</td>"
+            f"<td data-col='decision_date'>{_esc(str(d.get('decision_date','')))}</td>"
+            f"</tr>"
+        )
+        for d in devices_pma
+    ]
+
+    return "\n".join(devices_rows_510k + devices_rows_pma) or "<tr><td colspan=13>(none)</td></tr>"
+
+def _device_event_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='mdr_report_key'>{_esc(str(d.get('mdr_report_key','')))}</td>"
+        f"<td data-col='report_number'>{_esc(str(d.get('report_number','')))}</td>"
+        f"<td data-col='date_received'>{_esc(str(d.get('date_received','')))}</td>"
+        f"<td data-col='date_of_event'>{_esc(str(d.get('date_of_event','')))}</td>"
+        f"<td data-col='report_date'>{_esc(str(d.get('report_date','')))}</td>"
+        f"<td data-col='event_type'>{_esc(str(d.get('event_type','')))}</td>"
+        f"<td data-col='manufacturer_name'>{_esc(str(d.get('manufacturer_name','')))}</td>"
+        f"<td data-col='brand_name'>{_esc(str(d.get('brand_name','')))}</td>"
+        f"<td data-col='generic_name'>{_esc(str(d.get('generic_name','')))}</td>"
+        f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+        f"<td data-col='product_problem_flag'>{_esc(str(d.get('product_problem_flag','')))}</td>"
+        f"<td data-col='adverse_event_flag'>{_esc(str(d.get('adverse_event_flag','')))}</td>"
+        f"<td data-col='product_problem_text'>{_esc(str(d.get('product_problem_text','')))}</td>"
+        f"<td data-col='patient_problem_text'>{_esc(str(d.get('patient_problem_text','')))}</td>"
+        f"</tr>"
+        for d in (data.get("device_adverse_events") or [])
+    ]) or "<tr><td colspan=14>(none)</td></tr>"
+
+def _device_enforcement_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='recall_number'>{_esc(str(d.get('recall_number','')))}</td>"
+        f"<td data-col='classification'>{_esc(str(d.get('classification','')))}</td>"
+        f"<td data-col='status'>{_esc(str(d.get('status','')))}</td>"
+        f"<td data-col='report_date'>{_esc(str(d.get('report_date','')))}</td>"
+        f"<td data-col='recall_initiation_date'>{_esc(str(d.get('recall_initiation_date','')))}</td>"
+        f"<td data-col='center_classification_date'>{_esc(str(d.get('center_classification_date','')))}</td>"
+        f"<td data-col='termination_date'>{_esc(str(d.get('termination_date','')))}</td>"
+        f"<td data-col='recalling_firm'>{_esc(str(d.get('recalling_firm','')))}</td>"
+        f"<td data-col='product_description'>{_esc(str(d.get('product_description','')))}</td>"
+        f"<td data-col='reason_for_recall'>{_esc(str(d.get('reason_for_recall','')))}</td>"
+        f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+        f"<td data-col='product_type'>{_esc(str(d.get('product_type','')))}</td>"
+        f"<td data-col='distribution_pattern'>{_esc(str(d.get('distribution_pattern','')))}</td>"
+        f"<td data-col='code_info'>{_esc(str(d.get('code_info','')))}</td>"
+        f"<td data-col='city'>{_esc(str(d.get('city','')))}</td>"
+        f"<td data-col='state'>{_esc(str(d.get('state','')))}</td>"
+        f"<td data-col='country'>{_esc(str(d.get('country','')))}</td>"
+        f"<td data-col='voluntary_mandated'>{_esc(str(d.get('voluntary_mandated','')))}</td>"
+        f"<td data-col='event_id'>{_esc(str(d.get('event_id','')))}</td>"
+        f"</tr>"
+        for d in (data.get("device_enforcements") or [])
+    ]) or "<tr><td colspan=19>(none)</td></tr>"
+
+def _device_recall_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='recall_number'>{_esc(str(d.get('recall_number','')))}</td>"
+        f"<td data-col='status'>{_esc(str(d.get('status','')))}</td>"
+        f"<td data-col='report_date'>{_esc(str(d.get('report_date','')))}</td>"
+        f"<td data-col='recall_initiation_date'>{_esc(str(d.get('recall_initiation_date','')))}</td>"
+        f"<td data-col='termination_date'>{_esc(str(d.get('termination_date','')))}</td>"
+        f"<td data-col='recalling_firm'>{_esc(str(d.get('recalling_firm','')))}</td>"
+        f"<td data-col='product_description'>{_esc(str(d.get('product_description','')))}</td>"
+        f"<td data-col='reason_for_recall'>{_esc(str(d.get('reason_for_recall','')))}</td>"
+        f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+        f"<td data-col='product_type'>{_esc(str(d.get('product_type','')))}</td>"
+        f"<td data-col='distribution_pattern'>{_esc(str(d.get('distribution_pattern','')))}</td>"
+        f"<td data-col='code_info'>{_esc(str(d.get('code_info','')))}</td>"
+        f"<td data-col='city'>{_esc(str(d.get('city','')))}</td>"
+        f"<td data-col='state'>{_esc(str(d.get('state','')))}</td>"
+        f"<td data-col='country'>{_esc(str(d.get('country','')))}</td>"
+        f"<td data-col='voluntary_mandated'>{_esc(str(d.get('voluntary_mandated','')))}</td>"
+        f"<td data-col='event_id'>{_esc(str(d.get('event_id','')))}</td>"
+        f"</tr>"
+        for d in (data.get("device_recalls") or [])
+    ]) or "<tr><td colspan=17>(none)</td></tr>"
+
+def _device_reglist_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='registration_number'>{_esc(str(d.get('registration_number','')))}</td>"
+        f"<td data-col='fei_number'>{_esc(str(d.get('fei_number','')))}</td>"
+        f"<td data-col='registration_status_code'>{_esc(str(d.get('registration_status_code','')))}</td>"
+        f"<td data-col='facility_name'>{_esc(str(d.get('facility_name','')))}</td>"
+        f"<td data-col='facility_city'>{_esc(str(d.get('facility_city','')))}</td>"
+        f"<td data-col='facility_state_code'>{_esc(str(d.get('facility_state_code','')))}</td>"
+        f"<td data-col='facility_iso_country_code'>{_esc(str(d.get('facility_iso_country_code','')))}</td>"
+        f"<td data-col='owner_operator_number'>{_esc(str(d.get('owner_operator_number','')))}</td>"
+        f"<td data-col='owner_operator_firm_name'>{_esc(str(d.get('owner_operator_firm_name','')))}</td>"
+        f"<td data-col='establishment_type'>{_esc(str(d.get('establishment_type','')))}</td>"
+        f"<td data-col='proprietary_name'>{_esc(str(d.get('proprietary_name','')))}</td>"
+        f"<td data-col='product_code'>{_esc(str(d.get('product_code','')))}</td>"
+        f"<td data-col='k_number'>{_esc(str(d.get('k_number','')))}</td>"
+        f"<td data-col='pma_number'>{_esc(str(d.get('pma_number','')))}</td>"
+        f"<td data-col='device_class'>{_esc(str(d.get('device_class','')))}</td>"
+        f"<td data-col='regulation_number'>{_esc(str(d.get('regulation_number','')))}</td>"
+        f"</tr>"
+        for d in (data.get("device_registrationlisting") or [])
+    ]) or "<tr><td colspan=16>(none)</td></tr>"
+
+def _transparency_crl_rows(data: dict) -> str:
+    return "\n".join([
+        f"<tr>"
+        f"<td data-col='letter_date'>{_esc(str(d.get('letter_date','')))}</td>"
+        f"<td data-col='letter_type'>{_esc(str(d.get('letter_type','')))}</td>"
+        f"<td data-col='application_number'>{_esc(str(d.get('application_number','')))}</td>"
+        f"<td data-col='approval_name'>{_esc(str(d.get('approval_name','')))}</td>"
+        f"<td data-col='approval_center'>{_esc(str(d.get('approval_center','')))}</td>"
+        f"<td data-col='company_name'>{_esc(str(d.get('company_name','')))}</td>"
+        f"<td data-col='file_name'>{_esc(str(d.get('file_name','')))}</td>"
+        f"</tr>"
+        for d in (data.get("transparency_crl") or [])
+    ]) or "<tr><td colspan=7>(none)</td></tr>"
 
+def _iter_html(
+    data: dict,
+    icon_href: str,
+    *,
+    show_drug_approved: bool = False,
+    show_drug_ndc: bool = False,
+    show_drug_adverse_events: bool = False,
+    show_drug_enforcements: bool = False,
+    show_drug_labels: bool = False,
+    show_drug_shortages: bool = False,
+    show_device_approved: bool = False,
+    show_device_adverse_events: bool = False,
+    show_device_enforcements: bool = False,
+    show_device_recalls: bool = False,
+    show_device_registrationlisting: bool = False,
+    show_transparency_crl: bool = False,
+) -> Iterator[str]:
+    # Minimal standalone HTML (no server). Style kept compact.
     init_calls = []
     if show_drug_approved:
         init_calls.append("  initTable('drugs-table');")
@@ -777,205 +967,29 @@ def _render_html(
     if show_transparency_crl:
         init_calls.append("  initTable('transparency-crl-table');")
 
-    html_tpl = """<!doctype html>
-<html>
-  <head>
-  <meta charset="utf-8">
-  <title>IND __COMPANY__</title>
-  <link rel="icon" type="image/svg+xml" href="__ICON_HREF__">
-<style>
-:root { font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; }
-body { margin:0; background:#0b1220; color:#e6edf3; }
-header { padding:16px 24px; border-bottom:1px solid #1f2a44; position:sticky; top:0; background:#0b1220; }
-.container { padding:24px; display:grid; gap:16px; }
-.card { background:#0f172a; border:1px solid #1f2a44; border-radius:14px; padding:16px; }
-.title { font-size:20px; margin:0 0 8px; }
-table { width:100%; border-collapse: collapse; }
-th, td { text-align:left; border-bottom:1px solid #1f2a44; padding:8px; }
-th { font-weight:600; }
-th[data-sort] { cursor: pointer; user-select: none; }
-th[data-sort]::after { content: ' ↕'; font-weight: 400; color: #a4b1c6; }
-th.sorted-asc::after { content: ' ↑'; }
-th.sorted-desc::after { content: ' ↓'; }
-tr.filters th { padding-top: 6px; padding-bottom: 10px; }
-tr.filters select {
-  width: 100%;
-  background: #0b1220;
-  color: #e6edf3;
-  border: 1px solid #1f2a44;
-  border-radius: 10px;
-  padding: 6px 8px;
-}
-</style></head>
-<body>
-<header><strong>IND __COMPANY__</strong></header>
-<div class="container">
-__DRUG_CARD____DEVICE_CARD____DEVICE_EVENT_CARD____NDC_CARD____ADVERSE_CARD____ENFORCEMENT_CARD____LABEL_CARD____SHORTAGES_CARD____DEVICE_ENFORCEMENT_CARD____DEVICE_RECALL_CARD____DEVICE_REGLIST_CARD____TRANSPARENCY_CRL_CARD__
-</div>
-<script>
-(function() {
-  function initTable(tableId) {
-    const table = document.getElementById(tableId);
-    if (!table) return;
-
-    const tbody = table.querySelector('tbody');
-    const filterSelects = Array.from(table.querySelectorAll('select[data-filter]'));
-    const headers = Array.from(table.querySelectorAll('th[data-sort]'));
-
-    function getCellText(row, col) {
-      const cell = row.querySelector(`td[data-col="${col}"]`);
-      return cell ? (cell.textContent || '').trim() : '';
-    }
-
-    function uniqueSorted(values) {
-      const set = new Set(values.filter(v => v !== ''));
-      return Array.from(set).sort((a,b) => a.localeCompare(b, undefined, {numeric:true, sensitivity:'base'}));
-    }
-
-    function getActiveFilters(uptoIndexExclusive) {
-      const active = {};
-      filterSelects.forEach((sel, idx) => {
-        if (idx >= uptoIndexExclusive) return;
-        const col = sel.getAttribute('data-filter');
-        const val = (sel.value || '').trim();
-        if (val !== '') active[col] = val;
-      });
-      return active;
-    }
-
-    function rowMatchesActive(row, active) {
-      for (const [col, val] of Object.entries(active)) {
-        if (getCellText(row, col) !== val) return false;
-      }
-      return true;
-    }
-
-    function applyFilters() {
-      const active = {};
-      filterSelects.forEach(sel => {
-        const col = sel.getAttribute('data-filter');
-        const val = (sel.value || '').trim();
-        if (val !== '') active[col] = val;
-      });
-
-      const rows = Array.from(tbody.querySelectorAll('tr'));
-      rows.forEach(row => {
-        if (row.children.length === 1 && row.textContent.includes('(none)')) {
-          row.style.display = '';
-          return;
-        }
-        row.style.display = rowMatchesActive(row, active) ? '' : 'none';
-      });
-    }
-
-    function updateCascadingFilters() {
-      const allRows = Array.from(tbody.querySelectorAll('tr'));
-      const dataRows = allRows.filter(r => !(r.children.length === 1 && r.textContent.includes('(none)')));
-
-      filterSelects.forEach((sel, idx) => {
-        const col = sel.getAttribute('data-filter');
-        const prevActive = getActiveFilters(idx);
-        const eligibleRows = dataRows.filter(r => rowMatchesActive(r, prevActive));
-        const vals = eligibleRows.map(r => getCellText(r, col));
-        const uniques = uniqueSorted(vals);
-
-        const current = (sel.value || '').trim();
-        while (sel.options.length > 1) sel.remove(1);
-        uniques.forEach(v => {
-          const opt = document.createElement('option');
-          opt.value = v;
-          opt.textContent = v;
-          sel.appendChild(opt);
-        });
-
-        if (current !== '' && !uniques.includes(current)) {
-          sel.value = '';
-        } else {
-          sel.value = current;
-        }
-      });
-
-      applyFilters();
-    }
-
-    filterSelects.forEach(sel => {
-      sel.addEventListener('change', () => {
-        updateCascadingFilters();
-      });
-    });
-
-    let sortState = { col: null, dir: 'asc' };
-
-    function clearHeaderIndicators() {
-      headers.forEach(h => h.classList.remove('sorted-asc', 'sorted-desc'));
-    }
-
-    function sortRows(col, dir) {
-      const rows = Array.from(tbody.querySelectorAll('tr'))
-        .filter(r => !(r.children.length === 1 && r.textContent.includes('(none)')));
-
-      rows.sort((ra, rb) => {
-        const a = getCellText(ra, col);
-        const b = getCellText(rb, col);
-        const cmp = a.localeCompare(b, undefined, {numeric:true, sensitivity:'base'});
-        return dir === 'asc' ? cmp : -cmp;
-      });
-
-      rows.forEach(r => tbody.appendChild(r));
-    }
-
-    headers.forEach(h => {
-      h.addEventListener('click', () => {
-        const col = h.getAttribute('data-sort');
-        if (!col) return;
-
-        const nextDir = (sortState.col === col && sortState.dir === 'asc') ? 'desc' : 'asc';
-        sortState = { col, dir: nextDir };
-
-        clearHeaderIndicators();
-        h.classList.add(nextDir === 'asc' ? 'sorted-asc' : 'sorted-desc');
-
-        sortRows(col, nextDir);
-        updateCascadingFilters();
-      });
-    });
-
-    updateCascadingFilters();
-  }
-
-__INIT_CALLS__
-})();
-</script>
-</body></html>
-"""
-
-    return (
-        html_tpl
-        .replace("__COMPANY__", company_esc)
-        .replace("__ICON_HREF__", esc(icon_href))
-        .replace("__DRUG_CARD__", drug_card if show_drug_approved else "")
-        .replace("__NDC_CARD__", ndc_card if show_drug_ndc else "")
-        .replace("__ADVERSE_CARD__", adverse_card if show_drug_adverse_events else "")
-        .replace("__ENFORCEMENT_CARD__", enforcement_card if show_drug_enforcements else "")
-        .replace("__LABEL_CARD__", label_card if show_drug_labels else "")
-        .replace("__SHORTAGES_CARD__", shortages_card if show_drug_shortages else "")
-        .replace("__DEVICE_CARD__", device_card if show_device_approved else "")
-        .replace("__DEVICE_EVENT_CARD__", device_event_card if show_device_adverse_events else "")
-        .replace("__DEVICE_ENFORCEMENT_CARD__", device_enforcement_card if show_device_enforcements else "")
-        .replace("__DEVICE_RECALL_CARD__", device_recall_card if show_device_recalls else "")
-        .replace("__DEVICE_REGLIST_CARD__", device_reglist_card if show_device_registrationlisting else "")
-        .replace("__TRANSPARENCY_CRL_CARD__", transparency_crl_card if show_transparency_crl else "")
-        .replace("__DRUGS_ROWS__", drugs_rows)
-        .replace("__NDC_ROWS__", ndc_rows)
-        .replace("__ADVERSE_ROWS__", adverse_rows)
-        .replace("__ENFORCEMENT_ROWS__", enforcement_rows)
-        .replace("__LABEL_ROWS__", label_rows)
-        .replace("__SHORTAGES_ROWS__", shortages_rows)
-        .replace("__DEVICES_ROWS__", devices_rows)
-        .replace("__DEVICE_EVENT_ROWS__", device_event_rows)
-        .replace("__DEVICE_ENFORCEMENT_ROWS__", device_enforcement_rows)
-        .replace("__DEVICE_RECALL_ROWS__", device_recall_rows)
-        .replace("__DEVICE_REGLIST_ROWS__", device_reglist_rows)
-        .replace("__TRANSPARENCY_CRL_ROWS__", transparency_crl_rows)
-        .replace("__INIT_CALLS__", "\n".join(init_calls))
-    )
\ No newline at end of file
+    # Yield the page piece by piece (one chunk per shown card) so callers can stream it to disk
+    company_esc = _esc(data.get('company', ''))
+    yield from (_HTML_HEAD, company_esc, _HTML_ICON, _esc(icon_href), _HTML_STYLE, company_esc, _HTML_CONTAINER)
+    for show, card_open, rows, card_close in (
+        (show_drug_approved, _DRUG_CARD_OPEN, _drugs_rows, _DRUG_CARD_CLOSE),
+        (show_device_approved, _DEVICE_CARD_OPEN, _devices_rows, _DEVICE_CARD_CLOSE),
+        (show_device_adverse_events, _DEVICE_EVENT_CARD_OPEN, _device_event_rows, _DEVICE_EVENT_CARD_CLOSE),
+        (show_drug_ndc, _NDC_CARD_OPEN, _ndc_rows, _NDC_CARD_CLOSE),
+        (show_drug_adverse_events, _ADVERSE_CARD_OPEN, _adverse_rows, _ADVERSE_CARD_CLOSE),
+        (show_drug_enforcements, _ENFORCEMENT_CARD_OPEN, _enforcement_rows, _ENFORCEMENT_CARD_CLOSE),
+        (show_drug_labels, _LABEL_CARD_OPEN, _label_rows, _LABEL_CARD_CLOSE),
+        (show_drug_shortages, _SHORTAGES_CARD_OPEN, _shortages_rows, _SHORTAGES_CARD_CLOSE),
+        (show_device_enforcements, _DEVICE_ENFORCEMENT_CARD_OPEN, _device_enforcement_rows, _DEVICE_ENFORCEMENT_CARD_CLOSE),
+        (show_device_recalls, _DEVICE_RECALL_CARD_OPEN, _device_recall_rows, _DEVICE_RECALL_CARD_CLOSE),
+        (show_device_registrationlisting, _DEVICE_REGLIST_CARD_OPEN, _device_reglist_rows, _DEVICE_REGLIST_CARD_CLOSE),
+        (show_transparency_crl, _TRANSPARENCY_CRL_CARD_OPEN, _transparency_crl_rows, _TRANSPARENCY_CRL_CARD_CLOSE),
+    ):
+        if show:
+            yield card_open
+            yield rows(data)
+            yield card_close
+    yield from (_HTML_SCRIPT, "\n".join(init_calls), _HTML_TAIL)
+
+def _render_html(data: dict, icon_href: str, **show: bool) -> str:
+    """Render the whole page as one string; see _iter_html for the show_* flags."""
+    return "".join(_iter_html(data, icon_href, **show))
@@ -5,6 +5,7 @@ src/ind/clinical_trials/
 ├── stats.py                    stats endpoint
 ├── studies.py                  studies endpoint
 ├── version.py                  version endpoint
+├── types.py                    typed study records
 └── cli.py                      command line interface
 """
 from .client import ClinicalTrialsClient, ClinicalTrialsError
@@ -12,17 +13,20 @@ from .studies import (
     list_studies,
     iterate_studies,
     get_study,
+    get_study_raw,
     get_studies_metadata,
     get_search_areas,
     get_enums,
 )
 from .stats import (
     get_study_sizes,  # new canonical name
+    get_study_sizes_raw,
     get_field_values,
     get_field_sizes,
     get_size,         # back-compat alias
 )
 from .version import get_version
+from .types import StudySummary, summarize_studies
 
 __all__ = [
     "ClinicalTrialsClient",
@@ -31,14 +35,19 @@ __all__ = [
     "list_studies",
     "iterate_studies",
     "get_study",
+    "get_study_raw",
     "get_studies_metadata",
     "get_search_areas",
     "get_enums",
     # stats
     "get_study_sizes",
+    "get_study_sizes_raw",
     "get_field_values",
     "get_field_sizes",
     "get_size",
     # version
     "get_version",
+    # types
+    "StudySummary",
+    "summarize_studies",
 ]
\ No newline at end of file
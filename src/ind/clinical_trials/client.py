@@ -1,18 +1,49 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import tempfile
 import time
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:  # optional: faster decoding of large study pages
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 DEFAULT_BASE_URL = "https://clinicaltrials.gov/api/v2"
 DEFAULT_USER_AGENT = "ind/clinical_trials (https://github.com/marczepeda/ind)"
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/ind/clinical_trials")
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # seconds before a cached document is revalidated
 
 
 class ClinicalTrialsError(RuntimeError):
     """Raised for HTTP or API-level errors from the ClinicalTrials.gov API."""
 
 
+def _build_session() -> requests.Session:
+    """Session with a keep-alive connection pool and modest transport retries."""
+    s = requests.Session()
+    # Advertise every codec urllib3 can decode here (br/zstd when brotli or
+    # zstandard is installed); JSON payloads compress very well.
+    s.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD", "OPTIONS"),
+        raise_on_status=False,
+    )
+    s.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return s
+
+
 class ClinicalTrialsClient:
     """
     Minimal HTTP client for ClinicalTrials.gov REST API 2.0.5.
@@ -21,6 +52,10 @@ class ClinicalTrialsClient:
     -----
     * No auth is required.
     * Be gentle with rate limiting; this client supports a simple sleep-based throttle.
+    * Connections are pooled and kept alive across calls; use as a context manager
+      (or call `close()`) to release them.
+    * `request_json_cached()` keeps static documents (metadata, enums, search areas)
+      on disk under `cache_dir`; pass `cache_dir=None` to disable.
     """
 
     def __init__(
@@ -31,14 +66,27 @@ class ClinicalTrialsClient:
         user_agent: str = DEFAULT_USER_AGENT,
         rate_limit_per_sec: Optional[float] = None,
         session: Optional[requests.Session] = None,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.user_agent = user_agent
         self.rate_limit_per_sec = rate_limit_per_sec
-        self._session = session or requests.Session()
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self._session = session or _build_session()
         self._last_request_ts: Optional[float] = None
 
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "ClinicalTrialsClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     # ---- internals ---------------------------------------------------------
 
     def _respect_rate_limit(self) -> None:
@@ -54,40 +102,155 @@ class ClinicalTrialsClient:
             time.sleep(min_interval - elapsed)
         self._last_request_ts = time.monotonic()
 
-    def request_json(
+    def _send(
         self,
         method: str,
         path: str,
         *,
         params: Optional[Mapping[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """
-        Perform an HTTP request and return parsed JSON.
-
-        Raises
-        ------
-        ClinicalTrialsError on non-2xx or JSON decode failure.
-        """
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
         self._respect_rate_limit()
         url = f"{self.base_url}{path}"
-        headers = {"Accept": "application/json", "User-Agent": self.user_agent}
+        req_headers = {"Accept": "application/json", "User-Agent": self.user_agent}
+        if headers:
+            req_headers.update(headers)
         try:
             resp = self._session.request(
-                method.upper(), url, params=params, timeout=self.timeout, headers=headers
+                method.upper(), url, params=params, timeout=self.timeout, headers=req_headers
             )
         except requests.RequestException as exc:
             raise ClinicalTrialsError(f"HTTP error ({path}): {exc}") from exc
 
-        if not (200 <= resp.status_code < 300):
+        if not (200 <= resp.status_code < 300 or resp.status_code == 304):
             # Bubble up the response text to help when debugging e.g. bad params
             snippet = resp.text[:500]
             raise ClinicalTrialsError(
                 f"HTTP error ({path}): {resp.status_code} {resp.reason}; body: {snippet}"
             )
+        return resp
+
+    @staticmethod
+    def _decode(body: bytes, path: str) -> Any:
         try:
-            return resp.json()
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
         except ValueError as exc:
-            snippet = resp.text[:500] if 'resp' in locals() else ''
+            snippet = body[:500].decode("utf-8", errors="replace")
             raise ClinicalTrialsError(
                 f"Invalid JSON for {path}; body starts with: {snippet}"
-            ) from exc
\ No newline at end of file
+            ) from exc
+
+    def request_json(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Perform an HTTP request and return parsed JSON.
+
+        Raises
+        ------
+        ClinicalTrialsError on non-2xx or JSON decode failure.
+        """
+        return self._decode(self.request_bytes(method, path, params=params), path)
+
+    def request_bytes(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        """
+        Perform an HTTP request and return the undecoded response body.
+
+        Useful when the JSON is only going to be written back out (e.g. piped
+        to a file or `jq`), which saves a full decode/encode round-trip.
+
+        Raises
+        ------
+        ClinicalTrialsError on non-2xx.
+        """
+        return self._send(method, path, params=params).content
+
+    def request_json_cached(
+        self,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        GET a static document, reusing an on-disk copy across runs.
+
+        A cached body younger than `cache_ttl` is returned without touching the
+        network; an older one is revalidated with `If-None-Match` /
+        `If-Modified-Since` and reused on 304. A missing, partial or undecodable
+        entry is treated as a miss and refetched. Falls back to `request_json()`
+        when `cache_dir` is None.
+        """
+        if not self.cache_dir:
+            return self.request_json("GET", path, params=params)
+
+        key = json.dumps([self.base_url, path, sorted((params or {}).items())], default=str)
+        stem = os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest())
+        body_file, meta_file = f"{stem}.json", f"{stem}.meta.json"
+
+        cached = self._read_cache_entry(body_file, meta_file, path)
+        meta: Dict[str, Any] = cached[0] if cached else {}
+        if cached and time.time() - meta.get("fetched", 0) < self.cache_ttl:
+            return cached[1]
+
+        headers: Dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp = self._send("GET", path, params=params, headers=headers)
+        body: Optional[bytes] = None
+        if resp.status_code == 304 and cached:
+            data = cached[1]
+        else:
+            body = resp.content
+            data = self._decode(body, path)  # only cache bodies that parse
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+
+        meta["fetched"] = time.time()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Body first, each via a temp file + os.replace, so readers never see a partial file
+            if body is not None:
+                self._write_atomic(body_file, body)
+            self._write_atomic(meta_file, json.dumps(meta).encode())
+        except OSError:
+            pass  # caching is best-effort
+        return data
+
+    def _read_cache_entry(self, body_file: str, meta_file: str, path: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """(metadata, decoded body) for a cached document, or None when it is missing or unreadable."""
+        try:
+            with open(meta_file, "rb") as f:
+                meta = json.loads(f.read())
+            with open(body_file, "rb") as f:
+                data = self._decode(f.read(), path)
+        except (OSError, ValueError, ClinicalTrialsError):
+            return None  # e.g. a write cut short by a crash or a full disk: refetch
+        return (meta, data) if isinstance(meta, dict) else None
+
+    @staticmethod
+    def _write_atomic(dest: str, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, dest)
+        except BaseException:
+            os.unlink(tmp)
+            raise
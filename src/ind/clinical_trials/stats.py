@@ -5,6 +5,7 @@ from .client import ClinicalTrialsClient
 
 __all__ = [
     "get_study_sizes",
+    "get_study_sizes_raw",
     "get_field_values",
     "get_field_sizes",
     # Back-compat alias:
@@ -28,6 +29,11 @@ def get_study_sizes(client: ClinicalTrialsClient) -> Dict[str, Any]:
     return client.request_json("GET", "/stats/size")
 
 
+def get_study_sizes_raw(client: ClinicalTrialsClient) -> bytes:
+    """GET /stats/size — same as get_study_sizes(), but returns the unparsed body."""
+    return client.request_bytes("GET", "/stats/size")
+
+
 # Back-compat: old name `get_size` -> `get_study_sizes`
 def get_size(client: ClinicalTrialsClient) -> Dict[str, Any]:  # pragma: no cover
     return get_study_sizes(client)
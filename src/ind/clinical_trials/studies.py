@@ -7,6 +7,7 @@ __all__ = [
     "list_studies",
     "iterate_studies",
     "get_study",
+    "get_study_raw",
     "get_studies_metadata",
     "get_search_areas",
     "get_enums",
@@ -242,23 +243,11 @@ def iterate_studies(
 
 
 
-def get_study(
-    client: ClinicalTrialsClient,
-    nct_id: str,
-    *,
-    format: str = "json",                 # "json" | "fhir.json"
-    markup_format: str = "markdown",      # only for json
-    fields: Optional[Sequence[str]] = None,  # only for json
+def _study_params(
+    format: str,
+    markup_format: str,
+    fields: Optional[Sequence[str]],
 ) -> Dict[str, Any]:
-    """
-    GET /studies/{nctId}
-
-    Notes
-    -----
-    * Supported formats: "json" (default) and "fhir.json".
-    * For "json": you may pass `fields` (non-empty) and `markup_format` ("markdown"|"legacy").
-    * For "fhir.json": `fields` must be omitted (API returns a fixed FHIR structure).
-    """
     if format not in ("json", "fhir.json"):
         raise ValueError("Only 'json' and 'fhir.json' are supported by this client.")
 
@@ -275,28 +264,64 @@ def get_study(
         # fhir.json — fields must be unspecified
         if fields is not None:
             raise ValueError("`fields` must be omitted when format='fhir.json'.")
+    return params
+
 
+def get_study(
+    client: ClinicalTrialsClient,
+    nct_id: str,
+    *,
+    format: str = "json",                 # "json" | "fhir.json"
+    markup_format: str = "markdown",      # only for json
+    fields: Optional[Sequence[str]] = None,  # only for json
+) -> Dict[str, Any]:
+    """
+    GET /studies/{nctId}
+
+    Notes
+    -----
+    * Supported formats: "json" (default) and "fhir.json".
+    * For "json": you may pass `fields` (non-empty) and `markup_format` ("markdown"|"legacy").
+    * For "fhir.json": `fields` must be omitted (API returns a fixed FHIR structure).
+    """
+    params = _study_params(format, markup_format, fields)
     return client.request_json("GET", f"/studies/{nct_id}", params=params)
 
 
+def get_study_raw(
+    client: ClinicalTrialsClient,
+    nct_id: str,
+    *,
+    format: str = "json",
+    markup_format: str = "markdown",
+    fields: Optional[Sequence[str]] = None,
+) -> bytes:
+    """
+    GET /studies/{nctId} — same as get_study(), but returns the response body
+    as bytes without parsing it.
+    """
+    params = _study_params(format, markup_format, fields)
+    return client.request_bytes("GET", f"/studies/{nct_id}", params=params)
+
+
 def get_studies_metadata(
     client: ClinicalTrialsClient,
     *,
     include_indexed_only: bool = False,
     include_historic_only: bool = False,
 ) -> Dict[str, Any]:
-    """GET /studies/metadata — returns data model field definitions."""
+    """GET /studies/metadata — returns data model field definitions (disk-cached)."""
     params: Dict[str, Any] = {}
     _put(params, "includeIndexedOnly", bool(include_indexed_only))
     _put(params, "includeHistoricOnly", bool(include_historic_only))
-    return client.request_json("GET", "/studies/metadata", params=params)
+    return client.request_json_cached("/studies/metadata", params=params)
 
 
 def get_search_areas(client: ClinicalTrialsClient) -> Dict[str, Any]:
-    """GET /studies/search-areas — returns available search areas."""
-    return client.request_json("GET", "/studies/search-areas")
+    """GET /studies/search-areas — returns available search areas (disk-cached)."""
+    return client.request_json_cached("/studies/search-areas")
 
 
 def get_enums(client: ClinicalTrialsClient) -> Dict[str, Any]:
-    """GET /studies/enums — returns enumerations for certain fields."""
-    return client.request_json("GET", "/studies/enums")
\ No newline at end of file
+    """GET /studies/enums — returns enumerations for certain fields (disk-cached)."""
+    return client.request_json_cached("/studies/enums")
\ No newline at end of file
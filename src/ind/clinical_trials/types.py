@@ -0,0 +1,49 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+# Key paths into a /studies record (JSON format).
+NCT_ID_PATH: Tuple[str, ...] = ("protocolSection", "identificationModule", "nctId")
+BRIEF_TITLE_PATH: Tuple[str, ...] = ("protocolSection", "identificationModule", "briefTitle")
+OVERALL_STATUS_PATH: Tuple[str, ...] = ("protocolSection", "statusModule", "overallStatus")
+
+# Module prefixes shared by the paths above, so from_json() walks each once.
+_IDENTIFICATION_PATH: Tuple[str, ...] = NCT_ID_PATH[:-1]
+_STATUS_PATH: Tuple[str, ...] = OVERALL_STATUS_PATH[:-1]
+
+
+def _get(d: Any, key: str) -> Any:
+    return d.get(key) if isinstance(d, dict) else None
+
+
+def _walk(d: Any, path: Tuple[str, ...]) -> Any:
+    """Follow `path` through nested dicts; None if any step is missing."""
+    for k in path:
+        d = _get(d, k)
+        if d is None:
+            return None
+    return d
+
+
+@dataclass(frozen=True, slots=True)
+class StudySummary:
+    """Flat, typed view of the fields most callers read from a study record."""
+    nct_id: Optional[str] = None
+    brief_title: Optional[str] = None
+    overall_status: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, study: Mapping[str, Any]) -> "StudySummary":
+        ident = _walk(study, _IDENTIFICATION_PATH)
+        status = _walk(study, _STATUS_PATH)
+        # Fall back to top-level keys for flattened/projected records.
+        return cls(
+            nct_id=_get(ident, NCT_ID_PATH[-1]) or study.get("nctId"),
+            brief_title=_get(ident, BRIEF_TITLE_PATH[-1]) or study.get("briefTitle"),
+            overall_status=_get(status, OVERALL_STATUS_PATH[-1]) or study.get("overallStatus"),
+        )
+
+
+def summarize_studies(studies: Iterable[Mapping[str, Any]]) -> List[StudySummary]:
+    """Convert raw study dicts (e.g. a page's `studies` list) into StudySummary rows."""
+    return [StudySummary.from_json(s) for s in studies]
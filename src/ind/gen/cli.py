@@ -11,488 +11,570 @@ src/ind/gen/cli.py              Command Line Interface for IND General module
 
 Usage:
 [Plot subparser methods]
+- _add_args(subparser, specs): Add arguments from (flag, keyword arguments) specs to subparser
 - add_common_plot_scat_args(subparser): Add common arguments for scatter plot related graphs
 - add_common_plot_cat_args(subparser): Add common arguments for category dependent graphs
 - add_common_plot_dist_args(subparser): Add common arguments for distribution graphs
 - add_common_plot_heat_args(subparser): Add common arguments for heatmap graphs
 - add_common_plot_stack_args(subparser): Add common arguments for stacked bar plot
 - add_common_plot_vol_args(subparser): Add common arguments for volcano plot
-
-[Main subparser method]
+- _lazy(module, name): Return a stand-in for ind.gen.{module}.{name} that imports the module on first call
+
+[Main subparser methods]
+- add_plot_subparser(): Attach the plot subparsers (ind.gen.plot) to the top-level CLI.
+- add_stat_subparser(): Attach the stat subparsers (ind.gen.stat) to the top-level CLI.
+- add_io_subparser(): Attach the io subparsers (ind.gen.io) to the top-level CLI.
+- add_com_subparser(): Attach the com subparsers (ind.gen.com) to the top-level CLI.
+- add_html_subparser(): Attach the html subparser (ind.gen.html) to the top-level CLI.
 - add_subparser(): Attach all gen-related subparsers to the top-level CLI.
 '''
 import argparse
-import datetime
+import importlib
 import sys # might use later
 from rich import print as rprint # might use later
 
-from . import com, io, plot as p, stat as st, html as ht
-from ..utils import parse_tuple_int, parse_tuple_float
+from . import com, io
+from ..utils import parse_tuple_int, parse_tuple_float, TimestampedName
 
-# Plot subparser methods
-def add_common_plot_scat_args(subparser):
+def _lazy(module: str, name: str):
     '''
-    add_common_plot_scat_args(subparser): Add common arguments for scatter plot related graphs
+    _lazy(module, name): Return a stand-in for ind.gen.{module}.{name} that imports the module on first call
+
+    plot, stat & html (via plot) pull in matplotlib/seaborn/scipy; deferring them keeps `ind --help` and other commands fast.
     '''
+    def func(*args, **kwargs):
+        return getattr(importlib.import_module(f"{__package__}.{module}"), name)(*args, **kwargs)
+    func.__name__ = func.__qualname__ = name
+    return func
+
+# Plot argument defaults & help shared across the spec tuples below
+_ARIAL, _BOLD, _LINEAR, _UPPER_LEFT = "Arial", "bold", "linear", "upper left"
+_BLACK, _COLORBLIND = "black", "colorblind"
+_FIGSIZE_HELP = "Figure size formatted as 'width,height'"
+
+# Values matplotlib accepts for axis scales, named font weights & legend locations; argparse rejects others before plotting
+_SCALES = ("linear", "log", "symlog", "logit")
+_WEIGHTS = ("ultralight", "light", "normal", "regular", "book", "medium", "roman", "semibold", "demibold", "demi", "bold", "heavy", "extra bold", "black")
+_LEGEND_LOCS = ("best", "upper right", "upper left", "lower left", "lower right", "right", "center left", "center right", "lower center", "upper center", "center")
+
+# Plot argument specs: (flag, add_argument() keyword arguments), built once at import
+_LEGEND_HTML_ARGS = (
+    ('--legend_columnspacing', dict(type=int, default=argparse.SUPPRESS, help='space between columns in legend; only for html plots')),
+    ('--legend_handletextpad', dict(type=float, default=argparse.SUPPRESS, help='space between marker and text in legend; only for html plots')),
+    ('--legend_labelspacing', dict(type=float, default=argparse.SUPPRESS, help='vertical space between entries in legend; only for html plots')),
+    ('--legend_borderpad', dict(type=float, default=argparse.SUPPRESS, help='padding inside legend box; only for html plots')),
+    ('--legend_handlelength', dict(type=float, default=argparse.SUPPRESS, help='marker length in legend; only for html plots')),
+    ('--legend_size_html_multiplier', dict(type=float, default=argparse.SUPPRESS, help='legend size multiplier for html plots')),
+)
+
+_SCAT_ARGS = (
     # scat(): Required arguments
-    subparser.add_argument("--df", help="Input dataframe file path", type=str, required=True)
-    subparser.add_argument("--x", help="X-axis column", type=str, required=True)
-    subparser.add_argument("--y", help="Y-axis column", type=str, required=True)
+    ("--df", dict(help="Input dataframe file path", type=str, required=True)),
+    ("--x", dict(help="X-axis column", type=str, required=True)),
+    ("--y", dict(help="Y-axis column", type=str, required=True)),
 
     # Optional core arguments
-    subparser.add_argument("--cols", type=str, help="Color column name")
-    subparser.add_argument("--cols_ord", nargs="+", help="Column order (list of values)")
-    subparser.add_argument("--cols_exclude", nargs="+", help="Columns to exclude from coloring")
-    subparser.add_argument("--stys", type=str, help="Style column name")
-    subparser.add_argument("--stys_order", nargs="+", help="Style order (list of values)")
-    subparser.add_argument("--mark_order", nargs="+", help="Marker order (list of marker styles)")
-    subparser.add_argument("--label", type=str, help="Column name for point labels; static text for images, interactive tooltips for HTML")
-
-    subparser.add_argument("--dir", help="Output directory path", type=str, default='./out')
-    subparser.add_argument("--file", help="Output file name", type=str, required=False, default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_scat.png')
-    subparser.add_argument("--palette_or_cmap", type=str, default="colorblind", help="Seaborn palette or matplotlib colormap")
-    subparser.add_argument("--edgecol", type=str, default="black", help="Edge color for scatter points")
+    ("--cols", dict(type=str, help="Color column name")),
+    ("--cols_ord", dict(nargs="+", help="Column order (list of values)")),
+    ("--cols_exclude", dict(nargs="+", help="Columns to exclude from coloring")),
+    ("--stys", dict(type=str, help="Style column name")),
+    ("--stys_order", dict(nargs="+", help="Style order (list of values)")),
+    ("--mark_order", dict(nargs="+", help="Marker order (list of marker styles)")),
+    ("--label", dict(type=str, help="Column name for point labels; static text for images, interactive tooltips for HTML")),
+
+    ("--dir", dict(help="Output directory path", type=str, default='./out')),
+    ("--file", dict(help="Output file name", type=str, required=False, default=TimestampedName('_plot_scat.png'))),
+    ("--palette_or_cmap", dict(type=str, default=_COLORBLIND, help="Seaborn palette or matplotlib colormap")),
+    ("--edgecol", dict(type=str, default=_BLACK, help="Edge color for scatter points")),
 
     # Figure appearance
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(10,6), help="Figure size as a tuple: width,height")
-    subparser.add_argument("--title", type=str, default="", help="Plot title")
-    subparser.add_argument("--title_size", type=int, default=18, help="Plot title font size")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Plot title font weight (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for the title")
+    ("--figsize", dict(type=parse_tuple_int, default=(10,6), help="Figure size as a tuple: width,height")),
+    ("--title", dict(type=str, default="", help="Plot title")),
+    ("--title_size", dict(type=int, default=18, help="Plot title font size")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Plot title font weight (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for the title")),
 
     # X-axis settings
-    subparser.add_argument("--x_axis", type=str, default="", help="X-axis label")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="X-axis label font size")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="X-axis label font weight (e.g., bold)")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="X-axis label font family")
-    subparser.add_argument("--x_axis_scale", type=str, default="linear", help="X-axis scale: linear, log, etc.")
-    subparser.add_argument("--x_axis_dims", type=parse_tuple_int, default=(0,0), help="X-axis range as a tuple: start,end")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="X-axis tick labels font size")
-    subparser.add_argument("--x_ticks_rot", type=int, default=0, help="Rotation angle of X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
-    subparser.add_argument("--x_ticks", nargs="+", help="Specific tick values for X-axis")
+    ("--x_axis", dict(type=str, default="", help="X-axis label")),
+    ("--x_axis_size", dict(type=int, default=12, help="X-axis label font size")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="X-axis label font weight (e.g., bold)")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="X-axis label font family")),
+    ("--x_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="X-axis scale: linear, log, etc.")),
+    ("--x_axis_dims", dict(type=parse_tuple_int, default=(0,0), help="X-axis range as a tuple: start,end")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="X-axis tick labels font size")),
+    ("--x_ticks_rot", dict(type=int, default=0, help="Rotation angle of X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
+    ("--x_ticks", dict(nargs="+", help="Specific tick values for X-axis")),
 
     # Y-axis settings
-    subparser.add_argument("--y_axis", type=str, default="", help="Y-axis label")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Y-axis label font size")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Y-axis label font weight")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Y-axis label font family")
-    subparser.add_argument("--y_axis_scale", type=str, default="linear", help="Y-axis scale: linear, log, etc.")
-    subparser.add_argument("--y_axis_dims", type=parse_tuple_int, default=(0,0), help="Y-axis range as a tuple: start,end")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Y-axis tick labels font size")
-    subparser.add_argument("--y_ticks_rot", type=int, default=0, help="Rotation angle of Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
-    subparser.add_argument("--y_ticks", nargs="+", help="Specific tick values for Y-axis")
+    ("--y_axis", dict(type=str, default="", help="Y-axis label")),
+    ("--y_axis_size", dict(type=int, default=12, help="Y-axis label font size")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Y-axis label font weight")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Y-axis label font family")),
+    ("--y_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="Y-axis scale: linear, log, etc.")),
+    ("--y_axis_dims", dict(type=parse_tuple_int, default=(0,0), help="Y-axis range as a tuple: start,end")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Y-axis tick labels font size")),
+    ("--y_ticks_rot", dict(type=int, default=0, help="Rotation angle of Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
+    ("--y_ticks", dict(nargs="+", help="Specific tick values for Y-axis")),
 
     # Legend settings
-    subparser.add_argument("--legend_title", type=str, default="", help="Legend title")
-    subparser.add_argument("--legend_title_size", type=int, default=12, help="Legend title font size")
-    subparser.add_argument("--legend_size", type=int, default=9, help="Legend font size")
-    subparser.add_argument("--legend_bbox_to_anchor", type=parse_tuple_float, default=(1,1), help="Bounding box anchor position for legend")
-    subparser.add_argument("--legend_loc", type=str, default="upper left", help="Location of the legend in the plot")
-    subparser.add_argument("--legend_items", type=parse_tuple_int, default=(0,0), help="Legend item count as a tuple (used for layout)")
-    subparser.add_argument("--legend_ncol", type=int, default=1, help="Number of columns in legend")
-    subparser.add_argument('--legend_columnspacing', type=int, default=argparse.SUPPRESS, help='space between columns in legend; only for html plots')
-    subparser.add_argument('--legend_handletextpad', type=float, default=argparse.SUPPRESS, help='space between marker and text in legend; only for html plots')
-    subparser.add_argument('--legend_labelspacing', type=float, default=argparse.SUPPRESS, help='vertical space between entries in legend; only for html plots')
-    subparser.add_argument('--legend_borderpad', type=float, default=argparse.SUPPRESS, help='padding inside legend box; only for html plots')
-    subparser.add_argument('--legend_handlelength', type=float, default=argparse.SUPPRESS, help='marker length in legend; only for html plots')
-    subparser.add_argument('--legend_size_html_multiplier', type=float, default=argparse.SUPPRESS, help='legend size multiplier for html plots')
+    ("--legend_title", dict(type=str, default="", help="Legend title")),
+    ("--legend_title_size", dict(type=int, default=12, help="Legend title font size")),
+    ("--legend_size", dict(type=int, default=9, help="Legend font size")),
+    ("--legend_bbox_to_anchor", dict(type=parse_tuple_float, default=(1,1), help="Bounding box anchor position for legend")),
+    ("--legend_loc", dict(type=str, choices=_LEGEND_LOCS, default=_UPPER_LEFT, help="Location of the legend in the plot")),
+    ("--legend_items", dict(type=parse_tuple_int, default=(0,0), help="Legend item count as a tuple (used for layout)")),
+    ("--legend_ncol", dict(type=int, default=1, help="Number of columns in legend")),
+    *_LEGEND_HTML_ARGS,
 
     # Display and formatting
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize label/legend strings and replace underscores with spaces")
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize label/legend strings and replace underscores with spaces")),
+)
 
-def add_common_plot_cat_args(subparser):
-    '''
-    add_common_plot_cat_args(subparser): Add common arguments for category dependent graphs
-    '''
+_CAT_ARGS = (
     # cat(): Required arguments
-    subparser.add_argument("--df", help="Input dataframe file path", type=str, required=True)
+    ("--df", dict(help="Input dataframe file path", type=str, required=True)),
 
     # Optional core arguments
-    subparser.add_argument("--x", help="X-axis column name", type=str, default="")
-    subparser.add_argument("--y", help="Y-axis column name", type=str, default="")
-    subparser.add_argument("--cats_ord", nargs="+", help="Category column values order (x- or y-axis)")
-    subparser.add_argument("--cats_exclude", nargs="+", help="Category column values exclude (x- or y-axis)")
-    subparser.add_argument("--cols", type=str, help="Color column name for grouping")
-    subparser.add_argument("--cols_ord", nargs="+", help="Color column values order")
-    subparser.add_argument("--cols_exclude", nargs="+", help="Color column values to exclude")
-
-    subparser.add_argument("--file", type=str, help="Output filename", default='./out')
-    subparser.add_argument("--dir", type=str, help="Output directory", default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_cat.png')
-    subparser.add_argument("--palette_or_cmap", type=str, default="colorblind", help="Seaborn color palette or matplotlib colormap")
-    subparser.add_argument("--edgecol", type=str, default="black", help="Edge color for markers")
+    ("--x", dict(help="X-axis column name", type=str, default="")),
+    ("--y", dict(help="Y-axis column name", type=str, default="")),
+    ("--cats_ord", dict(nargs="+", help="Category column values order (x- or y-axis)")),
+    ("--cats_exclude", dict(nargs="+", help="Category column values exclude (x- or y-axis)")),
+    ("--cols", dict(type=str, help="Color column name for grouping")),
+    ("--cols_ord", dict(nargs="+", help="Color column values order")),
+    ("--cols_exclude", dict(nargs="+", help="Color column values to exclude")),
+
+    ("--file", dict(type=str, help="Output filename", default='./out')),
+    ("--dir", dict(type=str, help="Output directory", default=TimestampedName('_plot_cat.png'))),
+    ("--palette_or_cmap", dict(type=str, default=_COLORBLIND, help="Seaborn color palette or matplotlib colormap")),
+    ("--edgecol", dict(type=str, default=_BLACK, help="Edge color for markers")),
 
     # Error bar and style options
-    subparser.add_argument("--lw", type=int, default=1, help="Line width for plot edges")
-    subparser.add_argument("--errorbar", type=str, default="sd", help="Error bar type: sd (standard deviation), etc.")
-    subparser.add_argument("--errwid", type=float, default=1, help="Width of the error bars")
-    subparser.add_argument("--errcap", type=float, default=0.1, help="Cap size on error bars")
+    ("--lw", dict(type=int, default=1, help="Line width for plot edges")),
+    ("--errorbar", dict(type=str, default="sd", help="Error bar type: sd (standard deviation), etc.")),
+    ("--errwid", dict(type=float, default=1, help="Width of the error bars")),
+    ("--errcap", dict(type=float, default=0.1, help="Cap size on error bars")),
 
     # Figure appearance
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(10,6), help="Figure size formatted 'width,height'")
-    subparser.add_argument("--title", type=str, default="", help="Plot title text")
-    subparser.add_argument("--title_size", type=int, default=18, help="Font size of the plot title")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Font weight of the plot title (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for the plot title")
+    ("--figsize", dict(type=parse_tuple_int, default=(10,6), help="Figure size formatted 'width,height'")),
+    ("--title", dict(type=str, default="", help="Plot title text")),
+    ("--title_size", dict(type=int, default=18, help="Font size of the plot title")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight of the plot title (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for the plot title")),
 
     # X-axis settings
-    subparser.add_argument("--x_axis", type=str, default="", help="X-axis label text")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="Font size for the X-axis label")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="Font weight for the X-axis label")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="Font family for the X-axis label")
-    subparser.add_argument("--x_axis_scale", type=str, default="linear", help="Scale of X-axis (e.g., linear, log)")
-    subparser.add_argument("--x_axis_dims", type=parse_tuple_float, default=(0, 0), help="X-axis range as tuple: start,end")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="Font size for X-axis tick labels")
-    subparser.add_argument("--x_ticks_rot", type=int, default=0, help="Rotation angle for X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
-    subparser.add_argument("--x_ticks", nargs="+", help="Explicit tick values for X-axis")
+    ("--x_axis", dict(type=str, default="", help="X-axis label text")),
+    ("--x_axis_size", dict(type=int, default=12, help="Font size for the X-axis label")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for the X-axis label")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="Font family for the X-axis label")),
+    ("--x_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="Scale of X-axis (e.g., linear, log)")),
+    ("--x_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="X-axis range as tuple: start,end")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="Font size for X-axis tick labels")),
+    ("--x_ticks_rot", dict(type=int, default=0, help="Rotation angle for X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
+    ("--x_ticks", dict(nargs="+", help="Explicit tick values for X-axis")),
 
     # Y-axis settings
-    subparser.add_argument("--y_axis", type=str, default="", help="Y-axis label text")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Font size for the Y-axis label")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Font weight for the Y-axis label")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Font family for the Y-axis label")
-    subparser.add_argument("--y_axis_scale", type=str, default="linear", help="Scale of Y-axis (e.g., linear, log)")
-    subparser.add_argument("--y_axis_dims", type=parse_tuple_float, default=(0, 0), help="Y-axis range as tuple: start,end")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Font size for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_rot", type=int, default=0, help="Rotation angle for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
-    subparser.add_argument("--y_ticks", nargs="+", help="Explicit tick values for Y-axis")
+    ("--y_axis", dict(type=str, default="", help="Y-axis label text")),
+    ("--y_axis_size", dict(type=int, default=12, help="Font size for the Y-axis label")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for the Y-axis label")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Font family for the Y-axis label")),
+    ("--y_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="Scale of Y-axis (e.g., linear, log)")),
+    ("--y_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="Y-axis range as tuple: start,end")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Font size for Y-axis tick labels")),
+    ("--y_ticks_rot", dict(type=int, default=0, help="Rotation angle for Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
+    ("--y_ticks", dict(nargs="+", help="Explicit tick values for Y-axis")),
 
     # Legend settings
-    subparser.add_argument("--legend_title", type=str, default="", help="Title for the legend")
-    subparser.add_argument("--legend_title_size", type=int, default=12, help="Font size for the legend title")
-    subparser.add_argument("--legend_size", type=int, default=9, help="Font size for legend items")
-    subparser.add_argument("--legend_bbox_to_anchor", type=parse_tuple_float, default=(1, 1), help="Anchor position of the legend bounding box")
-    subparser.add_argument("--legend_loc", type=str, default="upper left", help="Location of the legend on the plot")
-    subparser.add_argument("--legend_items", type=parse_tuple_int, default=(0, 0), help="Tuple for legend item layout")
-    subparser.add_argument("--legend_ncol", type=int, default=1, help="Number of columns in the legend")
-    subparser.add_argument('--legend_columnspacing', type=int, default=argparse.SUPPRESS, help='space between columns in legend; only for html plots')
-    subparser.add_argument('--legend_handletextpad', type=float, default=argparse.SUPPRESS, help='space between marker and text in legend; only for html plots')
-    subparser.add_argument('--legend_labelspacing', type=float, default=argparse.SUPPRESS, help='vertical space between entries in legend; only for html plots')
-    subparser.add_argument('--legend_borderpad', type=float, default=argparse.SUPPRESS, help='padding inside legend box; only for html plots')
-    subparser.add_argument('--legend_handlelength', type=float, default=argparse.SUPPRESS, help='marker length in legend; only for html plots')
-    subparser.add_argument('--legend_size_html_multiplier', type=float, default=argparse.SUPPRESS, help='legend size multiplier for html plots')
+    ("--legend_title", dict(type=str, default="", help="Title for the legend")),
+    ("--legend_title_size", dict(type=int, default=12, help="Font size for the legend title")),
+    ("--legend_size", dict(type=int, default=9, help="Font size for legend items")),
+    ("--legend_bbox_to_anchor", dict(type=parse_tuple_float, default=(1, 1), help="Anchor position of the legend bounding box")),
+    ("--legend_loc", dict(type=str, choices=_LEGEND_LOCS, default=_UPPER_LEFT, help="Location of the legend on the plot")),
+    ("--legend_items", dict(type=parse_tuple_int, default=(0, 0), help="Tuple for legend item layout")),
+    ("--legend_ncol", dict(type=int, default=1, help="Number of columns in the legend")),
+    *_LEGEND_HTML_ARGS,
 
     # Display and formatting
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot in a window", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize labels and replace underscores with spaces")
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot in a window", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize labels and replace underscores with spaces")),
+)
 
-def add_common_plot_dist_args(subparser):
-    '''
-    add_common_plot_dist_args(subparser): Add common arguments for distribution graphs
-    '''
+_DIST_ARGS = (
     # dist(): Required argument
-    subparser.add_argument("--df", help="Input dataframe file path", type=str, required=True)
-    subparser.add_argument("--x", type=str, help="X-axis column name", required=True)
+    ("--df", dict(help="Input dataframe file path", type=str, required=True)),
+    ("--x", dict(type=str, help="X-axis column name", required=True)),
 
     # File output
-    subparser.add_argument("--dir", type=str, help="Output directory", default='./out')
-    subparser.add_argument("--file", type=str, help="Output file name", default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_dist.png')
+    ("--dir", dict(type=str, help="Output directory", default='./out')),
+    ("--file", dict(type=str, help="Output file name", default=TimestampedName('_plot_dist.png'))),
 
     # Optional core arguments
-    subparser.add_argument("--cols", type=str, help="Color column name for grouping")
-    subparser.add_argument("--cols_ord", nargs="+", help="Custom order for color column values")
-    subparser.add_argument("--cols_exclude", nargs="+", help="Color column values to exclude")
+    ("--cols", dict(type=str, help="Color column name for grouping")),
+    ("--cols_ord", dict(nargs="+", help="Custom order for color column values")),
+    ("--cols_exclude", dict(nargs="+", help="Color column values to exclude")),
 
     # Plot customization
-    subparser.add_argument("--bins", type=int, default=40, help="Number of bins for histogram")
-    subparser.add_argument("--log10_low", type=int, default=0, help="Log10 scale lower bound (e.g., 1 = 10^1 = 10)")
-    subparser.add_argument("--palette_or_cmap", type=str, default="colorblind", help="Seaborn color palette or matplotlib colormap")
-    subparser.add_argument("--edgecol", type=str, default="black", help="Edge color of histogram bars")
-    subparser.add_argument("--lw", type=int, default=1, help="Line width for edges")
-    subparser.add_argument("--ht", type=float, default=1.5, help="Height of the plot")
-    subparser.add_argument("--asp", type=int, default=5, help="Aspect ratio of the plot")
-    subparser.add_argument("--tp", type=float, default=0.8, help="Top padding space")
-    subparser.add_argument("--hs", type=int, default=0, help="Horizontal spacing between plots (if faceted)")
-    subparser.add_argument("--despine", action="store_true", help="Remove plot spines (despine)", default=False)
+    ("--bins", dict(type=int, default=40, help="Number of bins for histogram")),
+    ("--log10_low", dict(type=int, default=0, help="Log10 scale lower bound (e.g., 1 = 10^1 = 10)")),
+    ("--palette_or_cmap", dict(type=str, default=_COLORBLIND, help="Seaborn color palette or matplotlib colormap")),
+    ("--edgecol", dict(type=str, default=_BLACK, help="Edge color of histogram bars")),
+    ("--lw", dict(type=int, default=1, help="Line width for edges")),
+    ("--ht", dict(type=float, default=1.5, help="Height of the plot")),
+    ("--asp", dict(type=int, default=5, help="Aspect ratio of the plot")),
+    ("--tp", dict(type=float, default=0.8, help="Top padding space")),
+    ("--hs", dict(type=int, default=0, help="Horizontal spacing between plots (if faceted)")),
+    ("--despine", dict(action="store_true", help="Remove plot spines (despine)", default=False)),
 
     # Figure appearance
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(10,6), help="Figure size formatted as 'width,height'")
-    subparser.add_argument("--title", type=str, default="", help="Plot title text")
-    subparser.add_argument("--title_size", type=int, default=18, help="Plot title font size")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Plot title font weight (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for the plot title")
+    ("--figsize", dict(type=parse_tuple_int, default=(10,6), help=_FIGSIZE_HELP)),
+    ("--title", dict(type=str, default="", help="Plot title text")),
+    ("--title_size", dict(type=int, default=18, help="Plot title font size")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Plot title font weight (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for the plot title")),
 
     # X-axis
-    subparser.add_argument("--x_axis", type=str, default="", help="Label for the X-axis")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="Font size for X-axis label")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="Font weight for X-axis label")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="Font family for X-axis label")
-    subparser.add_argument("--x_axis_scale", type=str, default="linear", help="X-axis scale (e.g., linear, log)")
-    subparser.add_argument("--x_axis_dims", type=parse_tuple_float, default=(0, 0), help="X-axis range as tuple: start,end")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="Font size for X-axis tick labels")
-    subparser.add_argument("--x_ticks_rot", type=int, default=0, help="Rotation angle for X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
-    subparser.add_argument("--x_ticks", nargs="+", help="Explicit tick values for X-axis")
+    ("--x_axis", dict(type=str, default="", help="Label for the X-axis")),
+    ("--x_axis_size", dict(type=int, default=12, help="Font size for X-axis label")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for X-axis label")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="Font family for X-axis label")),
+    ("--x_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="X-axis scale (e.g., linear, log)")),
+    ("--x_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="X-axis range as tuple: start,end")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="Font size for X-axis tick labels")),
+    ("--x_ticks_rot", dict(type=int, default=0, help="Rotation angle for X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
+    ("--x_ticks", dict(nargs="+", help="Explicit tick values for X-axis")),
 
     # Y-axis
-    subparser.add_argument("--y_axis", type=str, default="", help="Label for the Y-axis")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Font size for Y-axis label")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Font weight for Y-axis label")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Font family for Y-axis label")
-    subparser.add_argument("--y_axis_scale", type=str, default="linear", help="Y-axis scale (e.g., linear, log)")
-    subparser.add_argument("--y_axis_dims", type=parse_tuple_float, default=(0, 0), help="Y-axis range as tuple: start,end")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Font size for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_rot", type=int, default=0, help="Rotation angle for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
-    subparser.add_argument("--y_ticks", nargs="+", help="Explicit tick values for Y-axis")
+    ("--y_axis", dict(type=str, default="", help="Label for the Y-axis")),
+    ("--y_axis_size", dict(type=int, default=12, help="Font size for Y-axis label")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for Y-axis label")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis label")),
+    ("--y_axis_scale", dict(type=str, choices=_SCALES, default=_LINEAR, help="Y-axis scale (e.g., linear, log)")),
+    ("--y_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="Y-axis range as tuple: start,end")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Font size for Y-axis tick labels")),
+    ("--y_ticks_rot", dict(type=int, default=0, help="Rotation angle for Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
+    ("--y_ticks", dict(nargs="+", help="Explicit tick values for Y-axis")),
 
     # Legend
-    subparser.add_argument("--legend_title", type=str, default="", help="Title text for the legend")
-    subparser.add_argument("--legend_title_size", type=int, default=12, help="Font size of the legend title")
-    subparser.add_argument("--legend_size", type=int, default=9, help="Font size for legend items")
-    subparser.add_argument("--legend_bbox_to_anchor", type=parse_tuple_float, default=(1, 1), help="Legend bbox anchor position")
-    subparser.add_argument("--legend_loc", type=str, default="upper left", help="Legend location on the plot")
-    subparser.add_argument("--legend_items", type=parse_tuple_int, default=(0, 0), help="Tuple for legend layout items")
-    subparser.add_argument("--legend_ncol", type=int, default=1, help="Number of columns in the legend")
+    ("--legend_title", dict(type=str, default="", help="Title text for the legend")),
+    ("--legend_title_size", dict(type=int, default=12, help="Font size of the legend title")),
+    ("--legend_size", dict(type=int, default=9, help="Font size for legend items")),
+    ("--legend_bbox_to_anchor", dict(type=parse_tuple_float, default=(1, 1), help="Legend bbox anchor position")),
+    ("--legend_loc", dict(type=str, choices=_LEGEND_LOCS, default=_UPPER_LEFT, help="Legend location on the plot")),
+    ("--legend_items", dict(type=parse_tuple_int, default=(0, 0), help="Tuple for legend layout items")),
+    ("--legend_ncol", dict(type=int, default=1, help="Number of columns in the legend")),
 
     # Final display
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot in an interactive window", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize and space legend/label values", default=False)
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot in an interactive window", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize and space legend/label values", default=False)),
+)
 
-def add_common_plot_heat_args(subparser, stat_parser=False):
-    '''
-    add_common_plot_heat_args(subparser): Add common arguments for heatmap graphs
-    '''
+_HEAT_ARGS = (
     # Required arguments
-    if stat_parser == False:
-        subparser.add_argument("--df", help="Input dataframe file path", type=str, required=True)
+    ("--df", dict(help="Input dataframe file path", type=str, required=True)),
 
     # Optional arguments
-    if stat_parser == False:
-        subparser.add_argument("--x", type=str, help="X-axis column name to pivot tidy-formatted dataframe into matrix format")
-        subparser.add_argument("--y", type=str, help="Y-axis column name to pivot tidy-formatted dataframe into matrix format")
-        subparser.add_argument("--vars", type=str, help="Variable column name to split tidy-formatted dataframe into a dictionary of pivoted dataframes")
-        subparser.add_argument("--vals", type=str, help="Value column name to populate pivoted dataframes")
-        subparser.add_argument("--vals_dims", type=parse_tuple_float, help="Value column limits formatted as 'vmin,vmax'")
-
-    if stat_parser == False:
-        subparser.add_argument("--dir", type=str, help="Output directory path", default='./out')
-        subparser.add_argument("--file", type=str, help="Output filename", default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_heat.png')
-    subparser.add_argument("--edgecol", type=str, default="black", help="Color of cell edges")
-    subparser.add_argument("--lw", type=int, default=1, help="Line width for cell borders")
-
-    subparser.add_argument("--annot", action="store_true", help="Display cell values as annotations", default=False)
-    subparser.add_argument("--center", type=float, default=0, help="Center value for colormap (Default: 0)")
-    subparser.add_argument("--cmap", type=str, default="Reds", help="Matplotlib colormap to use for heatmap")
-    subparser.add_argument("--sq", action="store_true", help="Use square aspect ratio for cells", default=False)
-    subparser.add_argument("--cbar", action="store_true", help="Display colorbar", default=False)
-    if stat_parser == False:
-        subparser.add_argument("--cbar_label", type=str, default=argparse.SUPPRESS, help="Colorbar label")
-    subparser.add_argument("--cbar_label_size", type=int, default=argparse.SUPPRESS, help="Font size for colorbar label")
-    subparser.add_argument("--cbar_label_weight", type=str, default="bold", help="Font weight for colorbar label (Default: bold)", choices=['bold', 'normal', 'heavy'])
-    subparser.add_argument("--cbar_tick_size", type=int, default=argparse.SUPPRESS, help="Font size for colorbar ticks")
-    subparser.add_argument("--cbar_shrink", type=float, default=argparse.SUPPRESS, help="Shrink factor for colorbar")
-    subparser.add_argument("--cbar_aspect", type=int, default=argparse.SUPPRESS, help="Aspect ratio for colorbar")
-    subparser.add_argument("--cbar_pad", type=float, default=argparse.SUPPRESS, help="Padding for colorbar")
-    subparser.add_argument("--cbar_orientation", type=str, default=argparse.SUPPRESS, help="Orientation of colorbar (Default: 'vertical')", choices=['vertical', 'horizontal'])
+    ("--x", dict(type=str, help="X-axis column name to pivot tidy-formatted dataframe into matrix format")),
+    ("--y", dict(type=str, help="Y-axis column name to pivot tidy-formatted dataframe into matrix format")),
+    ("--vars", dict(type=str, help="Variable column name to split tidy-formatted dataframe into a dictionary of pivoted dataframes")),
+    ("--vals", dict(type=str, help="Value column name to populate pivoted dataframes")),
+    ("--vals_dims", dict(type=parse_tuple_float, help="Value column limits formatted as 'vmin,vmax'")),
+
+    ("--dir", dict(type=str, help="Output directory path", default='./out')),
+    ("--file", dict(type=str, help="Output filename", default=TimestampedName('_plot_heat.png'))),
+    ("--edgecol", dict(type=str, default=_BLACK, help="Color of cell edges")),
+    ("--lw", dict(type=int, default=1, help="Line width for cell borders")),
+
+    ("--annot", dict(action="store_true", help="Display cell values as annotations", default=False)),
+    ("--center", dict(type=float, default=0, help="Center value for colormap (Default: 0)")),
+    ("--cmap", dict(type=str, default="Reds", help="Matplotlib colormap to use for heatmap")),
+    ("--sq", dict(action="store_true", help="Use square aspect ratio for cells", default=False)),
+    ("--cbar", dict(action="store_true", help="Display colorbar", default=False)),
+    ("--cbar_label", dict(type=str, default=argparse.SUPPRESS, help="Colorbar label")),
+    ("--cbar_label_size", dict(type=int, default=argparse.SUPPRESS, help="Font size for colorbar label")),
+    ("--cbar_label_weight", dict(type=str, default=_BOLD, help="Font weight for colorbar label (Default: bold)", choices=['bold', 'normal', 'heavy'])),
+    ("--cbar_tick_size", dict(type=int, default=argparse.SUPPRESS, help="Font size for colorbar ticks")),
+    ("--cbar_shrink", dict(type=float, default=argparse.SUPPRESS, help="Shrink factor for colorbar")),
+    ("--cbar_aspect", dict(type=int, default=argparse.SUPPRESS, help="Aspect ratio for colorbar")),
+    ("--cbar_pad", dict(type=float, default=argparse.SUPPRESS, help="Padding for colorbar")),
+    ("--cbar_orientation", dict(type=str, default=argparse.SUPPRESS, help="Orientation of colorbar (Default: 'vertical')", choices=['vertical', 'horizontal'])),
 
     # Title and size
-    subparser.add_argument("--title", type=str, default="", help="Plot title")
-    subparser.add_argument("--title_size", type=int, default=18, help="Font size of the title")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Font weight of the title (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for the title")
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(5,5), help="Figure size formatted as 'width,height'")
+    ("--title", dict(type=str, default="", help="Plot title")),
+    ("--title_size", dict(type=int, default=18, help="Font size of the title")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight of the title (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for the title")),
+    ("--figsize", dict(type=parse_tuple_int, default=(5,5), help=_FIGSIZE_HELP)),
 
     # X-axis
-    subparser.add_argument("--x_axis", type=str, default="", help="X-axis label")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="Font size for X-axis label")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="Font weight for X-axis label")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="Font family for X-axis label")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="Font size for X-axis tick labels")
-    subparser.add_argument("--x_ticks_rot", type=int, default=0, help="Rotation angle for X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
+    ("--x_axis", dict(type=str, default="", help="X-axis label")),
+    ("--x_axis_size", dict(type=int, default=12, help="Font size for X-axis label")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for X-axis label")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="Font family for X-axis label")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="Font size for X-axis tick labels")),
+    ("--x_ticks_rot", dict(type=int, default=0, help="Rotation angle for X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
 
     # Y-axis
-    subparser.add_argument("--y_axis", type=str, default="", help="Y-axis label")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Font size for Y-axis label")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Font weight for Y-axis label")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Font family for Y-axis label")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Font size for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_rot", type=int, default=0, help="Rotation angle for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
+    ("--y_axis", dict(type=str, default="", help="Y-axis label")),
+    ("--y_axis_size", dict(type=int, default=12, help="Font size for Y-axis label")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for Y-axis label")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis label")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Font size for Y-axis tick labels")),
+    ("--y_ticks_rot", dict(type=int, default=0, help="Rotation angle for Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
 
     # Final display
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot in an interactive window", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize and space labels/legend values", default=False)
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot in an interactive window", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize and space labels/legend values", default=False)),
+)
 
-def add_common_plot_stack_args(subparser):
-    '''
-    add_common_plot_stack_args(subparser): Add common arguments for stacked bar plot
-    '''
+_STACK_ARGS = (
     # Required arguments
-    subparser.add_argument("--df", type=str, help="Input dataframe file path", required=True)
-    subparser.add_argument("--x", type=str, help="X-axis column name")
-    subparser.add_argument("--y", type=str, help="Y-axis column name")
-    subparser.add_argument("--cols", type=str, help="Color column name for stacking")
+    ("--df", dict(type=str, help="Input dataframe file path", required=True)),
+    ("--x", dict(type=str, help="X-axis column name")),
+    ("--y", dict(type=str, help="Y-axis column name")),
+    ("--cols", dict(type=str, help="Color column name for stacking")),
 
     # Optional parameters
-    subparser.add_argument("--dir", type=str, help="Output directory path", default='./out')
-    subparser.add_argument("--file", type=str, help="Output filename", default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_stack.png')
-    
-    subparser.add_argument("--cutoff_group", type=str, default=argparse.SUPPRESS, help="Column name to group by when applying cutoff")
-    subparser.add_argument("--cutoff_value", type=float, default=0, help="Y-axis values needs be greater than (e.g. 0)")
-    subparser.add_argument("--cutoff_remove", dest="cutoff_keep",action="store_false", help="Remove values below cutoff", default=True)
-    subparser.add_argument("--cols_ord", nargs="+", help="Order of values in the color column")
-    subparser.add_argument("--x_ord", nargs="+", help="Custom order of X-axis categories")
-    subparser.add_argument("--palette_or_cmap", type=str, default="Set2", help="Seaborn palette or Matplotlib colormap for stacked bars")
-    subparser.add_argument("--errcap", type=int, default=4, help="Width of error bar caps")
-    subparser.add_argument("--vertical", action="store_true", help="Stack bars vertically (default True)", default=False)
+    ("--dir", dict(type=str, help="Output directory path", default='./out')),
+    ("--file", dict(type=str, help="Output filename", default=TimestampedName('_plot_stack.png'))),
+
+    ("--cutoff_group", dict(type=str, default=argparse.SUPPRESS, help="Column name to group by when applying cutoff")),
+    ("--cutoff_value", dict(type=float, default=0, help="Y-axis values needs be greater than (e.g. 0)")),
+    ("--cutoff_remove", dict(dest="cutoff_keep", action="store_false", help="Remove values below cutoff", default=True)),
+    ("--cols_ord", dict(nargs="+", help="Order of values in the color column")),
+    ("--x_ord", dict(nargs="+", help="Custom order of X-axis categories")),
+    ("--palette_or_cmap", dict(type=str, default="Set2", help="Seaborn palette or Matplotlib colormap for stacked bars")),
+    ("--errcap", dict(type=int, default=4, help="Width of error bar caps")),
+    ("--vertical", dict(action="store_true", help="Stack bars vertically (default True)", default=False)),
 
     # Figure & layout
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(10,6), help="Figure size formatted as 'width,height'")
-    subparser.add_argument("--title", type=str, default="", help="Plot title")
-    subparser.add_argument("--title_size", type=int, default=18, help="Font size of the title")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Font weight of the title (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for the title")
+    ("--figsize", dict(type=parse_tuple_int, default=(10,6), help=_FIGSIZE_HELP)),
+    ("--title", dict(type=str, default="", help="Plot title")),
+    ("--title_size", dict(type=int, default=18, help="Font size of the title")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight of the title (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for the title")),
 
     # X-axis formatting
-    subparser.add_argument("--x_axis", type=str, default="", help="X-axis label")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="Font size for X-axis label")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="Font weight for X-axis label")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="Font family for X-axis label")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="Font size for X-axis tick labels")
-    subparser.add_argument("--x_ticks_rot", type=int, help="Rotation angle for X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
+    ("--x_axis", dict(type=str, default="", help="X-axis label")),
+    ("--x_axis_size", dict(type=int, default=12, help="Font size for X-axis label")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for X-axis label")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="Font family for X-axis label")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="Font size for X-axis tick labels")),
+    ("--x_ticks_rot", dict(type=int, help="Rotation angle for X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
 
     # Y-axis formatting
-    subparser.add_argument("--y_axis", type=str, default="", help="Y-axis label")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Font size for Y-axis label")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Font weight for Y-axis label")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Font family for Y-axis label")
-    subparser.add_argument("--y_axis_dims", type=parse_tuple_float, default=(0,0), help="Y-axis range as tuple: start,end")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Font size for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_rot", type=int, help="Rotation angle for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
+    ("--y_axis", dict(type=str, default="", help="Y-axis label")),
+    ("--y_axis_size", dict(type=int, default=12, help="Font size for Y-axis label")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for Y-axis label")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis label")),
+    ("--y_axis_dims", dict(type=parse_tuple_float, default=(0,0), help="Y-axis range as tuple: start,end")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Font size for Y-axis tick labels")),
+    ("--y_ticks_rot", dict(type=int, help="Rotation angle for Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
 
     # Legend options
-    subparser.add_argument("--legend_title", type=str, default="", help="Legend title text")
-    subparser.add_argument("--legend_title_size", type=int, default=12, help="Font size of the legend title")
-    subparser.add_argument("--legend_size", type=int, default=12, help="Font size for legend items")
-    subparser.add_argument("--legend_bbox_to_anchor", type=parse_tuple_float, default=(1, 1), help="Anchor position for the legend bounding box")
-    subparser.add_argument("--legend_loc", type=str, default="upper left", help="Legend location on the plot")
-    subparser.add_argument("--legend_ncol", type=int, default=1, help="Number of columns in the legend")
-    subparser.add_argument('--legend_columnspacing', type=int, default=argparse.SUPPRESS, help='space between columns in legend; only for html plots')
-    subparser.add_argument('--legend_handletextpad', type=float, default=argparse.SUPPRESS, help='space between marker and text in legend; only for html plots')
-    subparser.add_argument('--legend_labelspacing', type=float, default=argparse.SUPPRESS, help='vertical space between entries in legend; only for html plots')
-    subparser.add_argument('--legend_borderpad', type=float, default=argparse.SUPPRESS, help='padding inside legend box; only for html plots')
-    subparser.add_argument('--legend_handlelength', type=float, default=argparse.SUPPRESS, help='marker length in legend; only for html plots')
-    subparser.add_argument('--legend_size_html_multiplier', type=float, default=argparse.SUPPRESS, help='legend size multiplier for html plots')
+    ("--legend_title", dict(type=str, default="", help="Legend title text")),
+    ("--legend_title_size", dict(type=int, default=12, help="Font size of the legend title")),
+    ("--legend_size", dict(type=int, default=12, help="Font size for legend items")),
+    ("--legend_bbox_to_anchor", dict(type=parse_tuple_float, default=(1, 1), help="Anchor position for the legend bounding box")),
+    ("--legend_loc", dict(type=str, choices=_LEGEND_LOCS, default=_UPPER_LEFT, help="Legend location on the plot")),
+    ("--legend_ncol", dict(type=int, default=1, help="Number of columns in the legend")),
+    *_LEGEND_HTML_ARGS,
 
     # Display and formatting
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot in an interactive window", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize and space legend/label values", default=False)
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot in an interactive window", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize and space legend/label values", default=False)),
+)
 
-def add_common_plot_vol_args(subparser):
-    '''
-    add_common_plot_vol_args(subparser): Add common arguments for volcano plot
-    '''
+_VOL_ARGS = (
     # Required arguments
-    subparser.add_argument("--df", type=str, help="Input dataframe file path")
-    subparser.add_argument("--FC", type=str, help="Fold change column name (X-axis)", required=True)
-    subparser.add_argument("--pval", type=str, help="P-value column name (Y-axis)", required=True)
+    ("--df", dict(type=str, help="Input dataframe file path")),
+    ("--FC", dict(type=str, help="Fold change column name (X-axis)", required=True)),
+    ("--pval", dict(type=str, help="P-value column name (Y-axis)", required=True)),
 
     # Optional data columns
-    subparser.add_argument("--stys", type=str, help="Style column name for custom markers")
-    subparser.add_argument("--size", type=str, help="Column name used to scale point sizes")
-    subparser.add_argument("--size_dims", type=parse_tuple_float, help="Size range for points formatted as min,max")
-    subparser.add_argument("--label", type=str, help="Column containing text labels for points")
-    subparser.add_argument("--stys_order", type=str, nargs="+", help="Style column values order")
-    subparser.add_argument("--mark_order", type=str, nargs="+", help="Markers order for style column values order")
+    ("--stys", dict(type=str, help="Style column name for custom markers")),
+    ("--size", dict(type=str, help="Column name used to scale point sizes")),
+    ("--size_dims", dict(type=parse_tuple_float, help="Size range for points formatted as min,max")),
+    ("--label", dict(type=str, help="Column containing text labels for points")),
+    ("--stys_order", dict(type=str, nargs="+", help="Style column values order")),
+    ("--mark_order", dict(type=str, nargs="+", help="Markers order for style column values order")),
 
     # Thresholds
-    subparser.add_argument("--FC_threshold", type=float, default=2, help="Fold change threshold for significance")
-    subparser.add_argument("--pval_threshold", type=float, default=0.05, help="P-value threshold for significance")
+    ("--FC_threshold", dict(type=float, default=2, help="Fold change threshold for significance")),
+    ("--pval_threshold", dict(type=float, default=0.05, help="P-value threshold for significance")),
 
     # Output
-    subparser.add_argument("--dir", type=str, help="Output directory path", default='./out')
-    subparser.add_argument("--file", type=str, help="Output file name", default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_plot_vol.png')
+    ("--dir", dict(type=str, help="Output directory path", default='./out')),
+    ("--file", dict(type=str, help="Output file name", default=TimestampedName('_plot_vol.png'))),
 
     # Aesthetics
-    subparser.add_argument("--color", type=str, default="lightgray", help="Color for non-significant points")
-    subparser.add_argument("--alpha", type=float, default=0.5, help="Transparency for non-significant points")
-    subparser.add_argument("--edgecol", type=str, default="black", help="Edge color of points")
-    subparser.add_argument("--vertical", action="store_true", help="Use vertical layout for plot", default=False)
+    ("--color", dict(type=str, default="lightgray", help="Color for non-significant points")),
+    ("--alpha", dict(type=float, default=0.5, help="Transparency for non-significant points")),
+    ("--edgecol", dict(type=str, default=_BLACK, help="Edge color of points")),
+    ("--vertical", dict(action="store_true", help="Use vertical layout for plot", default=False)),
 
     # Figure setup
-    subparser.add_argument("--figsize", type=parse_tuple_int, default=(10,6), help="Figure size formatted as 'width,height'")
-    subparser.add_argument("--title", type=str, default="", help="Plot title")
-    subparser.add_argument("--title_size", type=int, default=18, help="Font size for plot title")
-    subparser.add_argument("--title_weight", type=str, default="bold", help="Font weight for plot title (e.g., bold, normal)")
-    subparser.add_argument("--title_font", type=str, default="Arial", help="Font family for plot title")
+    ("--figsize", dict(type=parse_tuple_int, default=(10,6), help=_FIGSIZE_HELP)),
+    ("--title", dict(type=str, default="", help="Plot title")),
+    ("--title_size", dict(type=int, default=18, help="Font size for plot title")),
+    ("--title_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for plot title (e.g., bold, normal)")),
+    ("--title_font", dict(type=str, default=_ARIAL, help="Font family for plot title")),
 
     # X-axis settings
-    subparser.add_argument("--x_axis", type=str, default="", help="Label for the X-axis")
-    subparser.add_argument("--x_axis_size", type=int, default=12, help="Font size for X-axis label")
-    subparser.add_argument("--x_axis_weight", type=str, default="bold", help="Font weight for X-axis label")
-    subparser.add_argument("--x_axis_font", type=str, default="Arial", help="Font family for X-axis label")
-    subparser.add_argument("--x_axis_dims", type=parse_tuple_float, default=(0, 0), help="X-axis range formatted as min,max")
-    subparser.add_argument("--x_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")
-    subparser.add_argument("--x_ticks_size", type=int, default=9, help="Font size for X-axis tick labels")
-    subparser.add_argument("--x_ticks_rot", type=int, default=0, help="Rotation angle for X-axis tick labels")
-    subparser.add_argument("--x_ticks_font", type=str, default="Arial", help="Font family for X-axis tick labels")
-    subparser.add_argument("--x_ticks", nargs="+", help="Custom tick values for X-axis")
+    ("--x_axis", dict(type=str, default="", help="Label for the X-axis")),
+    ("--x_axis_size", dict(type=int, default=12, help="Font size for X-axis label")),
+    ("--x_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for X-axis label")),
+    ("--x_axis_font", dict(type=str, default=_ARIAL, help="Font family for X-axis label")),
+    ("--x_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="X-axis range formatted as min,max")),
+    ("--x_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for X-axis label")),
+    ("--x_ticks_size", dict(type=int, default=9, help="Font size for X-axis tick labels")),
+    ("--x_ticks_rot", dict(type=int, default=0, help="Rotation angle for X-axis tick labels")),
+    ("--x_ticks_font", dict(type=str, default=_ARIAL, help="Font family for X-axis tick labels")),
+    ("--x_ticks", dict(nargs="+", help="Custom tick values for X-axis")),
 
     # Y-axis settings
-    subparser.add_argument("--y_axis", type=str, default="", help="Label for the Y-axis")
-    subparser.add_argument("--y_axis_size", type=int, default=12, help="Font size for Y-axis label")
-    subparser.add_argument("--y_axis_weight", type=str, default="bold", help="Font weight for Y-axis label")
-    subparser.add_argument("--y_axis_font", type=str, default="Arial", help="Font family for Y-axis label")
-    subparser.add_argument("--y_axis_dims", type=parse_tuple_float, default=(0, 0), help="Y-axis range formatted as min,max")
-    subparser.add_argument("--y_axis_pad", type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")
-    subparser.add_argument("--y_ticks_size", type=int, default=9, help="Font size for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_rot", type=int, default=0, help="Rotation angle for Y-axis tick labels")
-    subparser.add_argument("--y_ticks_font", type=str, default="Arial", help="Font family for Y-axis tick labels")
-    subparser.add_argument("--y_ticks", nargs="+", help="Custom tick values for Y-axis")
+    ("--y_axis", dict(type=str, default="", help="Label for the Y-axis")),
+    ("--y_axis_size", dict(type=int, default=12, help="Font size for Y-axis label")),
+    ("--y_axis_weight", dict(type=str, choices=_WEIGHTS, default=_BOLD, help="Font weight for Y-axis label")),
+    ("--y_axis_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis label")),
+    ("--y_axis_dims", dict(type=parse_tuple_float, default=(0, 0), help="Y-axis range formatted as min,max")),
+    ("--y_axis_pad", dict(type=int, default=argparse.SUPPRESS, help="Padding for Y-axis label")),
+    ("--y_ticks_size", dict(type=int, default=9, help="Font size for Y-axis tick labels")),
+    ("--y_ticks_rot", dict(type=int, default=0, help="Rotation angle for Y-axis tick labels")),
+    ("--y_ticks_font", dict(type=str, default=_ARIAL, help="Font family for Y-axis tick labels")),
+    ("--y_ticks", dict(nargs="+", help="Custom tick values for Y-axis")),
 
     # Legend
-    subparser.add_argument("--legend_title", type=str, default="", help="Title for the legend")
-    subparser.add_argument("--legend_title_size", type=int, default=12, help="Font size for legend title")
-    subparser.add_argument("--legend_size", type=int, default=9, help="Font size for legend items")
-    subparser.add_argument("--legend_bbox_to_anchor", type=parse_tuple_float, default=(1, 1), help="Bounding box anchor for legend")
-    subparser.add_argument("--legend_loc", type=str, default="upper left", help="Legend location on the plot")
-    subparser.add_argument("--legend_ncol", type=int, default=1, help="Number of columns in the legend")
-    subparser.add_argument('--legend_columnspacing', type=int, default=argparse.SUPPRESS, help='space between columns in legend; only for html plots')
-    subparser.add_argument('--legend_handletextpad', type=float, default=argparse.SUPPRESS, help='space between marker and text in legend; only for html plots')
-    subparser.add_argument('--legend_labelspacing', type=float, default=argparse.SUPPRESS, help='vertical space between entries in legend; only for html plots')
-    subparser.add_argument('--legend_borderpad', type=float, default=argparse.SUPPRESS, help='padding inside legend box; only for html plots')
-    subparser.add_argument('--legend_handlelength', type=float, default=argparse.SUPPRESS, help='marker length in legend; only for html plots')
-    subparser.add_argument('--legend_size_html_multiplier', type=float, default=argparse.SUPPRESS, help='legend size multiplier for html plots')
+    ("--legend_title", dict(type=str, default="", help="Title for the legend")),
+    ("--legend_title_size", dict(type=int, default=12, help="Font size for legend title")),
+    ("--legend_size", dict(type=int, default=9, help="Font size for legend items")),
+    ("--legend_bbox_to_anchor", dict(type=parse_tuple_float, default=(1, 1), help="Bounding box anchor for legend")),
+    ("--legend_loc", dict(type=str, choices=_LEGEND_LOCS, default=_UPPER_LEFT, help="Legend location on the plot")),
+    ("--legend_ncol", dict(type=int, default=1, help="Number of columns in the legend")),
+    *_LEGEND_HTML_ARGS,
 
     # Boolean switches
-    subparser.add_argument("--dont_display_legend", action="store_false", help="Don't display legend on plot", default=True)
-    subparser.add_argument("--display_labels", type=str, nargs="+", help="Display labels for values if label column specified (Options: 'FC & p-value', 'FC', 'p-value', 'NS', 'all', or ['label1', 'label2', ..., 'labeln'])", default=["FC & p-value"])
-    subparser.add_argument("--dont_display_axis", dest='display_axis', action="store_false", default=True, help="Display x- and y-axis lines (Default: True)")
-    subparser.add_argument("--display_lines", action="store_true", help="Display lines for threshold (Default: False)", default=False)
-    subparser.add_argument("--return_df", action="store_true", help="Return annotated DataFrame after plotting", default=False)
-    subparser.add_argument("--dpi", type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)
-    subparser.add_argument("--show", action="store_true", help="Show the plot in an interactive window", default=False)
-    subparser.add_argument("--space_capitalize", action="store_true", help="Capitalize and space labels/legend items", default=False)
+    ("--dont_display_legend", dict(action="store_false", help="Don't display legend on plot", default=True)),
+    ("--display_labels", dict(type=str, nargs="+", help="Display labels for values if label column specified (Options: 'FC & p-value', 'FC', 'p-value', 'NS', 'all', or ['label1', 'label2', ..., 'labeln'])", default=["FC & p-value"])),
+    ("--dont_display_axis", dict(dest='display_axis', action="store_false", default=True, help="Display x- and y-axis lines (Default: True)")),
+    ("--display_lines", dict(action="store_true", help="Display lines for threshold (Default: False)", default=False)),
+    ("--return_df", dict(action="store_true", help="Return annotated DataFrame after plotting", default=False)),
+    ("--dpi", dict(type=int, help="Figure dpi (Default: 600 for non-HTML, 150 for HTML)", default=0)),
+    ("--show", dict(action="store_true", help="Show the plot in an interactive window", default=False)),
+    ("--space_capitalize", dict(action="store_true", help="Capitalize and space labels/legend items", default=False)),
+)
+
+# Heatmap arguments only added for plot heat (not stat correlation)
+_HEAT_PLOT_ONLY = frozenset(("--df", "--x", "--y", "--vars", "--vals", "--vals_dims", "--dir", "--file", "--cbar_label"))
 
-def add_subparser(subparsers, formatter_class=None):
+# Plot subparser methods
+def _add_args(subparser, specs):
+    '''
+    _add_args(subparser, specs): Add arguments from (flag, keyword arguments) specs to subparser
+    '''
+    for name, kwargs in specs:
+        subparser.add_argument(name, **kwargs)
+
+def add_common_plot_scat_args(subparser):
+    '''
+    add_common_plot_scat_args(subparser): Add common arguments for scatter plot related graphs
+    '''
+    _add_args(subparser, _SCAT_ARGS)
+
+def add_common_plot_cat_args(subparser):
+    '''
+    add_common_plot_cat_args(subparser): Add common arguments for category dependent graphs
+    '''
+    _add_args(subparser, _CAT_ARGS)
+
+def add_common_plot_dist_args(subparser):
+    '''
+    add_common_plot_dist_args(subparser): Add common arguments for distribution graphs
+    '''
+    _add_args(subparser, _DIST_ARGS)
+
+def add_common_plot_heat_args(subparser, stat_parser=False):
+    '''
+    add_common_plot_heat_args(subparser): Add common arguments for heatmap graphs
+    '''
+    for name, kwargs in _HEAT_ARGS:
+        if stat_parser and name in _HEAT_PLOT_ONLY: # stat correlation() has its own input/output arguments
+            continue
+        subparser.add_argument(name, **kwargs)
+
+def add_common_plot_stack_args(subparser):
+    '''
+    add_common_plot_stack_args(subparser): Add common arguments for stacked bar plot
+    '''
+    _add_args(subparser, _STACK_ARGS)
+
+def add_common_plot_vol_args(subparser):
+    '''
+    add_common_plot_vol_args(subparser): Add common arguments for volcano plot
+    '''
+    _add_args(subparser, _VOL_ARGS)
+
+# Plot subcommands: typ -> (help/description, argument helper, ind.gen.plot function)
+_PLOT_SUBCOMMANDS = {
+    # scat(): Creates scatter plot related graphs (scat, line, line_scat)
+    "scat": ("Create scatter plot", add_common_plot_scat_args, "scat"),
+    "line": ("Create line plot", add_common_plot_scat_args, "scat"),
+    "line_scat": ("Create scatter + line plot", add_common_plot_scat_args, "scat"),
+
+    # cat(): Creates categorical graphs (bar, box, violin, swarm, strip, point, count, bar_swarm, box_swarm, violin_swarm)
+    "bar": ("Create bar plot", add_common_plot_cat_args, "cat"),
+    "box": ("Create box plot", add_common_plot_cat_args, "cat"),
+    "violin": ("Create violin plot", add_common_plot_cat_args, "cat"),
+    "swarm": ("Create swarm plot", add_common_plot_cat_args, "cat"),
+    "strip": ("Create strip plot", add_common_plot_cat_args, "cat"),
+    "point": ("Create point plot", add_common_plot_cat_args, "cat"),
+    "count": ("Create count plot", add_common_plot_cat_args, "cat"),
+    "bar_swarm": ("Create bar + swarm plot", add_common_plot_cat_args, "cat"),
+    "box_swarm": ("Create box + swarm plot", add_common_plot_cat_args, "cat"),
+    "violin_swarm": ("Create violin + swarm plot", add_common_plot_cat_args, "cat"),
+
+    # dist(): Creates distribution graphs (hist, kde, hist_kde, rid)
+    "hist": ("Create histogram plot", add_common_plot_dist_args, "dist"),
+    "kde": ("Create density plot", add_common_plot_dist_args, "dist"),
+    "hist_kde": ("Create histogram + density plot", add_common_plot_dist_args, "dist"),
+    "rid": ("Create ridge plot", add_common_plot_dist_args, "dist"),
+
+    # heat(), stack(), & vol(): Creates heatmap, stacked bar, & volcano plots
+    "heat": ("Create heatmap plot", add_common_plot_heat_args, "heat"),
+    "stack": ("Create stacked bar plot", add_common_plot_stack_args, "stack"),
+    "vol": ("Create volcano plot", add_common_plot_vol_args, "vol"),
+}
+
+def add_plot_subparser(subparsers, formatter_class=None):
     """
-    add_subparser(): Attach all gen-related subparsers to the top-level CLI.
+    add_plot_subparser(): Attach the plot subparsers (ind.gen.plot) to the top-level CLI.
 
     Parameters:
-    subparsers (argparse._SubParsersAction): The subparsers object to attach the gen subparsers to.
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the plot subparser to.
     formatter_class (type, optional): The formatter class to use for the subparsers.
     """
     '''
@@ -507,56 +589,23 @@ def add_subparser(subparsers, formatter_class=None):
     parser_plot = subparsers.add_parser("plot", help="Generate scatter, category, distribution, heatmap, stacked bar, and volcano plots", description="Generate scatter, category, distribution, heatmap, stacked bar, and volcano plots", formatter_class=formatter_class)
     subparsers_plot = parser_plot.add_subparsers(dest="typ")
 
-    # scat(): Creates scatter plot related graphs (scat, line, line_scat)
-    parser_plot_type_scat = subparsers_plot.add_parser("scat", help="Create scatter plot", description="Create scatter plot", formatter_class=formatter_class)
-    parser_plot_type_line = subparsers_plot.add_parser("line", help="Create line plot", description="Create line plot", formatter_class=formatter_class)
-    parser_plot_type_line_scat = subparsers_plot.add_parser("line_scat", help="Create scatter + line plot", description="Create scatter + line plot", formatter_class=formatter_class)
-
-    for parser_plot_scat in [parser_plot_type_scat, parser_plot_type_line, parser_plot_type_line_scat]:
-        add_common_plot_scat_args(parser_plot_scat)
-        parser_plot_scat.set_defaults(func=p.scat)
-
-    # cat(): Creates categorical graphs (bar, box, violin, swarm, strip, point, count, bar_swarm, box_swarm, violin_swarm)
-    parser_plot_type_bar = subparsers_plot.add_parser("bar", help="Create bar plot", description="Create bar plot", formatter_class=formatter_class)
-    parser_plot_type_box = subparsers_plot.add_parser("box", help="Create box plot", description="Create box plot", formatter_class=formatter_class)
-    parser_plot_type_violin = subparsers_plot.add_parser("violin", help="Create violin plot", description="Create violin plot", formatter_class=formatter_class)
-    parser_plot_type_swarm = subparsers_plot.add_parser("swarm", help="Create swarm plot", description="Create swarm plot", formatter_class=formatter_class)
-    parser_plot_type_strip = subparsers_plot.add_parser("strip", help="Create strip plot", description="Create strip plot", formatter_class=formatter_class)
-    parser_plot_type_point = subparsers_plot.add_parser("point", help="Create point plot", description="Create point plot", formatter_class=formatter_class)
-    parser_plot_type_count = subparsers_plot.add_parser("count", help="Create count plot", description="Create count plot", formatter_class=formatter_class)
-    parser_plot_type_bar_swarm = subparsers_plot.add_parser("bar_swarm", help="Create bar + swarm plot", description="Create bar + swarm plot", formatter_class=formatter_class)
-    parser_plot_type_box_swarm = subparsers_plot.add_parser("box_swarm", help="Create box + swarm plot", description="Create box + swarm plot", formatter_class=formatter_class)
-    parser_plot_type_violin_swarm = subparsers_plot.add_parser("violin_swarm", help="Create violin + swarm plot", description="Create violin + swarm plot", formatter_class=formatter_class)
-
-    for parser_plot_cat in [parser_plot_type_bar, parser_plot_type_box, parser_plot_type_violin, parser_plot_type_swarm, parser_plot_type_strip, parser_plot_type_point, parser_plot_type_count, parser_plot_type_bar_swarm, parser_plot_type_box_swarm, parser_plot_type_violin_swarm]:
-        add_common_plot_cat_args(parser_plot_cat)
-        parser_plot_cat.set_defaults(func=p.cat)
+    # One parent parser per argument helper; plot types sharing a helper (e.g., the 10 cat() types) reuse its actions
+    parents = {}
+    for typ, (help_text, add_args, func) in _PLOT_SUBCOMMANDS.items():
+        if add_args not in parents:
+            parents[add_args] = argparse.ArgumentParser(add_help=False)
+            add_args(parents[add_args])
+        parser_plot_type = subparsers_plot.add_parser(typ, help=help_text, description=help_text, formatter_class=formatter_class, parents=[parents[add_args]])
+        parser_plot_type.set_defaults(func=_lazy('plot', func))
 
-    # dist(): Creates distribution graphs (hist, kde, hist_kde, rid)
-    parser_plot_type_hist = subparsers_plot.add_parser("hist", help="Create histogram plot", description="Create histogram plot", formatter_class=formatter_class)
-    parser_plot_type_kde = subparsers_plot.add_parser("kde", help="Create density plot", description="Create density plot", formatter_class=formatter_class)
-    parser_plot_type_hist_kde = subparsers_plot.add_parser("hist_kde", help="Create histogram + density plot", description="Create histogram + density plot", formatter_class=formatter_class)
-    parser_plot_type_rid = subparsers_plot.add_parser("rid", help="Create ridge plot", description="Create ridge plot", formatter_class=formatter_class)
-
-    for parser_plot_dist in [parser_plot_type_hist, parser_plot_type_kde, parser_plot_type_hist_kde, parser_plot_type_rid]:
-        add_common_plot_dist_args(parser_plot_dist)
-        parser_plot_dist.set_defaults(func=p.dist)
-
-    # heat(): Creates heatmap graphs
-    parser_plot_type_heat = subparsers_plot.add_parser("heat", help="Create heatmap plot", description="Create heatmap plot", formatter_class=formatter_class)
-    add_common_plot_heat_args(parser_plot_type_heat)
-    parser_plot_type_heat.set_defaults(func=p.heat)
-    
-    # stack(): Creates stacked bar plot
-    parser_plot_type_stack = subparsers_plot.add_parser("stack", help="Create stacked bar plot", description="Create stacked bar plot", formatter_class=formatter_class)
-    add_common_plot_stack_args(parser_plot_type_stack)
-    parser_plot_type_stack.set_defaults(func=p.stack)
-
-    # vol(): Creates volcano plot
-    parser_plot_type_vol = subparsers_plot.add_parser("vol", help="Create volcano plot", description="Create volcano plot", formatter_class=formatter_class)
-    add_common_plot_vol_args(parser_plot_type_vol)
-    parser_plot_type_vol.set_defaults(func=p.vol)
+def add_stat_subparser(subparsers, formatter_class=None):
+    """
+    add_stat_subparser(): Attach the stat subparsers (ind.gen.stat) to the top-level CLI.
 
+    Parameters:
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the stat subparser to.
+    formatter_class (type, optional): The formatter class to use for the subparsers.
+    """
     '''
     ind.gen.stat:
     - describe(): returns descriptive statistics for numerical columns in a DataFrame
@@ -573,12 +622,12 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_describe.add_argument("--df", type=str, help="Input file path", required=True)
 
     parser_stat_describe.add_argument("--dir", type=str, help="Output directory",default='../out')
-    parser_stat_describe.add_argument("--file", type=str, help="Output file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_descriptive.csv')
+    parser_stat_describe.add_argument("--file", type=str, help="Output file name",default=TimestampedName('_descriptive.csv'))
     
     parser_stat_describe.add_argument("--cols", nargs="+", help="List of numerical columns to describe")
     parser_stat_describe.add_argument("--group", type=str, help="Column name to group by")
     
-    parser_stat_describe.set_defaults(func=st.describe)
+    parser_stat_describe.set_defaults(func=_lazy('stat', 'describe'))
 
     # difference(): computes the appropriate statistical test(s) and returns the p-value(s)
     parser_stat_difference = subparsers_stat.add_parser("difference", help="Compute statistical difference between groups", description="Compute statistical difference between groups", formatter_class=formatter_class)
@@ -589,7 +638,7 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_difference.add_argument("--compare", nargs="+", help="List of groups to compare (e.g. A B)",required=True)
 
     parser_stat_difference.add_argument("--dir", type=str, help="Output directory",default='../out')
-    parser_stat_difference.add_argument("--file", type=str, help="Output file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_difference.csv')
+    parser_stat_difference.add_argument("--file", type=str, help="Output file name",default=TimestampedName('_difference.csv'))
 
     parser_stat_difference.add_argument("--same", action="store_true", help="Same subjects (paired test)")
     parser_stat_difference.add_argument("--para", action="store_true", help="Use parametric test (Default: True)")
@@ -597,7 +646,7 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_difference.add_argument("--within_cols", nargs="+", help="Columns for repeated measures (used if same=True and para=True)")
     parser_stat_difference.add_argument("--method", type=str, default="holm", help="Correction method for multiple comparisons")
 
-    parser_stat_difference.set_defaults(func=st.difference)
+    parser_stat_difference.set_defaults(func=_lazy('stat', 'difference'))
 
     # correlation(): returns a correlation matrix
     parser_stat_correlation = subparsers_stat.add_parser("correlation", help="Compute correlation matrix", description="Compute correlation matrix", formatter_class=formatter_class)
@@ -610,11 +659,11 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_correlation.add_argument("--numeric_only", action="store_true", help="Only use numeric columns (Default: True)")
     parser_stat_correlation.add_argument("--no_plot", dest="plot", action="store_false", help="Don't generate correlation matrix plot", default=True)
     parser_stat_correlation.add_argument("--dir", type=str, help="Output directory",default='../out')
-    parser_stat_correlation.add_argument("--file_data", type=str, help="Output data file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_correlation.csv')
-    parser_stat_correlation.add_argument("--file_plot", type=str, help="Output plot file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_correlation.pdf')
+    parser_stat_correlation.add_argument("--file_data", type=str, help="Output data file name",default=TimestampedName('_correlation.csv'))
+    parser_stat_correlation.add_argument("--file_plot", type=str, help="Output plot file name",default=TimestampedName('_correlation.pdf'))
     add_common_plot_heat_args(parser_stat_correlation, stat_parser=True)
 
-    parser_stat_correlation.set_defaults(func=st.correlation)
+    parser_stat_correlation.set_defaults(func=_lazy('stat', 'correlation'))
 
     # compare(): computes FC, pval, and log transformations relative to a specified condition
     parser_stat_compare = subparsers_stat.add_parser("compare", help="Compare conditions using FC, p-values, and log transforms", description="Compare conditions using FC, p-values, and log transforms", formatter_class=formatter_class)
@@ -629,10 +678,10 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_compare.add_argument("--pseudocount", type=int, default=1, help="Pseudocount to avoid log(0) or divide-by-zero errors")
     parser_stat_compare.add_argument("--alternative", type=str, default="two-sided", choices=["two-sided", "less", "greater"], help="Alternative hypothesis for Fisher's exact test (Default: two-sided)")
     parser_stat_compare.add_argument("--dir", type=str, help="Output directory",default='../out')
-    parser_stat_compare.add_argument("--file", type=str, help="Output file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_compare.csv')
+    parser_stat_compare.add_argument("--file", type=str, help="Output file name",default=TimestampedName('_compare.csv'))
     parser_stat_compare.add_argument("--verbose", action="store_true", help="Print progress to console", default=False)
 
-    parser_stat_compare.set_defaults(func=st.compare)
+    parser_stat_compare.set_defaults(func=_lazy('stat', 'compare'))
 
     # odds_ratio(): computes odds ratio relative to a specified condition (OR = (A/B)/(C/D))
     parser_stat_odds_ratio = subparsers_stat.add_parser("odds_ratio", help="Computes odds ratios relative to a specified condition & variable (e.g., unedited & WT)", description="Compute odds ratio between conditions", formatter_class=formatter_class)
@@ -647,11 +696,19 @@ def add_subparser(subparsers, formatter_class=None):
     parser_stat_odds_ratio.add_argument("--pseudocount", type=int, default=1, help="Pseudocount to avoid /0 (Default: 1)")
     parser_stat_odds_ratio.add_argument("--alternative", type=str, default="two-sided", choices=["two-sided", "less", "greater"], help="Alternative hypothesis for Fisher's exact test (Default: two-sided)")
     parser_stat_odds_ratio.add_argument("--dir", type=str, help="Output directory",default='../out')
-    parser_stat_odds_ratio.add_argument("--file", type=str, help="Output file name",default=f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}_odds_ratio.csv')
+    parser_stat_odds_ratio.add_argument("--file", type=str, help="Output file name",default=TimestampedName('_odds_ratio.csv'))
     parser_stat_odds_ratio.add_argument("--verbose", action="store_true", help="Print progress to console", default=False)
 
-    parser_stat_odds_ratio.set_defaults(func=st.odds_ratio)
+    parser_stat_odds_ratio.set_defaults(func=_lazy('stat', 'odds_ratio'))
+
+def add_io_subparser(subparsers, formatter_class=None):
+    """
+    add_io_subparser(): Attach the io subparsers (ind.gen.io) to the top-level CLI.
 
+    Parameters:
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the io subparser to.
+    formatter_class (type, optional): The formatter class to use for the subparsers.
+    """
     '''
     ind.gen.io:
     - in_subs(): moves all files with a given suffix into subfolders named after the files (excluding the suffix).
@@ -682,6 +739,14 @@ def add_subparser(subparsers, formatter_class=None):
     parser_io_out_subs.set_defaults(func=io.out_subs)
     parser_io_excel_csvs.set_defaults(func=io.excel_csvs)
 
+def add_com_subparser(subparsers, formatter_class=None):
+    """
+    add_com_subparser(): Attach the com subparsers (ind.gen.com) to the top-level CLI.
+
+    Parameters:
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the com subparser to.
+    formatter_class (type, optional): The formatter class to use for the subparsers.
+    """
     '''
     ind.gen.com:
     - create_export_var(): create a persistent environment variable by adding it to the user's shell config.
@@ -706,6 +771,14 @@ def add_subparser(subparsers, formatter_class=None):
     parser_com_create_export_var.set_defaults(func=com.create_export_var)
     parser_com_view_export_vars.set_defaults(func=com.view_export_vars)
 
+def add_html_subparser(subparsers, formatter_class=None):
+    """
+    add_html_subparser(): Attach the html subparser (ind.gen.html) to the top-level CLI.
+
+    Parameters:
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the html subparser to.
+    formatter_class (type, optional): The formatter class to use for the subparsers.
+    """
     '''
     ind.gen.html:
     - make_html_index(): Create an index HTML that links to other HTML files in `dir`.
@@ -728,4 +801,15 @@ def add_subparser(subparsers, formatter_class=None):
     parser_html.add_argument("--preview_height_px", type=int, help="Height of the preview iframe in pixels", default=900)
     parser_html.add_argument("--icon", type=str, help="Name of the SVG icon file (without .svg) to use as favicon", default="python")
     
-    parser_html.set_defaults(func=ht.make_html_index)
\ No newline at end of file
+    parser_html.set_defaults(func=_lazy('html', 'make_html_index'))
+
+def add_subparser(subparsers, formatter_class=None):
+    """
+    add_subparser(): Attach all gen-related subparsers to the top-level CLI.
+
+    Parameters:
+    subparsers (argparse._SubParsersAction): The subparsers object to attach the gen subparsers to.
+    formatter_class (type, optional): The formatter class to use for the subparsers.
+    """
+    for add in (add_plot_subparser, add_stat_subparser, add_io_subparser, add_com_subparser, add_html_subparser):
+        add(subparsers, formatter_class)
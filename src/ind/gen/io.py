@@ -15,7 +15,7 @@ Usage:
 
 [Output]
 - save(): save .csv file to a specified output directory from obj
-- save_dir(): save .csv files to a specified output directory from dictionary of objs
+- save_dir(): save .csv files to a specified output directory from dictionary of objs (or one .xlsx/.parquet)
 
 [Input/Output]
 - excel_csvs(): exports excel file to .csv files in specified directory
@@ -36,8 +36,9 @@ import ast
 import csv
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-from ..utils import try_parse, mkdir
+from ..utils import try_parse, mkdir, _literal_candidate
 
 # Parsing Python literals
 def df_try_parse(df: pd.DataFrame) -> pd.DataFrame:
@@ -47,11 +48,14 @@ def df_try_parse(df: pd.DataFrame) -> pd.DataFrame:
     Parameters: 
     df (dataframe): dataframe with columns to try_parse()
 
-    Dependencies: utils.try_parse()
+    Dependencies: utils[try_parse(),_literal_candidate()]
     '''
-    # Apply the parsing function to all columns
-    for col in df.columns:
-        df[col] = df[col].apply(try_parse)
+    # Only object/string columns can hold literals; parse their values in one pass per column
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        values = df[col].to_numpy().tolist()
+        # Leave columns untouched (no copy or reassignment) when no value could be a literal
+        if not any(isinstance(v, str) and _literal_candidate(v) for v in values): continue
+        df[col] = [try_parse(v) for v in values]
     return df
 
 def recursive_json_decode(obj):
@@ -63,20 +67,70 @@ def recursive_json_decode(obj):
     
     Dependencies: json
     '''
-    if isinstance(obj, dict):
-        return {k: recursive_json_decode(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [recursive_json_decode(item) for item in obj]
-    elif isinstance(obj, str):
-        try:
-            decoded = json.loads(obj)
-            return recursive_json_decode(decoded)
-        except (json.JSONDecodeError, TypeError):
-            return obj
-    return obj
+    # Walk the structure with an explicit stack of (container, key, owned) slots rather than recursing;
+    # containers from the caller are copied, while those json.loads() just built are owned & updated in place
+    root = [obj]
+    stack = [(root, 0, False)]
+    while stack:
+        parent, key, owned = stack.pop()
+        node = parent[key]
+        while isinstance(node, str): # Decode until the value is not a JSON string
+            try:
+                node = json.loads(node)
+                owned = True
+            except (json.JSONDecodeError, TypeError):
+                break
+        if isinstance(node, dict):
+            if not owned: node = dict(node)
+            stack.extend((node, k, owned) for k in node)
+        elif isinstance(node, list):
+            if not owned: node = list(node)
+            stack.extend((node, i, owned) for i in range(len(node)))
+        parent[key] = node
+    return root[0]
 
 # Input
-def get(pt: str, literal_eval:bool=False, **kwargs) -> pd.DataFrame | dict[pd.DataFrame]:
+def _read_xlsx(pt: str, **kwargs) -> dict[pd.DataFrame]:
+    '''
+    _read_xlsx(): returns dictionary of dataframes (one per sheet) from an excel file, opening the workbook once
+    '''
+    with pd.ExcelFile(pt) as xl:
+        return {sheet_name:pd.read_excel(xl,sheet_name,**kwargs) for sheet_name in xl.sheet_names}
+
+def _read_other(pt: str, **kwargs) -> pd.DataFrame:
+    return pd.read_csv(filepath_or_buffer=pt,**kwargs)
+
+def _read_pyarrow(pt: str, sep: str=',', **kwargs) -> pd.DataFrame:
+    '''
+    _read_pyarrow(): returns pandas dataframe from a delimited file using pyarrow's multithreaded csv reader
+        (falls back to pandas.read_csv() if pyarrow is not installed)
+    '''
+    try:
+        import pyarrow.csv as pv
+    except ImportError:
+        return pd.read_csv(filepath_or_buffer=pt,sep=sep,**kwargs)
+    if kwargs: raise ValueError(f"backend='pyarrow' does not take pandas.read_csv() parameters: {', '.join(kwargs)}")
+    table = pv.read_csv(pt, read_options=pv.ReadOptions(use_threads=True), parse_options=pv.ParseOptions(delimiter=sep))
+    return table.to_pandas(self_destruct=True) # Frees arrow buffers as columns are converted
+
+# Readers by file suffix; anything else is read as a .csv with pandas defaults
+_READERS = {
+    'csv': lambda pt, **kwargs: pd.read_csv(filepath_or_buffer=pt,sep=',',**kwargs),
+    'tsv': lambda pt, **kwargs: pd.read_csv(filepath_or_buffer=pt,sep='\t',**kwargs),
+    'xlsx': _read_xlsx,
+    'html': lambda pt, **kwargs: pd.read_html(pt,**kwargs),
+    'parquet': lambda pt, **kwargs: pd.read_parquet(pt,**kwargs),
+}
+
+def _stream(reader, literal_eval: bool=False):
+    '''
+    _stream(): yields dataframe chunks from a pandas.read_csv() reader, applying df_try_parse() per chunk if literal_eval
+    '''
+    with reader:
+        for chunk in reader:
+            yield df_try_parse(chunk) if literal_eval else chunk
+
+def get(pt: str, literal_eval:bool=False, backend: str='pandas', stream: bool=False, **kwargs) -> pd.DataFrame | dict[pd.DataFrame]:
     ''' 
     get(): returns pandas dataframe from a file
     
@@ -85,34 +139,31 @@ def get(pt: str, literal_eval:bool=False, **kwargs) -> pd.DataFrame | dict[pd.Da
     literal_evals (bool, optional): convert Python literals encoded as strings (Default: False)
         (1) automatically detects and parses columns containing Python literals (e.g., dict, list, set, tuple) encoded as strings
         (2) recursively evaluates nested structures
+    backend (str, optional): 'pandas' or 'pyarrow' to read delimited files with pyarrow.csv; faster on large/wide files (Default: pandas)
+    stream (bool, optional): return an iterator of dataframe chunks instead of one dataframe, for delimited files too large for memory (Default: False)
+        (1) chunk size in rows is set with chunksize (Default: 1048576)
+        (2) literal_eval is applied to each chunk
     **kwargs: pandas.read_csv() parameters
     
-    Dependencies: pandas,ast,utils[try_parse(),recursive_parse()],df_try_parse()
+    Dependencies: pandas,os,pyarrow (optional),utils[try_parse(),recursive_parse()],df_try_parse(),_READERS,_stream()
     '''
-    suf = pt.split('.')[-1]
-    if suf=='csv': 
-        if literal_eval: return df_try_parse(pd.read_csv(filepath_or_buffer=pt,sep=',',**kwargs))
-        else: return pd.read_csv(filepath_or_buffer=pt,sep=',',**kwargs)
-    elif suf=='tsv': 
-        if literal_eval: return df_try_parse(pd.read_csv(filepath_or_buffer=pt,sep='\t',**kwargs))
-        else: return pd.read_csv(filepath_or_buffer=pt,sep='\t',**kwargs)
-    elif suf=='xlsx': 
-        if literal_eval: 
-            dc = {sheet_name:df_try_parse(pd.read_excel(pt,sheet_name,**kwargs))
-                                 for sheet_name in pd.ExcelFile(pt).sheet_names}
-        else: 
-            dc = {sheet_name:pd.read_excel(pt,sheet_name,**kwargs)
-                                 for sheet_name in pd.ExcelFile(pt).sheet_names}
-        print(f"Excel file: {pt}\nKeys: {', '.join([key for key in dc.keys()])}")
-        return dc
-    elif suf=='html': 
-        if literal_eval: return df_try_parse(pd.read_html(pt,**kwargs))
-        else: return pd.read_html(pt,**kwargs)
-    else: 
-        if literal_eval: return df_try_parse(pd.read_csv(filepath_or_buffer=pt,**kwargs))
-        else: return pd.read_csv(filepath_or_buffer=pt,**kwargs)
+    if backend not in ('pandas','pyarrow'): raise ValueError(f"backend must be 'pandas' or 'pyarrow', not {backend!r}")
+    suf = os.path.splitext(pt)[1][1:].lower()
+    if stream:
+        if suf in ('xlsx','html','parquet'): raise ValueError(f"stream=True only works for delimited files, not .{suf}")
+        kwargs.setdefault('chunksize', 1 << 20)
+        return _stream(pd.read_csv(filepath_or_buffer=pt,sep='\t' if suf=='tsv' else ',',**kwargs), literal_eval)
+    if backend=='pyarrow' and suf not in ('xlsx','html','parquet'):
+        obj = _read_pyarrow(pt, sep='\t' if suf=='tsv' else ',', **kwargs)
+    else: obj = _READERS.get(suf, _read_other)(pt, **kwargs)
+    if suf=='xlsx':
+        if literal_eval: obj = {sheet_name:df_try_parse(df) for sheet_name,df in obj.items()}
+        print(f"Excel file: {pt}\nKeys: {', '.join([key for key in obj.keys()])}")
+        return obj
+    if literal_eval: return df_try_parse(obj)
+    else: return obj
     
-def get_dir(dir: str, suf: str='.csv', literal_eval: bool=False, **kwargs) -> dict[pd.DataFrame]:
+def get_dir(dir: str, suf: str='.csv', literal_eval: bool=False, backend: str='pandas', **kwargs) -> dict[pd.DataFrame]:
     ''' 
     get_dir(): returns python dictionary of dataframe from files within a directory
     
@@ -122,16 +173,66 @@ def get_dir(dir: str, suf: str='.csv', literal_eval: bool=False, **kwargs) -> di
     literal_evals (bool, optional): convert Python literals encoded as strings (Default: False)
         (1) automatically detects and parses columns containing Python literals (e.g., dict, list, set, tuple) encoded as strings
         (2) recursively evaluates nested structures
+    backend (str, optional): 'pandas' or 'pyarrow'; see get() (Default: pandas)
     **kwargs: pandas.read_csv() parameters
     
-    Dependencies: pandas
+    Dependencies: pandas, os, concurrent.futures, & get()
     '''
-    files = [file for file in os.listdir(dir) if file[-len(suf):]==suf]
-    dc = {file[:-len(suf)]:get(os.path.join(dir,file),literal_eval,**kwargs) for file in files}
+    with os.scandir(dir) as entries:
+        files = [entry.name for entry in entries if entry.name.endswith(suf)]
+    # Files are independent & pandas parsers release the GIL, so read them concurrently (keeps file order)
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4)) as executor:
+        dfs = list(executor.map(lambda file: get(os.path.join(dir,file),literal_eval,backend,**kwargs), files))
+    dc = {file[:-len(suf)]:df for file,df in zip(files,dfs)}
     print(f"Directory: {dir}\nKeys: {', '.join([key for key in dc.keys()])}")
     return dc
 
 # Output
+def _check_cols(cols: list):
+    for col in cols: # Check if each element in the list is a string
+        if not isinstance(col, str):
+            raise ValueError("All elements in the list must be strings.")
+
+def _save_df(pt: str, base: str, suf: str, obj: pd.DataFrame, cols: list, id: bool, sort: bool, **kwargs):
+    _check_cols(cols)
+    if cols!=[]: obj = obj[cols]
+    if suf=='tsv': obj.to_csv(pt, index=id, sep='\t', **kwargs)
+    elif suf=='xlsx': 
+        with pd.ExcelWriter(pt) as writer: 
+            obj.to_excel(writer,sheet_name=base,index=id) # Dataframe per sheet
+    else: obj.to_csv(pt, index=id, **kwargs)
+
+def _save_seq(pt: str, base: str, suf: str, obj, cols: list, id: bool, sort: bool, **kwargs):
+    if sort==True: obj2 = sorted(obj)
+    else: obj2=list(obj)
+    fields = ['' if x is None else str(x) for x in obj2] # Fields as csv.writer() formats them
+    with open(pt, 'w', newline='') as csv_file:
+        if fields==[''] or any(',' in f or '"' in f or '\r' in f or '\n' in f for f in fields):
+            csv_writer = csv.writer(csv_file, dialect='excel') # Create a CSV writer object to quote fields
+            csv_writer.writerow(obj2) # Write each row of the list to the CSV file
+        else: csv_file.write(','.join(fields)+'\r\n') # Nothing to quote; same output as csv.writer()
+
+def _save_dict(pt: str, base: str, suf: str, obj: dict, cols: list, id: bool, sort: bool, **kwargs):
+    if suf=='xlsx':
+        _check_cols(cols)
+        with pd.ExcelWriter(pt) as writer:
+            for key,df in obj.items(): 
+                if cols!=[]: df = df[cols]
+                df.to_excel(writer,sheet_name=key,index=id) # Dataframe per sheet
+    elif suf=='parquet': # One dataset directory partitioned by key (requires pyarrow)
+        df = pd.concat({str(key):df if cols==[] else df[cols] for key,df in obj.items()}, names=['key'])
+        df.reset_index(level='key').to_parquet(pt,partition_cols=['key'],index=id)
+    else: raise ValueError(f'save() does not work for {type(obj)} objects with {suf} files.')
+
+# Writers by exact object type (subclasses are not supported, as before)
+_SAVERS = {
+    pd.DataFrame: _save_df,
+    set: _save_seq,
+    list: _save_seq,
+    pd.Series: _save_seq,
+    dict: _save_dict,
+}
+
 def save(dir: str, file: str, obj, cols: list=[], id: bool=False, sort: bool=True, **kwargs):
     ''' 
     save(): save .csv file to a specified output directory from obj
@@ -139,43 +240,22 @@ def save(dir: str, file: str, obj, cols: list=[], id: bool=False, sort: bool=Tru
     Parameters:
     dir (str): output directory path
     file (str): file name
-    obj: dataframe, series, set, or list
+    obj: dataframe, series, set, or list (or dict of dataframes for .xlsx/.parquet)
     cols (str, list, optional): isolate dataframe column(s)
     id (bool, optional): include dataframe index (False)
     sort (bool, optional): sort set, list, or series before saving (True)
     
-    Dependencies: pandas, os, csv & utils.mkdir()
+    Dependencies: pandas, os, csv, utils.mkdir() & _SAVERS
     '''
     mkdir(dir) # Make output directory if it does not exist
+    base, suf = os.path.splitext(file)
+    suf = suf[1:].lower()
 
-    if type(obj)==pd.DataFrame:
-        for col in cols: # Check if each element in the list is a string
-            if not isinstance(col, str):
-                raise ValueError("All elements in the list must be strings.")
-        if cols!=[]: obj = obj[cols]
-        if file.split('.')[-1]=='tsv': obj.to_csv(os.path.join(dir,file), index=id, sep='\t', **kwargs)
-        elif file.split('.')[-1]=='xlsx': 
-            with pd.ExcelWriter(os.path.join(dir,file)) as writer: 
-                obj.to_excel(writer,sheet_name='.'.join(file.split('.')[:-1]),index=id) # Dataframe per sheet
-        else: obj.to_csv(os.path.join(dir,file), index=id, **kwargs)
-    elif type(obj)==set or type(obj)==list or type(obj)==pd.Series:
-        if sort==True: obj2 = sorted(list(obj))
-        else: obj2=list(obj)
-        with open(os.path.join(dir,file), 'w', newline='') as csv_file:
-            csv_writer = csv.writer(csv_file, dialect='excel') # Create a CSV writer object
-            csv_writer.writerow(obj2) # Write each row of the list to the CSV file
-    elif (type(obj)==dict)&(file.split('.')[-1]=='xlsx'):
-        for col in cols: # Check if each element in the list is a string
-            if not isinstance(col, str):
-                raise ValueError("All elements in the list must be strings.")
-        with pd.ExcelWriter(os.path.join(dir,file)) as writer:
-            if cols!=[]: obj = obj[cols]
-            for key,df in obj.items(): 
-                if cols!=[]: df = df[cols]
-                df.to_excel(writer,sheet_name=key,index=id) # Dataframe per sheet
-    else: raise ValueError(f'save() does not work for {type(obj)} objects with {file.split(".")[-1]} files.')
+    saver = _SAVERS.get(type(obj))
+    if saver is None: raise ValueError(f'save() does not work for {type(obj)} objects with {suf} files.')
+    saver(os.path.join(dir,file), base, suf, obj, cols, id, sort, **kwargs)
 
-def save_dir(dir: str, dc: dict, suf: str='.csv', **kwargs):
+def save_dir(dir: str, dc: dict, suf: str='.csv', file: str=None, **kwargs):
     ''' 
     save_dir(): save .csv files to a specified output directory from dictionary of objs
     
@@ -183,10 +263,15 @@ def save_dir(dir: str, dc: dict, suf: str='.csv', **kwargs):
     dir (str): output directory path
     dc (dict): dictionary of objects (files)
     suf (str, optional): file name suffix (Default: .csv)
+    file (str, optional): write all dataframes to this one file instead of a file per key (Default: None)
+        (1) .xlsx: one workbook with a sheet per key
+        (2) .parquet: one dataset directory partitioned by a 'key' column (requires pyarrow)
 
     Dependencies: pandas, os, csv, & save()
     '''
-    for key,val in dc.items(): save(dir=dir,file=str(key)+suf,obj=val,**kwargs)
+    if file is not None: save(dir=dir,file=file,obj=dc,**kwargs)
+    else: 
+        for key,val in dc.items(): save(dir=dir,file=str(key)+suf,obj=val,**kwargs)
 
 # Input/Output
 def excel_csvs(pt: str, dir: str='', **kwargs):
@@ -199,11 +284,12 @@ def excel_csvs(pt: str, dir: str='', **kwargs):
     
     Dependencies: pandas, os, & mkdir
     '''
-    if dir=='': dir = '.'.join(pt.split('.')[:-1]) # Get the directory where the Excel file is located
+    if dir=='': dir = os.path.splitext(pt)[0] # Get the directory where the Excel file is located
     mkdir(dir) # Make output directory if it does not exist
-    for sheet_name in pd.ExcelFile(pt).sheet_names: # Loop through each sheet in the Excel file
-        df = pd.read_excel(pd.ExcelFile(pt),sheet_name,**kwargs) # Read the sheet into a DataFrame
-        df.to_csv(os.path.join(dir,f"{sheet_name}.csv"),index=False) # Save the DataFrame to a CSV file
+    with pd.ExcelFile(pt) as xl: # Open the workbook once for all sheets
+        for sheet_name in xl.sheet_names: # Loop through each sheet in the Excel file
+            df = pd.read_excel(xl,sheet_name,**kwargs) # Read the sheet into a DataFrame
+            df.to_csv(os.path.join(dir,f"{sheet_name}.csv"),index=False) # Save the DataFrame to a CSV file
 
 def df_to_dc_txt(df: pd.DataFrame) -> str:
     ''' 
@@ -214,16 +300,17 @@ def df_to_dc_txt(df: pd.DataFrame) -> str:
     
     Dependencies: pandas
     '''
-    dict_text = "{\n"
-    for index, row in df.iterrows():
-        dict_text += f"  {index}: {{\n"
-        for col in df.columns:
-            value = row[col]
+    cols = df.columns.tolist()
+    parts = ["{\n"] # Collect pieces & join once instead of repeatedly concatenating the string
+    for index, *values in df.itertuples(index=True, name=None):
+        parts.append(f"  {index}: {{\n")
+        for col, value in zip(cols, values):
             if isinstance(value, str):
                 value = f"'{value}'"
-            dict_text += f"    '{col}': {value},\n"
-        dict_text = dict_text.rstrip(",\n") + "\n  },\n"  # Remove trailing comma for last key-value pair
-    dict_text = dict_text.rstrip(",\n") + "\n}"  # Close the main dictionary
+            parts.append(f"    '{col}': {value},\n")
+        parts[-1] = parts[-1].rstrip(",\n") + "\n  },\n"  # Remove trailing comma for last key-value pair
+    parts[-1] = parts[-1].rstrip(",\n") + "\n}"  # Close the main dictionary
+    dict_text = "".join(parts)
     print(dict_text)
     return dict_text
 
@@ -235,10 +322,23 @@ def dc_txt_to_df(dc_txt: str, transpose: bool=True) -> str:
     dc_txt (str): text that resembles a Python dictionary
     transpose (bool, optional): transpose dataframe (True)
     
-    Dependencies: pandas & ast
+    Dependencies: pandas, json & ast
+    '''
+    try: data = json.loads(dc_txt) # C parser for JSON-compatible text
+    except json.JSONDecodeError: data = ast.literal_eval(dc_txt) # Python literals (e.g., df_to_dc_txt() output)
+    if not isinstance(data, dict): # e.g., list of records
+        return pd.DataFrame(data).T if transpose==True else pd.DataFrame(data)
+    # Build rows directly from the outer keys rather than building columns then transposing (keeps column dtypes)
+    return pd.DataFrame.from_dict(data, orient='index' if transpose==True else 'columns')
+
+def _move(src: str, dst: str):
     '''
-    if transpose==True: return pd.DataFrame(ast.literal_eval(dc_txt)).T
-    else: return pd.DataFrame(ast.literal_eval(dc_txt))
+    _move(): move a file with a single rename, falling back to shutil.move() (e.g., across filesystems)
+    '''
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
 
 def in_subs(dir: str, suf: str): 
     '''
@@ -253,19 +353,20 @@ def in_subs(dir: str, suf: str):
     if not os.path.isdir(dir):
         raise ValueError(f"{dir} is not a valid directory.")
 
-    for filename in os.listdir(dir):
-        file_path = os.path.join(dir, filename)
-        
-        if os.path.isfile(file_path) and filename.endswith(suf):
-            base_name = filename[:-len(suf)]
-            subdir = os.path.join(dir, base_name)
+    with os.scandir(dir) as entries: # Listed up front since files are moved below
+        files = [entry for entry in entries if entry.name.endswith(suf) and entry.is_file()]
+
+    for entry in files:
+        filename, file_path = entry.name, entry.path
+        base_name = filename[:-len(suf)]
+        subdir = os.path.join(dir, base_name)
 
-            # Create subfolder if it doesn't exist
-            os.makedirs(subdir, exist_ok=True) 
+        # Create subfolder if it doesn't exist
+        os.makedirs(subdir, exist_ok=True) 
 
-            # Move the file into the subfolder
-            new_path = os.path.join(subdir, filename)
-            shutil.move(file_path, new_path)
+        # Move the file into the subfolder
+        new_path = os.path.join(subdir, filename)
+        _move(file_path, new_path)
 
 def out_subs(dir: str):
     """
@@ -277,25 +378,30 @@ def out_subs(dir: str):
     if not os.path.isdir(dir):
         raise ValueError(f"{dir} is not a valid directory.")
 
+    taken = set(os.listdir(dir)) # Names in the parent directory; avoids a stat per conflict candidate
+    counters = {} # Next counter to try per file name, so K duplicates don't rescan 1..K each time
     for root, dirs, files in os.walk(dir, topdown=False):
-        for file in files:
-            file_path = os.path.join(root, file)
-            target_path = os.path.join(dir, file)
-
-            # Resolve name conflicts by appending a counter
-            base, ext = os.path.splitext(file)
-            counter = 1
-            while os.path.exists(target_path):
-                target_path = os.path.join(dir, f"{base}_{counter}{ext}")
-                counter += 1
-
-            shutil.move(file_path, target_path)
+        if root != dir: # Files already in the parent directory stay put
+            for file in files:
+                file_path = os.path.join(root, file)
+
+                # Resolve name conflicts by appending a counter
+                name = file
+                base, ext = os.path.splitext(file)
+                counter = counters.get(file, 1)
+                while name in taken:
+                    name = f"{base}_{counter}{ext}"
+                    counter += 1
+                counters[file] = counter
+                taken.add(name)
+
+                _move(file_path, os.path.join(dir, name))
 
         # Remove empty directories
-        for dir in dirs:
-            dir_path = os.path.join(root, dir)
-            if os.path.isdir(dir_path) and not os.listdir(dir_path):
-                os.rmdir(dir_path)
+        for sub in dirs:
+            sub_path = os.path.join(root, sub)
+            if os.path.isdir(sub_path) and not os.listdir(sub_path):
+                os.rmdir(sub_path)
 
 # Directory Methods
 def relative_paths(root_dir: str) -> list[str]:
@@ -307,13 +413,28 @@ def relative_paths(root_dir: str) -> list[str]:
 
     Dependencies: os
     '''
-    relative_paths = []
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        for filename in filenames:
-            # Get the relative path of the file
-            relative_path = os.path.relpath(os.path.join(dirpath, filename), root_dir)
-            relative_paths.append(relative_path)
-    return relative_paths
+    return list(_relative_paths(root_dir))
+
+def _relative_paths(dir: str, rel: str=''):
+    '''
+    _relative_paths(): yields relative paths like os.walk() (files, then subfolders) while building them by
+    prefix instead of os.path.relpath() per file
+    '''
+    try:
+        with os.scandir(dir) as entries:
+            entries = list(entries)
+    except OSError: # Unreadable directories are skipped, as with os.walk()
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir: yield rel + entry.name # Get the relative path of the file
+        elif not entry.is_symlink(): subdirs.append(entry) # Symlinked folders are not followed
+    for entry in subdirs:
+        yield from _relative_paths(entry.path, rel + entry.name + os.sep)
 
 def sorted_file_names(dir: str, suf: str='.csv') -> list[str]:
     '''
@@ -324,4 +445,5 @@ def sorted_file_names(dir: str, suf: str='.csv') -> list[str]:
 
     Dependencies: os
     '''
-    return sorted([file for file in os.listdir(dir) if file[-len(suf):]==suf])
\ No newline at end of file
+    with os.scandir(dir) as entries:
+        return sorted(entry.name for entry in entries if entry.name.endswith(suf) and entry.is_file())
\ No newline at end of file
@@ -12,6 +12,15 @@ Usage:
 - _user_config_dir(appname): Get cross-platform user config directory
 - _maybe_show_first_run_notice(appname): Show a post-install notice only once per version
 
+[Subparsers]
+- _add_autocomplete_subparser(subparsers, formatter_class): Add the autocomplete command
+- _add_config_subparser(subparsers, formatter_class): Add the config get/set/del commands
+- _COMMANDS: Top-level commands -> (help, module, subparser registration function)
+- _cli(command): Import and return the module that implements a top-level command
+- _add_command_subparser(command, subparsers, formatter_class): Build the subparser tree for one top-level command
+- MyFormatter: Rich help formatter with the ind color scheme
+- _build_parser(command, help_only): Build (once per process) the argument parser for one command, every command, or the command list
+
 [Main method]
 - main(): Investigational New Drug (IND) Application
 '''
@@ -23,24 +32,14 @@ import argparse
 import argcomplete
 import ast
 import datetime
+import functools
+import importlib
 from rich_argparse import RichHelpFormatter
 from rich import print as rprint
 
 from . import config
 from . import utils
 
-from .gen import io
-
-from ind.pubchem import cli as pubchem_cli
-from ind.uspto_odp import cli as uspto_cli
-from ind.openfda import cli as openfda_cli
-from ind.clinical_trials import cli as clinical_trials_cli
-from ind.naaccr import cli as naaccr_cli
-from ind.seer import cli as seer_cli
-from ind.ncbi import cli as ncbi_cli
-from ind.gen import cli as gen_cli
-from ind.aggregator import cli as aggregator_cli
-
 # Show post-install notice only once per version
 try:
     # Py3.8+: importlib.metadata in stdlib
@@ -108,52 +107,27 @@ def _maybe_show_first_run_notice(appname: str = "ind") -> None:
         # Non-fatal: if we can't write, just skip persisting
         pass
 
-# Main method
-def main(argv=None):
-    '''
-    main(): Investigation New Drug (IND) Application
-    '''
-    rprint("[green]Project: Investigation New Drug (IND) Application[/green]")
-    _maybe_show_first_run_notice()
-
-    # Custom formatter for rich help messages
-    class MyFormatter(RichHelpFormatter):
-        styles = {
-            "argparse.prog": "green",           # program name
-            "argparse.args": "cyan",            # positional arguments
-            "argparse.option": "",              # options like --flag
-            "argparse.metavar": "dark_magenta", # meta variable (actual function argument name)
-            "argparse.help": "blue",            # help text
-            "argparse.text": "green",           # normal text in help message
-            "argparse.groups": "red",           # group titles
-            "argparse.description": "",         # description at the top
-            "argparse.epilog": "",              # ... -h; epilog at the bottom
-            "argparse.syntax": "white",         # []
-        }
-
-    # Add parser and subparsers
-    parser = argparse.ArgumentParser(description="Investigation New Drug (IND) Application", formatter_class=MyFormatter)
-    subparsers = parser.add_subparsers(dest="command") # dest="command" required for autocomplete
-
+def _add_autocomplete_subparser(subparsers, formatter_class):
     '''
     ind.utils:
     - run_bundled_script(): Run a bundled script from the package script resources.
     '''
-    subparsers.add_parser("autocomplete", help="Enable ind autocomplete", description="Enable ind autocomplete", formatter_class=MyFormatter) # Run autocomplete script (args.command == "autocomplete")
+    subparsers.add_parser("autocomplete", help="Enable ind autocomplete", description="Enable ind autocomplete", formatter_class=formatter_class) # Run autocomplete script (args.command == "autocomplete")
 
+def _add_config_subparser(subparsers, formatter_class):
     '''
     ind.config:
     - get_info: Retrieve information based on id
     - set_info: Set information based on id
     - del_info: Delete information based on id
     '''
-    parser_config = subparsers.add_parser("config", help="Configuration", description="Configuration", formatter_class=MyFormatter)
+    parser_config = subparsers.add_parser("config", help="Configuration", description="Configuration", formatter_class=formatter_class)
     subparsers_config = parser_config.add_subparsers()
 
     # Add subparsers for config module
-    parser_config_get_info = subparsers_config.add_parser("get", help="Retrieve information based on id", description="Retrieve information based on id", formatter_class=MyFormatter)
-    parser_config_set_info = subparsers_config.add_parser("set", help="Set information based on id", description="Set information based on id", formatter_class=MyFormatter)
-    parser_config_del_info = subparsers_config.add_parser("del", help="Delete information based on id", description="Delete information based on id", formatter_class=MyFormatter)
+    parser_config_get_info = subparsers_config.add_parser("get", help="Retrieve information based on id", description="Retrieve information based on id", formatter_class=formatter_class)
+    parser_config_set_info = subparsers_config.add_parser("set", help="Set information based on id", description="Set information based on id", formatter_class=formatter_class)
+    parser_config_del_info = subparsers_config.add_parser("del", help="Delete information based on id", description="Delete information based on id", formatter_class=formatter_class)
 
     # get_info() arguments
     parser_config_get_info.add_argument("--id", type=str, help="Identifier from/for configuration file (e.g., SEER_API_KEY or USPTO_API_KEY)")
@@ -170,35 +144,92 @@ def main(argv=None):
     parser_config_set_info.set_defaults(func=config.set_info)
     parser_config_del_info.set_defaults(func=config.del_info)
 
-    # gen module subparsers: plot/stat/io
-    gen_cli.add_subparser(subparsers, MyFormatter)
-    
-    # pubchem module subparser
-    pubchem_cli.add_subparser(subparsers, MyFormatter)
-
-    # uspto module subparser
-    uspto_cli.add_subparser(subparsers, MyFormatter)
+# Top-level commands in help order: command -> (help, module, function that registers its subparser)
+# Command modules are only imported when their subparser is built (see _cli)
+_COMMANDS = {
+    "autocomplete": ("Enable ind autocomplete", __name__, "_add_autocomplete_subparser"),
+    "config": ("Configuration", __name__, "_add_config_subparser"),
+    "plot": ("Generate scatter, category, distribution, heatmap, stacked bar, and volcano plots", "ind.gen.cli", "add_plot_subparser"),
+    "stat": ("Statistics", "ind.gen.cli", "add_stat_subparser"),
+    "io": ("Input/Output", "ind.gen.cli", "add_io_subparser"),
+    "com": ("Command Line Interaction", "ind.gen.cli", "add_com_subparser"),
+    "html": ("HTML Index Creation", "ind.gen.cli", "add_html_subparser"),
+    "pubchem": ("Query PubChem PUG REST", "ind.pubchem.cli", "add_subparser"),
+    "uspto": ("USPTO Open Data Portal CLI", "ind.uspto_odp.cli", "add_subparser"),
+    "openfda": ("Query the OpenFDA APIs", "ind.openfda.cli", "add_subparser"),
+    "trials": ("ClinicalTrials.gov API", "ind.clinical_trials.cli", "add_subparser"),
+    "naaccr": ("NAACCR Data Dictionary tools", "ind.naaccr.cli", "add_subparser"),
+    "seer": ("SEER API", "ind.seer.cli", "add_subparser"),
+    "ncbi": ("Query the NCBI APIs", "ind.ncbi.cli", "add_subparser"),
+    "intel": ("Retrieve FDA-approved drugs for a company (OpenFDA)", "ind.aggregator.cli", "add_subparser"),
+}
+
+def _cli(command: str):
+    '''
+    _cli(command): Import and return the module that implements a top-level command
+    '''
+    return importlib.import_module(_COMMANDS[command][1])
 
-    # openfda module subparser
-    openfda_cli.add_subparser(subparsers, MyFormatter)
+def _add_command_subparser(command: str, subparsers, formatter_class):
+    '''
+    _add_command_subparser(command, subparsers, formatter_class): Build the subparser tree for one top-level command
+    '''
+    getattr(_cli(command), _COMMANDS[command][2])(subparsers, formatter_class)
+
+# Custom formatter for rich help messages
+class MyFormatter(RichHelpFormatter):
+    styles = {
+        "argparse.prog": "green",           # program name
+        "argparse.args": "cyan",            # positional arguments
+        "argparse.option": "",              # options like --flag
+        "argparse.metavar": "dark_magenta", # meta variable (actual function argument name)
+        "argparse.help": "blue",            # help text
+        "argparse.text": "green",           # normal text in help message
+        "argparse.groups": "red",           # group titles
+        "argparse.description": "",         # description at the top
+        "argparse.epilog": "",              # ... -h; epilog at the bottom
+        "argparse.syntax": "white",         # []
+    }
+
+@functools.lru_cache(maxsize=None) # At most one parser per command, plus the full and help-only parsers
+def _build_parser(command: str | None = None, help_only: bool = False) -> argparse.ArgumentParser:
+    '''
+    _build_parser(command, help_only): Build (once per process) the argument parser for one top-level command, every command (None), or just the command list (help_only)
+    '''
+    # Add parser and subparsers
+    parser = argparse.ArgumentParser(description="Investigation New Drug (IND) Application", formatter_class=MyFormatter)
+    subparsers = parser.add_subparsers(dest="command") # dest="command" required for autocomplete
 
-    # clinical_trials module subparser
-    clinical_trials_cli.add_subparser(subparsers, MyFormatter)
+    if help_only: # Help fast path: list commands only
+        for name, (help_text, _, _) in _COMMANDS.items():
+            subparsers.add_parser(name, help=help_text)
+        return parser
 
-    # naaccr module subparser
-    naaccr_cli.add_subparser(subparsers, MyFormatter)
+    for name in (_COMMANDS if command is None else (command,)):
+        _add_command_subparser(name, subparsers, MyFormatter)
 
-    # seer module subparser
-    seer_cli.add_subparser(subparsers, MyFormatter)
+    # default: show help if no subcommand
+    parser.set_defaults(func=lambda _: parser.print_help())
+    return parser
 
-    # ncbi module subparser
-    ncbi_cli.add_subparser(subparsers, MyFormatter)
+# Main method
+def main(argv=None):
+    '''
+    main(): Investigation New Drug (IND) Application
+    '''
+    rprint("[green]Project: Investigation New Drug (IND) Application[/green]")
+    _maybe_show_first_run_notice()
 
-    # Register aggregator “intel” command
-    aggregator_cli.add_subparser(subparsers, MyFormatter)
+    argv = sys.argv[1:] if argv is None else list(argv)
+    completing = "_ARGCOMPLETE" in os.environ
+    if not completing and (not argv or argv[0] in ("-h", "--help")):
+        parser = _build_parser(help_only=True)
+        parser.parse_args(argv) # exits after printing help for -h/--help
+        parser.print_help()
+        return 0
 
-    # default: show help if no subcommand
-    parser.set_defaults(func=lambda _: parser.print_help())
+    # Build (and import) only the selected command's subtree; every subtree for autocomplete, unknown commands & leading options
+    parser = _build_parser(argv[0] if not completing and argv[0] in _COMMANDS else None)
 
     # Enable autocomplete
     argcomplete.autocomplete(parser)
@@ -206,6 +237,14 @@ def main(argv=None):
     # Parse all arguments
     args = parser.parse_args(argv)
 
+    # The parser is cached, so copy list defaults (e.g., nargs="*", default=[]) to keep callees from mutating them for later calls,
+    # and re-stamp timestamped output file names, which otherwise keep the time the parser was built
+    for key, value in vars(args).items():
+        if isinstance(value, list):
+            setattr(args, key, list(value))
+        elif isinstance(value, utils.TimestampedName):
+            setattr(args, key, value.restamp())
+
     if args.command == 'autocomplete': # Run autocomplete script
         sys.exit(utils.run_bundled_script())
    
@@ -218,16 +257,16 @@ def main(argv=None):
         return 1
     
     elif args.command == 'uspto': # Run uspto function
-        return uspto_cli.run(args)
+        return _cli("uspto").run(args)
 
     elif args.command == 'openfda': # Run openfda function
-        return openfda_cli.run(args)
+        return _cli("openfda").run(args)
     
     elif args.command == 'trials': # Run clinical_trials function
-        return clinical_trials_cli.run(args)
+        return _cli("trials").run(args)
     
     elif args.command == 'naaccr':  # Run naaccr function
-        return naaccr_cli.run(args)
+        return _cli("naaccr").run(args)
 
     else: # Run other functions
         args_dict = vars(args)
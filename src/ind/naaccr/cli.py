@@ -21,9 +21,12 @@ except Exception:  # pragma: no cover
     Table = None  # type: ignore
     Console = None  # type: ignore
 
+# One console for the whole run; constructing it probes the terminal each time.
+_CONSOLE = Console() if Console else None
+
 
 def _print_versions(rows):
-    if Table and Console:
+    if Table and _CONSOLE:
         t = Table(title="NAACCR Versions")
         t.add_column("Version")
         t.add_column("YearImplemented")
@@ -34,7 +37,7 @@ def _print_versions(rows):
                 str(v.get("YearImplemented", "")),
                 str(v.get("DateOfPublication", "")),
             )
-        Console().print(t)
+        _CONSOLE.print(t)
     else:
         rprint(rows)
 
@@ -74,6 +77,7 @@ def add_subparser(subparsers: argparse._SubParsersAction, formatter_class) -> No
     p_search.add_argument("--minimize", action="store_true", help='Use minimize_results="true"')
     p_search.add_argument("--pages", type=int, default=1, help="Max pages to fetch")
     p_search.add_argument("--delay", type=float, default=0.25, help="Delay between page requests (sec)")
+    p_search.add_argument("--concurrency", type=int, default=1, help="Fetch pages with N threads")
     p_search.set_defaults(func=_cmd_search)
 
     # naaccr item
@@ -125,6 +129,7 @@ def _cmd_search(args: argparse.Namespace) -> int:
         minimize_results=bool(args.minimize),
         pages=int(args.pages),
         delay=float(args.delay),
+        concurrency=int(args.concurrency),
     )
     _print_items(rows)
     return 0
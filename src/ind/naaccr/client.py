@@ -2,11 +2,30 @@ from __future__ import annotations
 
 from typing import Any, Dict, Mapping, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from urllib.parse import urlencode
 
 JSON = Union[Dict[str, Any], Any]
 
 
+def _build_session() -> requests.Session:
+    """Session with a keep-alive connection pool and modest transport retries."""
+    s = requests.Session()
+    # gzip/deflate, plus br/zstd if their decoders are installed
+    s.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD", "OPTIONS"),
+        raise_on_status=False,
+    )
+    s.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return s
+
+
 class NAACCRClient:
     """
     Tiny HTTP client for the NAACCR Data Dictionary API.
@@ -24,11 +43,20 @@ class NAACCRClient:
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.session = session or _build_session()
         self.session.headers.update({"Accept": "application/json"})
         if headers:
             self.session.headers.update(dict(headers))
 
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "NAACCRClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _url(self, path: str) -> str:
         path = path.lstrip("/")
         return f"{self.base_url}/{path}"
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
+import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
 
 from .client import NAACCRClient
 
@@ -64,6 +68,38 @@ def get_data_item(
     return client.request_json("GET", path, params=params)
 
 
+def _get_page(client: NAACCRClient, url: str) -> Tuple[List[Any], Optional[str]]:
+    """Fetch an absolute page URL; return (results, next_url)."""
+    r = client.session.get(url, timeout=client.timeout)
+    r.raise_for_status()
+    page = r.json()
+    if isinstance(page, dict) and "results" in page:
+        return list(page.get("results") or []), page.get("next")
+    if isinstance(page, list):
+        return page, None
+    return [], None
+
+
+def _page_urls(next_url: str, first: int, count: int) -> Optional[List[str]]:
+    """
+    Derive `count` page URLs from a `next` link that carries a `page` param.
+
+    Only the `page` value is swapped; the rest of the server's query string is
+    kept byte for byte (no decode/re-encode round trip).
+    """
+    parts = urlsplit(next_url)
+    query = parts.query.split("&")
+    page_at = [i for i, kv in enumerate(query) if kv.partition("=")[0] == "page"]
+    if not page_at:
+        return None
+    urls = []
+    for n in range(first, first + count):
+        for i in page_at:
+            query[i] = f"page={n}"
+        urls.append(urlunsplit(parts._replace(query="&".join(query))))
+    return urls
+
+
 def search_data_items(
     client: NAACCRClient,
     naaccr_version: str,
@@ -72,6 +108,7 @@ def search_data_items(
     minimize_results: bool = False,
     pages: int = 1,
     delay: float = 0.25,
+    concurrency: int = 1,
 ) -> JSON:
     """
     GET /data_item/{naaccr_version}/?q=...
@@ -84,6 +121,11 @@ def search_data_items(
     A short sleep is used between page requests to avoid overloading the server.
     The delay (in seconds) between page requests can be adjusted via the
     `delay` argument.
+
+    With `concurrency > 1`, the remaining page URLs are derived from the first
+    page's `count` and `next` link and fetched by a thread pool; request starts
+    are still spaced at least `delay` seconds apart and results keep page order.
+    Falls back to following `next` sequentially if page URLs can't be derived.
     """
     if pages < 1:
         pages = 1
@@ -111,19 +153,31 @@ def search_data_items(
         return [resp]
 
     remaining = max(0, pages - 1)
+
+    if concurrency > 1 and remaining > 0 and next_url and items and isinstance(resp.get("count"), int):
+        total_pages = math.ceil(resp["count"] / len(items))
+        urls = _page_urls(next_url, 2, min(remaining, total_pages - 1))
+        if urls:
+            lock = threading.Lock()
+            last = [time.monotonic()]  # page 1 just went out; page 2 waits `delay` too
+
+            def fetch(url: str) -> List[Any]:
+                with lock:  # be polite: space out request starts by `delay`
+                    wait = last[0] + delay - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    last[0] = time.monotonic()
+                return _get_page(client, url)[0]
+
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for results in pool.map(fetch, urls):
+                    items.extend(results)
+            return items
+
     while remaining > 0 and next_url:
         time.sleep(delay)  # be polite to the public API
-        r = client.session.get(next_url, timeout=client.timeout)
-        r.raise_for_status()
-        page = r.json()
-        if isinstance(page, dict) and "results" in page:
-            items.extend(list(page.get("results") or []))
-            next_url = page.get("next")
-        elif isinstance(page, list):
-            items.extend(page)
-            next_url = None
-        else:
-            break
+        results, next_url = _get_page(client, next_url)
+        items.extend(results)
         remaining -= 1
 
     return items
@@ -6,11 +6,27 @@ from dataclasses import dataclass
 from typing import Any, Dict, Mapping, MutableMapping, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 
 log = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://api.fda.gov"
 
+
+def _build_session() -> requests.Session:
+    # Retries stay in `request_json`; the adapter only sizes the keep-alive pool.
+    s = requests.Session()
+    # Large label/event payloads: let the server compress them.
+    s.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    s.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+    return s
+
+
+# Shared across instances so short-lived clients (e.g. the aggregator) reuse sockets.
+_SHARED_SESSION = _build_session()
+
+
 @dataclass
 class OpenFDAClient:
     """Thin HTTP client for OpenFDA.
@@ -18,6 +34,8 @@ class OpenFDAClient:
     - Supports optional API key (X-Api-Key header)
     - Centralizes retries with backoff on 429/5xx
     - Adds convenience for `.json` suffixing and query params
+    - Pools keep-alive connections in one process-wide session; `close()` (or `with`)
+      only closes a session passed in by the caller, never the shared one
     """
 
     base_url: str = DEFAULT_BASE_URL
@@ -25,7 +43,18 @@ class OpenFDAClient:
     timeout: float = 30.0
     max_retries: int = 3
     backoff_factor: float = 1.5
-    session: requests.Session = requests.Session()
+    session: requests.Session = _SHARED_SESSION
+
+    def close(self) -> None:
+        # Other clients (possibly mid-request) use the shared pool; only close our own session
+        if self.session is not _SHARED_SESSION:
+            self.session.close()
+
+    def __enter__(self) -> "OpenFDAClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def _headers(self) -> Dict[str, str]:
         headers: Dict[str, str] = {"Accept": "application/json"}
@@ -9,12 +9,13 @@ src/ind/pubchem/
 '''
 from .client import PubChemClient
 from .urls import pug_rest_url
-from .http import pug_fetch
+from .http import pug_fetch, json_fast
 from . import endpoints
 
 __all__ = [
     "PubChemClient",
     "pug_rest_url",
     "pug_fetch",
+    "json_fast",
     "endpoints",
 ]
\ No newline at end of file
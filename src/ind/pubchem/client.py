@@ -1,16 +1,64 @@
 from __future__ import annotations
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional, Dict, Union, Iterable
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Optional, Dict, Union, Iterable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 
 DEFAULT_BASE = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
 
+
+class TTLCache:
+    """
+    Small thread-safe in-memory cache: entries expire after `ttl` seconds and
+    the least recently used entry is evicted once `maxsize` is exceeded.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires_at, value = hit
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 @dataclass
 class PubChemClient:
     """
     Lightweight HTTP client with connection pooling, polite rate limiting (<=5 rps),
     and simple retries for 503/504/500.
+
+    Successful GET responses from `pug_fetch` are kept in a per-client TTL cache
+    (`cache_ttl` seconds, `cache_maxsize` entries); set `cache_ttl=0` to disable.
     """
     base_url: str = DEFAULT_BASE
     timeout: float = 60.0
@@ -18,26 +66,58 @@ class PubChemClient:
     max_retries: int = 3
     backoff_factor: float = 0.75
     user_agent: str = "ind.pubchem/1.0 (+https://github.com/marczepeda/ind)"
+    cache_ttl: float = 300.0
+    cache_maxsize: int = 1000
     _last_call_ts: float = 0.0
     _session: Optional[requests.Session] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    cache: Optional[TTLCache] = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.cache_ttl > 0:
+            self.cache = TTLCache(self.cache_ttl, self.cache_maxsize)
 
     @property
     def session(self) -> requests.Session:
         if self._session is None:
-            s = requests.Session()
-            s.headers.update({"User-Agent": self.user_agent})
-            self._session = s
+            with self._lock:
+                if self._session is None:
+                    s = requests.Session()
+                    s.headers.update({
+                        "User-Agent": self.user_agent,
+                        # JSON/CSV/SDF bodies shrink a lot; accept every codec we can decode.
+                        "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+                    })
+                    # Keep-alive pool sized for a few threads sharing one client;
+                    # retries are handled in `request` below.
+                    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                    s.mount("https://", adapter)
+                    s.mount("http://", adapter)
+                    self._session = s
         return self._session
 
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "PubChemClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     # --- polite rate limiting: no more than max_rps per second ---
     def _throttle(self) -> None:
         if self.max_rps <= 0:
             return
         min_interval = 1.0 / self.max_rps
-        dt = time.time() - self._last_call_ts
-        if dt < min_interval:
-            time.sleep(min_interval - dt)
-        self._last_call_ts = time.time()
+        # Serialized so threads sharing a client still respect max_rps overall.
+        with self._lock:
+            dt = time.time() - self._last_call_ts
+            if dt < min_interval:
+                time.sleep(min_interval - dt)
+            self._last_call_ts = time.time()
 
     def request(self, * , method: str, url: str, **kwargs) -> requests.Response:
         """
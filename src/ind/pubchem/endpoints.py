@@ -79,7 +79,7 @@ def get_compound_properties(
     post_cid : Optional[str]
         Explicit CID list for the POST body (cid=...). If omitted for POST, 'identifiers' is used.
     to_file : Optional[str]
-        If provided, writes response to this path.
+        If provided, streams the response body to this path; the returned response can still be read (from the file).
     """
     m = method.upper()
     if m == "GET":
@@ -1,9 +1,16 @@
 from __future__ import annotations
 import urllib.parse
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 import requests
 from .urls import pug_rest_url
 
+_MISSING = object()
+
+try:  # optional: parses bytes directly, skipping the bytes -> str step
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 ACCEPT_BY_FORMAT: Dict[str, str] = {
     "XML":  "application/xml",
     "JSON": "application/json",
@@ -45,6 +52,45 @@ class PugRestError(requests.HTTPError):
         super().__init__(f"{response.status_code} {response.reason}: {hint}\n{snippet}",
                          response=response)
 
+def json_fast(resp: requests.Response) -> Any:
+    """
+    Parse a JSON response body, with orjson when it is installed.
+
+    The result is memoized on the response, so repeat calls (including on a
+    response served from the client's TTL cache) don't parse again. Treat it
+    as read-only; every caller gets the same object.
+    """
+    data = getattr(resp, "_ind_json", _MISSING)
+    if data is _MISSING:
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
+        resp._ind_json = data
+    return data
+
+class _FileBody:
+    """
+    Stand-in for `resp.raw` once a streamed body has been written to disk.
+
+    requests reads `raw` the first time `.content`, `.text` or `.json()` is
+    used, so those still work after `output_file=`; the file is only read
+    back if a caller asks for the body.
+    """
+
+    def __init__(self, path) -> None:
+        self._path = path
+        self._fh = None
+
+    def read(self, n: int = -1) -> bytes:
+        if self._fh is None:
+            self._fh = open(self._path, "rb")
+        data = self._fh.read(n)
+        if not data:
+            self.close()
+        return data
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
 def _encode_form(d: Dict[str, Union[str, int, float, bool, list]]) -> str:
     return urllib.parse.urlencode(d, doseq=True)
 
@@ -68,6 +114,10 @@ def pug_fetch(
 ) -> requests.Response:
     """
     Execute request via client's session (rate-limited + retries) and optionally write to file.
+
+    With `output_file`, the body is streamed to disk rather than held in memory; the
+    returned response's `.content`/`.text`/`.json()` still work, reading the file back on
+    first use.
     """
     url = pug_rest_url(
         input_specification=input_specification,
@@ -106,7 +156,18 @@ def pug_fetch(
             headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
             req_kwargs["data"] = b""
 
-    resp = client.request(method=method, url=url, **req_kwargs)
+    if output_file:
+        # Body goes straight to disk below; don't buffer it in memory first.
+        req_kwargs["stream"] = True
+
+    # PUG GETs are idempotent: serve repeats from the client's TTL cache.
+    cache = client.cache if method == "GET" else None
+    cache_key = (url, resolved_accept)
+    resp = cache.get(cache_key) if cache is not None else None
+    if resp is None:
+        resp = client.request(method=method, url=url, **req_kwargs)
+        if cache is not None and not output_file and 200 <= resp.status_code < 300:
+            cache.set(cache_key, resp)
 
     if raise_for_status and not (200 <= resp.status_code < 300):
         raise PugRestError(resp)
@@ -115,14 +176,17 @@ def pug_fetch(
         import pathlib
         path = pathlib.Path(output_file)
         path.parent.mkdir(parents=True, exist_ok=True)
-        ctype = (resp.headers.get("Content-Type") or "").lower()
-        text_like = any(x in ctype for x in ("json", "xml", "csv", "text", "javascript"))
-        if text_like:
-            path.write_text(resp.text, encoding="utf-8")
-        else:
-            path.write_bytes(resp.content)
+        size = 0
+        # Chunked writes keep memory flat for large SDF/PNG records;
+        # iter_content also undoes any gzip/br transfer encoding.
+        with path.open("wb") as fh:
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                fh.write(chunk)
+                size += len(chunk)
         if not quiet:
-            size_kb = len(resp.content) / 1024
-            print(f"[ind.pubchem] wrote {size_kb:.1f} KB → {path.resolve()}")
+            print(f"[ind.pubchem] wrote {size / 1024:.1f} KB → {path.resolve()}")
+        # iter_content consumed the body; let .content/.text/.json() read it back from the file
+        resp.raw = _FileBody(path)
+        resp._content_consumed = False
 
     return resp
\ No newline at end of file
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from typing import Any, Dict, Mapping, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from ..config import get_info
 
+try:  # optional: faster JSON decoding
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 JSON = Union[Dict[str, Any], Any]
 
 DEFAULT_BASE_URL = "https://api.seer.cancer.gov"
@@ -15,6 +24,23 @@ DEFAULT_USER_AGENT = "ind/seer (https://github.com/marczepeda/ind)"
 class SeerError(RuntimeError):
     """Raised for HTTP or API-level errors from the SEER API."""
 
+
+def _build_session() -> requests.Session:
+    """Session with a keep-alive connection pool and modest transport retries."""
+    s = requests.Session()
+    # gzip/deflate, plus br/zstd when their decoders are installed
+    s.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD", "OPTIONS"),
+        raise_on_status=False,
+    )
+    s.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry))
+    return s
+
+
 class SeerClient:
     """
     Minimal HTTP client for the SEER REST API.
@@ -39,8 +65,9 @@ class SeerClient:
         self.timeout = timeout
         self.user_agent = user_agent
         self.rate_limit_per_sec = rate_limit_per_sec
-        self._session = session or requests.Session()
+        self._session = session or _build_session()
         self._last_request_ts: Optional[float] = None
+        self._rate_lock = threading.Lock()
 
         self.api_key = api_key or os.getenv("SEER_API_KEY") or get_info("SEER_API_KEY")
         # default headers
@@ -64,20 +91,32 @@ Refer to https://api.seer.cancer.gov/usage to retrieve your SEER_API_KEY.""")
         if extra_headers:
             self._session.headers.update(dict(extra_headers))
 
+    def close(self) -> None:
+        """Release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "SeerClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     # ---- internals ---------------------------------------------------------
 
     def _respect_rate_limit(self) -> None:
         if not self.rate_limit_per_sec:
             return
-        now = time.monotonic()
-        if self._last_request_ts is None:
-            self._last_request_ts = now
-            return
-        min_interval = 1.0 / self.rate_limit_per_sec
-        elapsed = now - self._last_request_ts
-        if elapsed < min_interval:
-            time.sleep(max(0.0, min_interval - elapsed))
-        self._last_request_ts = time.monotonic()
+        # Locked so a client shared across threads still honours the limit.
+        with self._rate_lock:
+            now = time.monotonic()
+            if self._last_request_ts is None:
+                self._last_request_ts = now
+                return
+            min_interval = 1.0 / self.rate_limit_per_sec
+            elapsed = now - self._last_request_ts
+            if elapsed < min_interval:
+                time.sleep(max(0.0, min_interval - elapsed))
+            self._last_request_ts = time.monotonic()
 
     def _url(self, path: str) -> str:
         p = path if path.startswith("/") else f"/{path}"
@@ -114,6 +153,8 @@ Refer to https://api.seer.cancer.gov/usage to retrieve your SEER_API_KEY.""")
                 f"HTTP error ({path}): {resp.status_code} {resp.reason}; body: {snippet}"
             )
         try:
+            if orjson is not None:
+                return orjson.loads(resp.content)
             return resp.json()
         except ValueError as exc:
             snippet = resp.text[:500]
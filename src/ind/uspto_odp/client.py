@@ -35,6 +35,7 @@ from ..config import get_info
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
 from .._version import __version__
@@ -92,6 +93,8 @@ def _build_session(api_key: Optional[str]=None) -> requests.Session:
     s.headers.update({
         "Accept": "application/json",
         "User-Agent": f"uspto-odp-sdk/{__version__} (+https://github.com/marczepeda/ind)",
+        # search JSON and CSV downloads compress well; iter_content() decodes them
+        "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
     })
     api_key = api_key or os.getenv("USPTO_API_KEY") or get_info("USPTO_API_KEY")
     if api_key:
@@ -157,6 +160,7 @@ class USPTOClient:
             self.session = _build_session(self.api_key)
         # concurrency guard and download rate limiter
         self._lock = threading.Lock()
+        self._throttle_lock = threading.Lock()
         self._download_starts: Deque[float] = deque(maxlen=10_000)  # recent download starts
         self._per_file_counts: dict[str, int] = {}
 
@@ -168,21 +172,22 @@ class USPTOClient:
 
     def _throttle_downloads(self) -> None:
         """Enforce ≤5 download starts per 10 seconds (bulk download guidance)."""
-        now = time.time()
         window = 10.0
         limit = 5
         dq = self._download_starts
-        # drop old timestamps
-        while dq and now - dq[0] > window:
-            dq.popleft()
-        if len(dq) >= limit:
-            sleep_for = window - (now - dq[0]) + 0.01
-            time.sleep(max(0.0, sleep_for))
-            # cleanup again after sleep
+        with self._throttle_lock:  # threads share one window
             now = time.time()
+            # drop old timestamps
             while dq and now - dq[0] > window:
                 dq.popleft()
-        dq.append(time.time())
+            if len(dq) >= limit:
+                sleep_for = window - (now - dq[0]) + 0.01
+                time.sleep(max(0.0, sleep_for))
+                # cleanup again after sleep
+                now = time.time()
+                while dq and now - dq[0] > window:
+                    dq.popleft()
+            dq.append(time.time())
 
     # -------------
     # Low-level request
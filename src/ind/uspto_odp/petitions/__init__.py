@@ -9,7 +9,7 @@ Endpoints implemented:
 
 from .decisions import (
     # search
-    search_decisions, download_search_decisions,
+    search_decisions, download_search_decisions, download_search_decisions_paged,
     # single decision
     get_decision,
 )
@@ -18,7 +18,7 @@ __all__ = [
     # schema types
     "Filter", "RangeFilter", "SortOrder", "Sort", "Pagination",
     # search
-    "search_decisions", "download_search_decisions",
+    "search_decisions", "download_search_decisions", "download_search_decisions_paged",
     # single decision
     "get_decision",
 ]
\ No newline at end of file
@@ -8,6 +8,7 @@ Endpoints
 Search:
   • POST/GET /api/v1/petition/decisions/search
   • POST/GET /api/v1/petition/decisions/search/download
+    (download_search_decisions_paged: concurrent paged CSV export)
 
 Single Decision:
   • GET /api/v1/petition/decisions/{petitionDecisionRecordIdentifier}
@@ -31,9 +32,12 @@ Example
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, Optional, Sequence
 
-from ..client import USPTOClient, PayloadTooLargeError
+from ..client import USPTOClient, PayloadTooLargeError, RateLimitError, ServerError
 from ..types import (
     Filter, RangeFilter, Sort, Pagination,
     encode_get_params, search_auto_request_json, search_auto_download, maybe_pprint
@@ -72,6 +76,40 @@ def _build_request_dict(
         req["facets"] = list(facets)
     return req
 
+class _AdaptiveLimiter:
+    """
+    AIMD cap on in-flight calls: +1/limit per success, halved on overload.
+    Use as a context manager around each call.
+    """
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1) -> None:
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.limit = float(min(max(initial, minimum), self.maximum))
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> "_AdaptiveLimiter":
+        with self._cond:
+            while self._active >= int(self.limit):
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def success(self) -> None:
+        with self._cond:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def overload(self) -> None:
+        with self._cond:
+            self.limit = max(self.minimum, self.limit / 2)
+
 # =======================
 # Search endpoints
 # =======================
@@ -130,6 +168,97 @@ def download_search_decisions(
     maybe_pprint(body, troubleshoot, "Petition Decisions Download Body")
     return search_auto_download(client, path, body, method=method, dest_path=dest_path)
 
+def download_search_decisions_paged(
+    client: USPTOClient,
+    *,
+    q: Optional[str] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    range_filters: Optional[Sequence[RangeFilter]] = None,
+    sort: Optional[Sequence[Sort]] = None,
+    fields: Optional[Iterable[str]] = None,
+    page_size: int = 100,
+    total: Optional[int] = None,
+    max_workers: int = 8,
+    initial_workers: int = 4,
+    max_attempts: int = 4,
+    method: str = "auto",
+    dest_path: Optional[str] = None,
+    troubleshoot: bool = False,
+) -> bytes | str:
+    """
+    CSV export of every matching decision, fetched as `page_size` pages.
+
+    The match count is read from one search call (unless `total` is given);
+    the pages are then downloaded concurrently and joined in offset order,
+    keeping only the first page's CSV header.
+
+    The client's limits still apply and cap the real parallelism:
+    `USPTOClient._throttle_downloads` allows 5 download starts per 10 s and
+    sleeps *while holding* `_throttle_lock`, so beyond that budget the workers
+    queue behind one another; with `serialize=True` the requests themselves
+    are also sent one at a time. What overlaps is streaming the page bodies,
+    so expect throughput bounded by the throttle rather than `max_workers`.
+
+    Concurrency adapts: it starts at `initial_workers`, creeps up towards
+    `max_workers` while pages succeed, and halves on 429/5xx, after which the
+    page is retried with backoff (up to `max_attempts` tries).
+
+    Returns:
+      - bytes (if dest_path is None)
+      - dest_path (if provided)
+    """
+    if total is None:
+        head = search_decisions(
+            client, q=q, filters=filters, range_filters=range_filters,
+            pagination=Pagination(offset=0, limit=1), method=method, troubleshoot=troubleshoot,
+        )
+        total = int(head.get("count") or 0)
+
+    limiter = _AdaptiveLimiter(initial_workers, max_workers)
+
+    def fetch(offset: int) -> bytes:
+        delay = 1.0
+        for attempt in range(max(1, max_attempts)):
+            if attempt:
+                time.sleep(delay)
+                delay *= 2
+            with limiter:
+                try:
+                    page = download_search_decisions(
+                        client, q=q, filters=filters, range_filters=range_filters, sort=sort,
+                        fields=fields, pagination=Pagination(offset=offset, limit=page_size),
+                        format="csv", method=method, troubleshoot=troubleshoot,
+                    )
+                except (RateLimitError, ServerError) as exc:
+                    limiter.overload()
+                    error = exc
+                    continue
+            limiter.success()
+            return page
+        raise error
+
+    offsets = range(0, max(total, 1), page_size)
+
+    def chunks():
+        # pool.map yields pages in offset order as they complete; each one is
+        # handed on (and released) before the next, so only pages fetched
+        # ahead of the writer are held in memory
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            for i, page in enumerate(pool.map(fetch, offsets)):
+                if i:
+                    # drop the repeated header row
+                    page = page.partition(b"\n")[2]
+                if page:
+                    yield page if page.endswith(b"\n") else page + b"\n"
+
+    if dest_path:
+        # write each page as it arrives rather than building the whole export first
+        with open(dest_path, "wb") as f:
+            for chunk in chunks():
+                f.write(chunk)
+        return dest_path
+    return b"".join(chunks())
+
 # =======================
 # Single decision by identifier
 # =======================
@@ -26,6 +26,7 @@ Usage:
 [Supporting argument methods]
 - parse_tuple_int(arg): Parse a string argument into a tuple of integers
 - parse_tuple_float(arg): Parse a string argument into a tuple of floats
+- TimestampedName(suffix): Output file name default prefixed with the current time
 '''
 # Import packages
 import os
@@ -40,6 +41,9 @@ import subprocess
 import sys
 import tempfile
 import ast
+import datetime
+import functools
+import pickle
 
 # Computation
 process = psutil.Process(os.getpid())
@@ -145,6 +149,27 @@ def run_bundled_script(package: str="ind.scripts", relpath: str='autocomplete.sh
         return proc.returncode
     
 # Parsing Python literals
+# First characters (after leading whitespace) a string can start with and still be a Python literal:
+# numbers, containers, quotes (incl. b/r/u prefixes), True/False/None, set(), Ellipsis, and the
+# comment/line-continuation characters the tokenizer skips before an expression
+_LITERAL_START = frozenset('[{("\'0123456789-+.#\\TFNsbBrRuU')
+_LITERAL_NAMES = ('True', 'False', 'None', 'set')
+_QUOTES = frozenset('"\'')
+
+def _literal_candidate(value: str) -> bool:
+    """
+    _literal_candidate(): cheap screen for strings that could be Python literals; False only when literal_eval() would fail
+
+    Parameters:
+    value (str): string to screen
+    """
+    value = value.lstrip()  # literal_eval() parses past leading spaces, tabs and newlines
+    if not value or value[0] not in _LITERAL_START:
+        return False
+    if value[0].isalpha():  # Words like "Normal" or "Breast": only True/False/None, set() or a prefixed string
+        return value.startswith(_LITERAL_NAMES) or value[1:2] in _QUOTES or value[2:3] in _QUOTES
+    return True
+
 def try_parse(value):
     """
     try_parse(): try to parse a string as a Python literal; if not possible, return the original value
@@ -152,20 +177,37 @@ def try_parse(value):
     Parameters:
     value: value of any type (looking for strings)
 
-    Dependencies: ast,recusive_parse()
+    Dependencies: _literal_candidate(),_parse_literal()
     """
     if isinstance(value, str):  # Only attempt parsing for strings
-        try:
-            parsed_value = ast.literal_eval(value)
-            # If parsed_value is a dictionary, list, etc., recursively evaluate its contents
-            if isinstance(parsed_value, (dict, list, set, tuple)):
-                return recursive_parse(parsed_value)
-            return parsed_value
-        except (ValueError, SyntaxError):
+        if not _literal_candidate(value):  # Can't be a literal; skip literal_eval()
+            return value
+        parsed_value, pickled = _parse_literal(value)
+        if parsed_value is _NOT_LITERAL:
             # Return the value as-is if it can't be parsed
             return value
+        return pickle.loads(parsed_value) if pickled else parsed_value
     return value
 
+_NOT_LITERAL = object()
+
+@functools.lru_cache(maxsize=1 << 16)
+def _parse_literal(value: str) -> tuple:
+    """
+    _parse_literal(): cached literal_eval() + recursive_parse() of a string, so repeated values in a column are parsed once
+
+    Returns (_NOT_LITERAL, False) if value can't be parsed, (parsed value, False) for immutable scalars, or
+    (pickled parsed value, True) for containers so every caller unpickles its own copy of the cached result
+    """
+    try:
+        parsed_value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return _NOT_LITERAL, False
+    # If parsed_value is a dictionary, list, etc., recursively evaluate its contents
+    if isinstance(parsed_value, (dict, list, set, tuple)):
+        return pickle.dumps(recursive_parse(parsed_value), pickle.HIGHEST_PROTOCOL), True
+    return parsed_value, False
+
 def recursive_parse(data):
     """
     recursive_parse(): recursively parse nested structures
@@ -173,17 +215,40 @@ def recursive_parse(data):
     Parameters:
     data: data of any type (looking for dict, list, set, or tuple)
 
-    Dependencies: ast,try_parse()
+    Dependencies: ast,_literal_candidate()
     """
-    if isinstance(data, dict):
-        return {k: try_parse(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [try_parse(item) for item in data]
-    elif isinstance(data, set):
-        return {try_parse(item) for item in data}
-    elif isinstance(data, tuple):
-        return tuple(try_parse(item) for item in data)
-    return data  # Return the data as-is if it doesn't match any known structure
+    # Strings that parse to containers are queued on an explicit stack instead of recursing through try_parse();
+    # containers are parsed as mutable copies & sets/tuples are rebuilt afterwards, innermost first
+    root = [data]
+    stack = [(root, 0, data)]
+    rebuild = []
+    while stack:
+        parent, key, node = stack.pop()
+        if isinstance(node, dict):
+            node = dict(node)
+            keys = list(node)
+        elif isinstance(node, (list, set, tuple)):
+            if isinstance(node, set): rebuild.append((parent, key, set))
+            elif isinstance(node, tuple): rebuild.append((parent, key, tuple))
+            node = list(node)
+            keys = range(len(node))
+        else:
+            continue # Return the data as-is if it doesn't match any known structure
+        parent[key] = node
+        for k in keys:
+            value = node[k]
+            if isinstance(value, str) and _literal_candidate(value):
+                try:
+                    parsed_value = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    continue
+                if isinstance(parsed_value, (dict, list, set, tuple)):
+                    stack.append((node, k, parsed_value))
+                else:
+                    node[k] = parsed_value
+    for parent, key, kind in reversed(rebuild):
+        parent[key] = kind(parent[key])
+    return root[0]
 
 # Make directories
 def mkdir(dir: str, sep: str='/'):
@@ -192,16 +257,14 @@ def mkdir(dir: str, sep: str='/'):
 
     Parameters:
     dir (str): directory path
-    sep (str): seperator directory path
+    sep (str): seperator directory path (unused; kept for compatibility)
 
     Dependencies: os
     '''
-    dirs = str(dir).split(sep)
-    for i in range(len(dirs)):
-        check_dir = sep.join(dirs[:i+1])
-        if (os.path.exists(check_dir)==False)&(i!=0):
-            os.mkdir(check_dir)
-            print(f'Created {check_dir}')
+    dir = str(dir)
+    if dir and not os.path.isdir(dir): # One stat when the directory already exists
+        os.makedirs(dir, exist_ok=True)
+        print(f'Created {dir}')
 
 
 # Supporting argument methods
@@ -221,4 +284,31 @@ def parse_tuple_float(arg):
     try:
         return tuple(map(float, arg.split(',')))
     except:
-        raise argparse.ArgumentTypeError(f"{arg} must be formatted as 'float,float,...'")
\ No newline at end of file
+        raise argparse.ArgumentTypeError(f"{arg} must be formatted as 'float,float,...'")
+
+class TimestampedName(str):
+    '''
+    TimestampedName(suffix): Output file name default prefixed with the current time (YYYYmmdd_HHMMSS{suffix})
+
+    Argument parsers are cached, so a plain f-string default would keep the time the parser was built; main() calls restamp() after each parse.
+
+    Parameters:
+    suffix (str): text after the timestamp (e.g., '_descriptive.csv')
+    '''
+    def __new__(cls, suffix: str):
+        name = super().__new__(cls, cls._stamp(suffix))
+        name.suffix = suffix
+        return name
+
+    def __str__(self) -> str:
+        return self  # argparse runs string defaults through type=str; keep the marker so main() can re-stamp it
+
+    @staticmethod
+    def _stamp(suffix: str) -> str:
+        return f'{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}{suffix}'
+
+    def restamp(self) -> str:
+        '''
+        restamp(): Return the file name with the current time
+        '''
+        return self._stamp(self.suffix)
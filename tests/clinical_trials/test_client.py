@@ -0,0 +1,75 @@
+import pytest
+import responses
+
+from ind.clinical_trials import ClinicalTrialsClient, get_enums, get_study_raw
+
+ENUMS_URL = "https://clinicaltrials.gov/api/v2/studies/enums"
+
+@pytest.fixture
+def rsps():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+def test_cached_document_skips_network_within_ttl(rsps, tmp_path):
+    rsps.add(responses.GET, ENUMS_URL, json=[{"type": "Phase"}], status=200)
+    client = ClinicalTrialsClient(cache_dir=str(tmp_path))
+    assert get_enums(client) == [{"type": "Phase"}]
+    assert get_enums(client) == [{"type": "Phase"}]
+    assert len(rsps.calls) == 1
+
+def test_stale_document_revalidated_with_etag(rsps, tmp_path):
+    rsps.add(responses.GET, ENUMS_URL, json=[{"type": "Phase"}], status=200, headers={"ETag": '"v1"'})
+    client = ClinicalTrialsClient(cache_dir=str(tmp_path), cache_ttl=0)
+    get_enums(client)
+
+    rsps.replace(responses.GET, ENUMS_URL, status=304)
+    assert get_enums(client) == [{"type": "Phase"}]
+    assert rsps.calls[-1].request.headers.get("If-None-Match") == '"v1"'
+
+def test_cache_disabled(rsps):
+    rsps.add(responses.GET, ENUMS_URL, json=[], status=200)
+    client = ClinicalTrialsClient(cache_dir=None)
+    get_enums(client)
+    get_enums(client)
+    assert len(rsps.calls) == 2
+
+def test_get_study_raw_returns_body_bytes(rsps):
+    body = b'{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}'
+    rsps.add(responses.GET, "https://clinicaltrials.gov/api/v2/studies/NCT00000001", body=body, status=200)
+    client = ClinicalTrialsClient(cache_dir=None)
+    assert get_study_raw(client, "NCT00000001") == body
+    assert "markupFormat=markdown" in rsps.calls[0].request.url
+
+def test_session_advertises_compression(rsps):
+    rsps.add(responses.GET, ENUMS_URL, json=[], status=200)
+    client = ClinicalTrialsClient(cache_dir=None)
+    get_enums(client)
+    assert "gzip" in rsps.calls[0].request.headers["Accept-Encoding"]
+
+def _cache_files(tmp_path):
+    return sorted(p.name for p in tmp_path.iterdir())
+
+def test_damaged_cache_metadata_is_refetched(rsps, tmp_path):
+    rsps.add(responses.GET, ENUMS_URL, json=[{"type": "Phase"}], status=200)
+    client = ClinicalTrialsClient(cache_dir=str(tmp_path))
+    get_enums(client)
+    (meta_file,) = tmp_path.glob("*.meta.json")
+    meta_file.write_text("")  # interrupted write
+
+    assert get_enums(client) == [{"type": "Phase"}]
+    assert len(rsps.calls) == 2
+    assert get_enums(client) == [{"type": "Phase"}]  # entry rewritten and fresh again
+    assert len(rsps.calls) == 2
+
+def test_truncated_cache_body_is_refetched(rsps, tmp_path):
+    rsps.add(responses.GET, ENUMS_URL, json=[{"type": "Phase"}], status=200, headers={"ETag": '"v1"'})
+    client = ClinicalTrialsClient(cache_dir=str(tmp_path))
+    get_enums(client)
+    (body_file,) = (p for p in tmp_path.glob("*.json") if not p.name.endswith(".meta.json"))
+    body_file.write_bytes(b'[{"type": "Ph')
+
+    assert get_enums(client) == [{"type": "Phase"}]
+    assert len(rsps.calls) == 2
+    assert "If-None-Match" not in rsps.calls[-1].request.headers  # no 304 onto the broken body
+    assert body_file.read_bytes() == b'[{"type": "Phase"}]'
+    assert not [name for name in _cache_files(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,45 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+import ind.clinical_trials as ct
+
+EXAMPLE = Path(__file__).resolve().parents[2] / "examples" / "clinical_trials" / "clinical_trials.py"
+
+@pytest.fixture
+def cli():
+    spec = importlib.util.spec_from_file_location("clinical_trials_example", EXAMPLE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_raw_json_stdout_is_only_json(cli, monkeypatch, capsys):
+    monkeypatch.setattr(ct, "get_enums", lambda client: [{"type": "Phase", "pieces": ["Phase"]}])
+    cli.main(["--raw-json", "enums"])
+    out, err = capsys.readouterr()
+    assert json.loads(out) == [{"type": "Phase", "pieces": ["Phase"]}]
+    assert "Enums" in err  # the header still shows, on stderr
+
+def test_piped_stdout_is_only_json(cli, monkeypatch, capsys):
+    monkeypatch.setattr(ct, "get_field_values", lambda client, **kw: [{"field": "Phase"}, {"field": "OverallStatus"}])
+    cli.main(["field-values", "--limit", "1"])
+    out, err = capsys.readouterr()
+    assert json.loads(out) == [{"field": "Phase"}]
+    assert "Field Values" in err
+
+def test_raw_study_and_sizes_write_only_server_bytes(cli, monkeypatch, capsys):
+    body = b'{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}'
+    monkeypatch.setattr(ct, "get_study_raw", lambda client, nct_id, **kw: body)
+    monkeypatch.setattr(ct, "get_study_sizes_raw", lambda client: b'{"totalStudies": 1}')
+
+    cli.main(["study", "--nct-id", "NCT00000001"])
+    out, err = capsys.readouterr()
+    assert out == body.decode() + "\n"
+    assert "Study: NCT00000001" in err
+
+    cli.main(["size"])
+    out, err = capsys.readouterr()
+    assert json.loads(out) == {"totalStudies": 1}
+    assert "Study JSON Sizes" in err
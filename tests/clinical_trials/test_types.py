@@ -0,0 +1,16 @@
+from ind.clinical_trials import StudySummary, summarize_studies
+
+def test_study_summary_from_nested_and_flat_records():
+    nested = {
+        "protocolSection": {
+            "identificationModule": {"nctId": "NCT00000001", "briefTitle": "A study"},
+            "statusModule": {"overallStatus": "RECRUITING"},
+        }
+    }
+    flat = {"briefTitle": "Flat title"}
+    a, b = summarize_studies([nested, flat])
+    assert a == StudySummary("NCT00000001", "A study", "RECRUITING")
+    assert b.nct_id is None and b.brief_title == "Flat title" and b.overall_status is None
+
+def test_study_summary_tolerates_non_dict_modules():
+    assert StudySummary.from_json({"protocolSection": {"identificationModule": None}}) == StudySummary()
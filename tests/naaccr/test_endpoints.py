@@ -1,5 +1,11 @@
+import json
 import os
+import random
+import time
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
+import responses
 
 from ind.naaccr import (
     NAACCRClient,
@@ -10,7 +16,10 @@ from ind.naaccr import (
     get_operation_history,
 )
 
+from ind.naaccr.endpoints import _page_urls
+
 LIVE = os.getenv("NAACCR_LIVE", "0") == "1"
+BASE = "https://apps.naaccr.org/data-dictionary/api/1.0"
 
 
 @pytest.mark.skipif(not LIVE, reason="Set NAACCR_LIVE=1 to run live NAACCR API tests")
@@ -48,4 +57,64 @@ def test_histories_live():
     assert isinstance(attr_hist, dict)
 
     op_hist = get_operation_history(client, "22", str(xml_or_number))
-    assert isinstance(op_hist, dict)
\ No newline at end of file
+    assert isinstance(op_hist, dict)
+
+@pytest.mark.skipif(not LIVE, reason="Set NAACCR_LIVE=1 to run live NAACCR API tests")
+def test_search_concurrent_matches_sequential_live():
+    client = NAACCRClient()
+    seq = search_data_items(client, "22", q="tumor", minimize_results=True, pages=3)
+    par = search_data_items(client, "22", q="tumor", minimize_results=True, pages=3, concurrency=3)
+    assert par == seq
+
+
+# ---- Offline tests ----
+
+@pytest.fixture
+def rsps():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+def _paged_search(rsps, total_pages, per_page=2, starts=None):
+    """Mock /data_item/22/ as a paginated API; page N holds items "N-0", "N-1", ..."""
+    def callback(request):
+        if starts is not None:
+            starts.append(time.monotonic())
+        page = int(parse_qs(urlsplit(request.url).query).get("page", ["1"])[0])
+        time.sleep(random.uniform(0, 0.01))  # let concurrent pages finish out of order
+        nxt = None
+        if page < total_pages:
+            nxt = f"{BASE}/data_item/22/?format=json&page={page + 1}&q=tumor%20size"
+        body = {
+            "count": total_pages * per_page,
+            "next": nxt,
+            "previous": None,
+            "results": [{"id": f"{page}-{i}"} for i in range(per_page)],
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+    rsps.add_callback(responses.GET, f"{BASE}/data_item/22/", callback=callback)
+
+def test_page_urls_only_swaps_page_in_server_next_link():
+    nxt = f"{BASE}/data_item/22/?format=json&minimize_results=%22true%22&page=2&q=tumor%20size"
+    urls = _page_urls(nxt, 2, 3)
+    assert urls[0] == nxt
+    assert urls[1] == nxt.replace("page=2", "page=3")
+    assert urls[2] == nxt.replace("page=2", "page=4")
+    assert _page_urls(f"{BASE}/data_item/22/?format=json&offset=50", 2, 1) is None
+
+def test_search_concurrent_keeps_page_order(rsps):
+    _paged_search(rsps, total_pages=5)
+    client = NAACCRClient()
+    items = search_data_items(client, "22", q="tumor size", pages=5, delay=0, concurrency=4)
+    assert [it["id"] for it in items] == [f"{p}-{i}" for p in range(1, 6) for i in range(2)]
+
+    seq = search_data_items(client, "22", q="tumor size", pages=5, delay=0)
+    assert items == seq
+
+def test_search_concurrent_spaces_every_request_by_delay(rsps):
+    starts = []
+    _paged_search(rsps, total_pages=3, starts=starts)
+    search_data_items(NAACCRClient(), "22", q="tumor", pages=3, delay=0.05, concurrency=3)
+    assert len(starts) == 3
+    # includes page 1 -> page 2, which previously went out immediately
+    assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
@@ -20,6 +20,7 @@ class FakeHandle(io.StringIO):
 class FakeEntrez:
     def __init__(self):
         self.calls = []
+        self.posted = {}
 
     # esearch returns XML parsed by Entrez.read; but our client returns the handle
     # and endpoints.parse_xml() calls Entrez.read(handle). We'll bypass by returning JSON-ish
@@ -34,9 +35,18 @@ class FakeEntrez:
         payload = {"IdList": ids, "RetStart": str(retstart), "RetMax": str(retmax), "Count": str(total)}
         return FakeHandle(json.dumps(payload))
 
+    def epost(self, **kwargs):
+        self.calls.append(("epost", kwargs))
+        key = str(len(self.posted) + 1)
+        self.posted[key] = kwargs["id"].split(",")
+        return FakeHandle(json.dumps({"WebEnv": "ENV", "QueryKey": key}))
+
     def efetch(self, **kwargs):
         self.calls.append(("efetch", kwargs))
         ids = (kwargs.get("id") or "").split(",")
+        if kwargs.get("query_key"):
+            start = int(kwargs.get("retstart") or 0)
+            ids = self.posted[kwargs["query_key"]][start:start + int(kwargs["retmax"])]
         rettype = kwargs.get("rettype")
         retmode = kwargs.get("retmode")
         if rettype == "abstract" and retmode == "text":
@@ -74,7 +84,7 @@ def fake_entrez(monkeypatch):
     # Redirect Entrez.* used by client.call(...)
     # We'll monkeypatch at the module attribute level used by endpoints.
     monkeypatch.setattr(ep, "Entrez", types.SimpleNamespace(
-        esearch=fe.esearch, efetch=fe.efetch, elink=fe.elink, einfo=None, esummary=None, egquery=None, espell=None, epost=None
+        esearch=fe.esearch, efetch=fe.efetch, elink=fe.elink, einfo=None, esummary=None, egquery=None, espell=None, epost=fe.epost
     ))
 
     # parse_xml should parse JSON string emitted by our FakeHandle
@@ -99,4 +109,20 @@ def test_linked_and_fasta(fake_entrez):
 
     fasta = wf.download_fasta_for_gene_ids(client, ["101"])
     assert "seq|101001" in fasta["101"]
-    assert "ATGC" in fasta["101"]
\ No newline at end of file
+    assert "ATGC" in fasta["101"]
+
+def test_fasta_concurrent_keeps_gene_order(fake_entrez):
+    client = EntrezClient(NCBIConfig(email="you@org.tld", base_delay=0.0))
+    fasta = wf.download_fasta_for_gene_ids(client, ["101", "202", "303"], max_workers=3)
+    assert list(fasta) == ["101", "202", "303"]
+    assert fasta["202"].startswith(">seq|202001")
+    assert "seq|303002" in fasta["303"]
+
+def test_fasta_by_history_pages_large_sets(fake_entrez):
+    client = EntrezClient(NCBIConfig(email="you@org.tld", base_delay=0.0))
+    ids = [str(i) for i in range(1, 1201)]
+    fasta = wf.fetch_fasta_by_history(client, ids)
+    efetches = [kw for name, kw in fake_entrez.calls if name == "efetch"]
+    assert [name for name, _ in fake_entrez.calls].count("epost") == 1
+    assert [kw["retstart"] for kw in efetches] == [0, 500, 1000]
+    assert fasta.count(">seq|") == 1200
@@ -1,6 +1,8 @@
 import os
 import pytest
+import requests
 
+from ind.openfda import client as client_mod
 from ind.openfda.client import OpenFDAClient
 from ind.openfda import drug
 
@@ -12,4 +14,19 @@ def test_events_search_smoke():
     res = drug.search_events(c, search="patient.reaction.reactionmeddrapt:HEADACHE", limit=3)
     assert res.meta.results is not None
     assert res.results is not None
-    assert len(res.results) <= 3
\ No newline at end of file
+    assert len(res.results) <= 3
+
+def test_close_leaves_shared_session_open(monkeypatch):
+    closed = []
+    monkeypatch.setattr(client_mod._SHARED_SESSION, "close", lambda: closed.append("shared"))
+    with OpenFDAClient() as c, OpenFDAClient() as other:
+        assert c.session is other.session is client_mod._SHARED_SESSION
+    assert closed == []
+
+def test_close_closes_caller_session():
+    session = requests.Session()
+    closed = []
+    session.close = lambda: closed.append("own")
+    with OpenFDAClient(session=session):
+        pass
+    assert closed == ["own"]
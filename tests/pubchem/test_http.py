@@ -4,7 +4,7 @@ import pathlib
 
 import responses
 from ind.pubchem.client import PubChemClient
-from ind.pubchem.http import pug_fetch, PugRestError
+from ind.pubchem.http import pug_fetch, PugRestError, json_fast
 
 def test_accept_header_inferred_from_output(rsps, client: PubChemClient):
     url_prefix = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/2244/JSON"
@@ -41,17 +41,21 @@ def test_file_output_text_and_binary(rsps, client: PubChemClient, tmp_path):
     url_json = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/2244/JSON"
     rsps.add(responses.GET, url_json, json={"hello": "world"}, status=200)
     out_json = tmp_path / "out.json"
-    pug_fetch(client, input_specification="compound/cid/2244", output_specification="JSON",
-              output_file=str(out_json), quiet=True)
+    resp = pug_fetch(client, input_specification="compound/cid/2244", output_specification="JSON",
+                     output_file=str(out_json), quiet=True)
     assert out_json.read_text().strip().startswith("{")
+    # body went to disk, but the response can still be read
+    assert resp.json() == {"hello": "world"}
+    assert resp.content == out_json.read_bytes()
 
     # Binary case (PNG)
     url_png = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/2244/PNG"
     rsps.add(responses.GET, url_png, body=b"\x89PNG\r\n", status=200, content_type="image/png")
     out_png = tmp_path / "img.png"
-    pug_fetch(client, input_specification="compound/cid/2244", output_specification="PNG",
-              output_file=str(out_png), quiet=True)
+    resp = pug_fetch(client, input_specification="compound/cid/2244", output_specification="PNG",
+                     output_file=str(out_png), quiet=True)
     assert out_png.read_bytes().startswith(b"\x89PNG")
+    assert resp.content == b"\x89PNG\r\n"
 
 def test_error_raises_pugresterror(rsps, client: PubChemClient):
     bad = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/0/JSON"
@@ -59,4 +63,23 @@ def test_error_raises_pugresterror(rsps, client: PubChemClient):
     with pytest.raises(PugRestError) as ei:
         pug_fetch(client, input_specification="compound/cid/0", output_specification="JSON")
     msg = str(ei.value)
-    assert "404" in msg and "Not found" in msg
\ No newline at end of file
+    assert "404" in msg and "Not found" in msg
+
+def test_get_responses_cached_per_client(rsps, client: PubChemClient):
+    url = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/2244/JSON"
+    rsps.add(responses.GET, url, json={"ok": True}, status=200)
+    first = pug_fetch(client, input_specification="compound/cid/2244", output_specification="JSON")
+    second = pug_fetch(client, input_specification="compound/cid/2244", output_specification="JSON")
+    assert second.json() == first.json()
+    assert len(rsps.calls) == 1
+
+    uncached = PubChemClient(max_rps=9999.0, max_retries=0, cache_ttl=0)
+    pug_fetch(uncached, input_specification="compound/cid/2244", output_specification="JSON")
+    assert len(rsps.calls) == 2
+
+def test_json_fast_parses_once(rsps, client: PubChemClient):
+    url = "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/2244/JSON"
+    rsps.add(responses.GET, url, json={"ok": True}, status=200)
+    resp = pug_fetch(client, input_specification="compound/cid/2244", output_specification="JSON")
+    assert json_fast(resp) == {"ok": True}
+    assert json_fast(resp) is json_fast(resp)
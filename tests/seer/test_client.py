@@ -0,0 +1,23 @@
+import pytest
+import responses
+
+from ind.seer.client import SeerClient, SeerError
+
+BASE = "https://api.seer.cancer.gov"
+
+@pytest.fixture
+def rsps():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+def test_request_json_decodes_body(rsps):
+    rsps.add(responses.GET, f"{BASE}/rest/disease/versions", json=[{"version": "latest"}, {"version": "2024"}])
+    client = SeerClient(api_key="k")
+    assert client.request_json("GET", "/rest/disease/versions") == [{"version": "latest"}, {"version": "2024"}]
+    assert rsps.calls[0].request.headers["X-SEERAPI-Key"] == "k"
+
+def test_request_json_invalid_body_raises(rsps):
+    rsps.add(responses.GET, f"{BASE}/rest/disease/versions", body="<html>", status=200)
+    client = SeerClient(api_key="k")
+    with pytest.raises(SeerError, match="Invalid JSON"):
+        client.request_json("GET", "/rest/disease/versions")
@@ -0,0 +1,32 @@
+import datetime
+import sys
+import types
+
+from ind import main as main_mod
+from ind import utils
+
+class _Clock:
+    """Stand-in for the datetime module whose now() advances a second per call"""
+    def __init__(self):
+        self.t = datetime.datetime(2026, 1, 1)
+        self.datetime = self
+
+    def now(self):
+        self.t += datetime.timedelta(seconds=1)
+        return self.t
+
+def test_repeated_main_calls_get_fresh_timestamped_file_names(monkeypatch):
+    monkeypatch.setenv("IND_NO_FIRST_RUN", "1")
+    calls = []
+    monkeypatch.setitem(sys.modules, "ind.gen.stat", types.SimpleNamespace(describe=lambda **kw: calls.append(kw)))
+    monkeypatch.setattr(utils, "datetime", _Clock())
+
+    main_mod.main(["stat", "describe", "--df", "in.csv"])
+    main_mod.main(["stat", "describe", "--df", "in.csv"])
+    main_mod.main(["stat", "describe", "--df", "in.csv", "--file", "mine.csv"])
+
+    first, second, explicit = (kw["file"] for kw in calls)
+    assert first.endswith("_descriptive.csv") and second.endswith("_descriptive.csv")
+    assert first != second
+    assert type(first) is str
+    assert explicit == "mine.csv"
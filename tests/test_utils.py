@@ -0,0 +1,57 @@
+import ast
+import string
+
+import pandas as pd
+import pytest
+
+from ind.gen.io import df_try_parse
+from ind.utils import _literal_candidate, try_parse
+
+@pytest.mark.parametrize("value, expected", [
+    ("set()", set()),
+    ("set ()", set()),
+    ("\n1", 1),
+    ("\r1", 1),
+    ("\f1", 1),
+    (" \t[1, 2]", [1, 2]),
+    ("#note\n{'a': 1}", {"a": 1}),
+    ("\\\n1", 1),
+])
+def test_try_parse_matches_literal_eval(value, expected):
+    assert try_parse(value) == expected
+
+def test_df_try_parse_keeps_empty_sets():
+    df = pd.DataFrame({"tags": [str({"a"}), str(set()), "Normal"]})
+    assert df_try_parse(df)["tags"].tolist() == [{"a"}, set(), "Normal"]
+
+def test_word_like_strings_are_screened_out():
+    for value in ["Normal", "Breast", "setup", "", "   "]:
+        assert try_parse(value) == value
+    assert not _literal_candidate("Normal")
+
+# One literal per character _LITERAL_START admits
+_LITERALS_BY_START = {
+    "[": "[1]", "{": "{1}", "(": "(1,)", '"': '"x"', "'": "'x'",
+    **{d: d for d in "0123456789"},
+    "-": "-1", "+": "+1", ".": ".5", "#": "#c\n1", "\\": "\\\n1",
+    "T": "True", "F": "False", "N": "None", "s": "set()",
+    "b": "b'x'", "B": "B'x'", "r": "r'x'", "R": "R'x'", "u": "u'x'", "U": "U'x'",
+}
+
+@pytest.mark.parametrize("start, literal", sorted(_LITERALS_BY_START.items()))
+def test_literal_candidate_accepts_each_start(start, literal):
+    assert literal[0] == start
+    ast.literal_eval(literal)
+    assert _literal_candidate(literal)
+    assert _literal_candidate(" \n" + literal)
+
+def test_literal_candidate_has_no_false_negatives():
+    tails = ["", "1", "[1]", "'x'", "()", "\n1", "rue", "alse", "one", "et()", "b'x'"]
+    for first in string.printable:
+        for tail in tails:
+            value = first + tail
+            try:
+                ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                continue
+            assert _literal_candidate(value), repr(value)
@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+import types
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+import responses
+
+from ind.uspto_odp import client as client_mod
+from ind.uspto_odp.client import USPTOClient, RateLimitError, ServerError
+from ind.uspto_odp.petitions import decisions
+from ind.uspto_odp.petitions.decisions import _AdaptiveLimiter, download_search_decisions_paged
+
+BASE = "https://api.uspto.gov"
+DOWNLOAD = f"{BASE}/api/v1/petition/decisions/search/download"
+HEADER = b"id,name\n"
+
+@pytest.fixture
+def rsps():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+@pytest.fixture
+def client(monkeypatch):
+    # Plain session: no API key lookup and no urllib3 retries under the paged helper's own
+    c = USPTOClient(session=requests.Session())
+    monkeypatch.setattr(c, "_throttle_downloads", lambda: None)
+    # No real waits for the backoff in fetch() or the client's 429 retry
+    no_sleep = types.SimpleNamespace(sleep=lambda s: None, time=time.time, monotonic=time.monotonic)
+    monkeypatch.setattr(decisions, "time", no_sleep)
+    monkeypatch.setattr(client_mod, "time", no_sleep)
+    return c
+
+def _offset(request) -> int:
+    return int(parse_qs(urlsplit(request.url).query)["offset"][0])
+
+def _page(offset: int, page_size: int) -> bytes:
+    rows = b"".join(b"%d,row%d\n" % (i, i) for i in range(offset, offset + page_size))
+    return HEADER + rows
+
+def test_paged_download_keeps_offset_order_and_one_header(rsps, client):
+    real_sleep = time.sleep
+
+    def callback(request):
+        offset = _offset(request)
+        real_sleep(random.uniform(0, 0.02))  # let pages finish out of order
+        return 200, {}, _page(offset, 5)
+
+    rsps.add_callback(responses.GET, DOWNLOAD, callback=callback)
+    data = download_search_decisions_paged(client, q="x", total=40, page_size=5, max_workers=4, method="GET")
+
+    lines = data.splitlines()
+    assert lines[0] == HEADER.strip()
+    assert lines.count(HEADER.strip()) == 1
+    assert [int(line.split(b",")[0]) for line in lines[1:]] == list(range(40))
+
+def test_paged_download_writes_dest_path(rsps, client, tmp_path):
+    rsps.add_callback(responses.GET, DOWNLOAD, callback=lambda r: (200, {}, _page(_offset(r), 3).rstrip(b"\n")))
+    dest = tmp_path / "decisions.csv"
+    out = download_search_decisions_paged(client, q="x", total=9, page_size=3, method="GET", dest_path=str(dest))
+
+    assert out == str(dest)
+    assert dest.read_bytes() == HEADER + b"".join(b"%d,row%d\n" % (i, i) for i in range(9))
+
+def test_paged_download_retries_after_429(rsps, client, monkeypatch):
+    calls = {"n": 0}
+    limiters = []
+
+    class RecordingLimiter(_AdaptiveLimiter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.events = []
+            limiters.append(self)
+
+        def success(self):
+            self.events.append(("success", self.limit))
+            super().success()
+
+        def overload(self):
+            self.events.append(("overload", self.limit))
+            super().overload()
+
+    monkeypatch.setattr(decisions, "_AdaptiveLimiter", RecordingLimiter)
+
+    def callback(request):
+        calls["n"] += 1
+        if calls["n"] <= 2:  # client retries a 429 once itself; two in a row reach the paged helper
+            return 429, {}, b'{"message": "Too Many Requests"}'
+        return 200, {}, _page(_offset(request), 2)
+
+    rsps.add_callback(responses.GET, DOWNLOAD, callback=callback)
+    data = download_search_decisions_paged(client, q="x", total=2, page_size=2, initial_workers=4, method="GET")
+
+    assert data == _page(0, 2)
+    assert calls["n"] == 3
+    # the 429 halved the cap (4 -> 2); the retried page's success then raised it again
+    (limiter,) = limiters
+    assert limiter.events == [("overload", 4.0), ("success", 2.0)]
+    assert limiter.limit == 2.5
+
+def test_paged_download_reraises_when_attempts_run_out(rsps, client):
+    rsps.add(responses.GET, DOWNLOAD, body=b'{"message": "down"}', status=503)
+    with pytest.raises(ServerError):
+        download_search_decisions_paged(client, q="x", total=1, page_size=1, max_attempts=3, method="GET")
+    assert len(rsps.calls) == 3
+
+    rsps.replace(responses.GET, DOWNLOAD, body=b'{"message": "slow down"}', status=429)
+    with pytest.raises(RateLimitError):
+        download_search_decisions_paged(client, q="x", total=1, page_size=1, max_attempts=2, method="GET")
+
+def test_adaptive_limiter_halves_on_overload_and_grows_on_success():
+    limiter = _AdaptiveLimiter(initial=8, maximum=8)
+    limiter.overload()
+    assert limiter.limit == 4
+    limiter.overload()
+    limiter.overload()
+    limiter.overload()
+    assert limiter.limit == 1  # never below the minimum
+
+    limiter.success()
+    assert limiter.limit == 2
+    for _ in range(100):
+        limiter.success()
+    assert limiter.limit == 8  # capped at the maximum
+
+def test_adaptive_limiter_caps_in_flight_calls():
+    limiter = _AdaptiveLimiter(initial=1, maximum=4)
+    entered = threading.Event()
+
+    def worker():
+        with limiter:
+            entered.set()
+
+    with limiter:
+        t = threading.Thread(target=worker)
+        t.start()
+        assert not entered.wait(0.05)  # second call waits while the limit is 1
+    assert entered.wait(1)
+    t.join()